@@ -33,6 +33,6 @@ draw.ellipse([100, 100, 300, 300], outline='darkblue', width=3)
 
 # Save the image
 output_path = os.path.join(os.path.dirname(__file__), 'fixtures', 'test-image.jpg')
-image.save(output_path, 'JPEG', quality=95)
+image.save(output_path, 'JPEG', quality=85, optimize=True, progressive=True)
 
 print(f"Test image created at: {output_path}")
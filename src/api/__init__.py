@@ -1,6 +1,14 @@
 """
 OpenUser API package.
 """
-from src.api.main import app
 
 __all__ = ["app"]
+
+
+def __getattr__(name: str):
+    """Import the application lazily so importing a submodule stays cheap."""
+    if name == "app":
+        from src.api.main import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,6 +11,9 @@ from src.api.schemas import (
     AgentUpdateRequest,
     AgentResponse,
     AgentListResponse,
+    AgentBatchCreateRequest,
+    AgentBatchDeleteRequest,
+    AgentBatchDeleteResponse,
     ErrorResponse
 )
 
@@ -77,6 +80,91 @@ async def create_agent(
         )
 
 
+@router.post(
+    "/batch",
+    response_model=AgentListResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+        400: {"model": ErrorResponse, "description": "Bad Request"}
+    }
+)
+async def create_agents_batch(
+    request: AgentBatchCreateRequest,
+    current_user: dict = Depends(get_current_user),
+    agent_manager: AgentManager = Depends(get_agent_manager)
+):
+    """
+    Create several AI agents in one request.
+
+    Args:
+        request: Batch of agent creation requests
+        current_user: Current authenticated user
+        agent_manager: AgentManager instance
+
+    Returns:
+        Created agents
+    """
+    try:
+        agents = agent_manager.create_agents_bulk(
+            [item.model_dump() for item in request.agents]
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create agents: {str(e)}"
+        )
+
+    return AgentListResponse(
+        agents=[
+            AgentResponse(
+                name=agent.name,
+                system_prompt=agent.system_prompt,
+                capabilities=agent.capabilities
+            )
+            for agent in agents
+        ],
+        total=len(agents)
+    )
+
+
+@router.post(
+    "/batch/delete",
+    response_model=AgentBatchDeleteResponse,
+    responses={
+        401: {"model": ErrorResponse, "description": "Unauthorized"}
+    }
+)
+async def delete_agents_batch(
+    request: AgentBatchDeleteRequest,
+    current_user: dict = Depends(get_current_user),
+    agent_manager: AgentManager = Depends(get_agent_manager)
+):
+    """
+    Delete several agents in one request.
+
+    Args:
+        request: Names of agents to delete
+        current_user: Current authenticated user
+        agent_manager: AgentManager instance
+
+    Returns:
+        Deleted names and names that were not found
+    """
+    deleted = agent_manager.delete_agents_bulk(request.names)
+    deleted_set = set(deleted)
+
+    return AgentBatchDeleteResponse(
+        deleted=deleted,
+        not_found=[name for name in request.names if name not in deleted_set]
+    )
+
+
 @router.get(
     "/list",
     response_model=AgentListResponse,
@@ -99,16 +187,14 @@ async def list_agents(
         List of all agents
     """
     try:
-        agent_names = agent_manager.list_agents()
-        agents = []
-        for name in agent_names:
-            agent = agent_manager.get_agent(name)
-            if agent:
-                agents.append(AgentResponse(
-                    name=agent.name,
-                    system_prompt=agent.system_prompt,
-                    capabilities=agent.capabilities
-                ))
+        agents = [
+            AgentResponse(
+                name=agent.name,
+                system_prompt=agent.system_prompt,
+                capabilities=agent.capabilities
+            )
+            for agent in agent_manager.list_agents_full()
+        ]
 
         return AgentListResponse(
             agents=agents,
@@ -1,11 +1,13 @@
 """
 Authentication API endpoints for user registration, login, and token management.
 """
+import asyncio
 from datetime import timedelta
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.api.auth_utils import (
@@ -44,7 +46,7 @@ def set_db_manager(db_manager: DatabaseManager):
     _db_manager = db_manager
 
 
-def get_db():
+async def get_db():
     """Get database session."""
     if _db_manager is None:
         raise RuntimeError("Database manager not configured")
@@ -52,7 +54,7 @@ def get_db():
     try:
         yield session
     finally:
-        session.close()
+        await asyncio.to_thread(session.close)
 
 
 async def get_current_user(
@@ -86,7 +88,9 @@ async def get_current_user(
     if username is None:
         raise credentials_exception
 
-    user = db.query(User).filter(User.username == username).first()
+    user = await asyncio.to_thread(
+        db.query(User).filter(User.username == username).first
+    )
     if user is None:
         raise credentials_exception
 
@@ -117,24 +121,25 @@ async def register(
     Raises:
         HTTPException: If username or email already exists
     """
-    # Check if username already exists
-    existing_user = db.query(User).filter(User.username == request.username).first()
-    if existing_user:
+    # Check if username or email already exists in a single query
+    existing = await asyncio.to_thread(
+        db.query(User.username, User.email).filter(
+            (User.username == request.username) | (User.email == request.email)
+        ).all
+    )
+    if any(row.username == request.username for row in existing):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered"
         )
-
-    # Check if email already exists
-    existing_email = db.query(User).filter(User.email == request.email).first()
-    if existing_email:
+    if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
 
     # Create new user
-    hashed_password = get_password_hash(request.password)
+    hashed_password = await asyncio.to_thread(get_password_hash, request.password)
     new_user = User(
         username=request.username,
         email=request.email,
@@ -144,26 +149,37 @@ async def register(
     )
 
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    try:
+        # The flush's INSERT populates the primary key and column defaults,
+        # so the response is built without a follow-up refresh SELECT
+        await asyncio.to_thread(db.flush)
+        user_response = UserResponse(
+            id=new_user.id,
+            username=new_user.username,
+            email=new_user.email,
+            is_active=new_user.is_active,
+            is_superuser=new_user.is_superuser,
+            created_at=new_user.created_at.isoformat()
+        )
+        await asyncio.to_thread(db.commit)
+    except IntegrityError:
+        # Lost a race with a concurrent registration for the same username/email
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username or email already registered"
+        )
 
     # Create tokens for the new user
-    access_token = create_access_token(data={"sub": new_user.username})
-    refresh_token = create_refresh_token(data={"sub": new_user.username})
+    access_token = create_access_token(data={"sub": user_response.username})
+    refresh_token = create_refresh_token(data={"sub": user_response.username})
 
     return TokenResponse(
         access_token=access_token,
         refresh_token=refresh_token,
         token_type="bearer",
         expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        user=UserResponse(
-            id=new_user.id,
-            username=new_user.username,
-            email=new_user.email,
-            is_active=new_user.is_active,
-            is_superuser=new_user.is_superuser,
-            created_at=new_user.created_at.isoformat()
-        )
+        user=user_response
     )
 
 
@@ -185,12 +201,20 @@ async def login(
     Raises:
         HTTPException: If credentials are invalid
     """
-    # Find user by username or email
-    user = db.query(User).filter(
-        (User.username == request.username) | (User.email == request.username)
-    ).first()
+    # Find user by email or username, one indexed column per query
+    user = None
+    if "@" in request.username:
+        user = await asyncio.to_thread(
+            db.query(User).filter(User.email == request.username).first
+        )
+    if user is None:
+        user = await asyncio.to_thread(
+            db.query(User).filter(User.username == request.username).first
+        )
 
-    if not user or not verify_password(request.password, user.password_hash):
+    if not user or not await asyncio.to_thread(
+        verify_password, request.password, user.password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -257,7 +281,9 @@ async def refresh_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(User).filter(User.username == username).first()
+    user = await asyncio.to_thread(
+        db.query(User).filter(User.username == username).first
+    )
     if user is None or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
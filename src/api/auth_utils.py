@@ -1,8 +1,9 @@
 """
 Authentication utilities for JWT token management and password hashing.
 """
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -17,6 +18,12 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# Decoded token cache: token -> (cache expiry timestamp, payload), kept in
+# least-recently-used order
+TOKEN_CACHE_TTL_SECONDS = 30
+TOKEN_CACHE_MAX_SIZE = 1024
+_token_cache: Dict[str, Tuple[float, dict]] = {}
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -90,14 +97,40 @@ def decode_token(token: str) -> Optional[dict]:
     """
     Decode and validate a JWT token.
 
+    Valid payloads are cached for a short TTL (bounded by the token's own
+    expiration) so repeat requests with the same token skip signature checks.
+
     Args:
         token: JWT token string to decode
 
     Returns:
         Decoded token payload if valid, None otherwise
     """
+    now = time.time()
+    cached = _token_cache.get(token)
+    if cached is not None:
+        expires_at, payload = cached
+        del _token_cache[token]
+        if now < expires_at:
+            _token_cache[token] = cached
+            return dict(payload)
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except JWTError:
         return None
+
+    # Never keep a payload cached past the token's own expiration
+    expires_at = now + TOKEN_CACHE_TTL_SECONDS
+    if isinstance(payload.get("exp"), (int, float)):
+        expires_at = min(expires_at, payload["exp"])
+    if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+        # Evict the least recently used token rather than flushing the cache
+        del _token_cache[next(iter(_token_cache))]
+    _token_cache[token] = (expires_at, payload)
+    return dict(payload)
+
+
+def clear_token_cache() -> None:
+    """Clear the decoded token cache."""
+    _token_cache.clear()
@@ -9,7 +9,9 @@ from src.models.voice_synthesis import VoiceSynthesizer
 from src.models.voice_cloning import VoiceCloner
 
 
-@lru_cache()
+# One synthesizer per (backend, device, ...) combination; bounded so unusual
+# parameter mixes cannot keep an unlimited number of TTS models loaded
+@lru_cache(maxsize=8)
 def get_voice_synthesizer(
     backend: str = "coqui",
     device: str = "cpu",
@@ -29,7 +31,7 @@ def get_voice_synthesizer(
     )
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_voice_cloner(
     profile_dir: Optional[str] = None,
     device: str = "cpu",
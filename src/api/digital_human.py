@@ -5,49 +5,386 @@ This module provides REST API endpoints for creating and managing digital humans
 and generating videos using the digital human video generation pipeline.
 """
 
+import asyncio
+import hashlib
+import os
+import re
+import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from typing import Any, Dict, Optional, Tuple
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Form, Query
+from fastapi.responses import FileResponse
+from PIL import Image, UnidentifiedImageError
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from src.models.base import DatabaseManager
 from src.models.digital_human import DigitalHuman
 from src.models.video_generator import VideoGenerator, GenerationMode
 from src.api.auth import get_current_user
+from src.api.response_cache import ResponseCache, get_response_cache
 from src.api.schemas import (
     DigitalHumanCreateRequest,
     DigitalHumanResponse,
     DigitalHumanListResponse,
     VideoGenerateRequest,
     VideoGenerateResponse,
+    VideoGenerateJobResponse,
     ErrorResponse,
 )
 
 
 router = APIRouter(prefix="/api/v1/digital-human", tags=["digital-human"])
 
+# Chunk size used when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
-def get_db_session():
+# Stored file extensions for accepted image formats, keyed by magic number
+IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"GIF87a", ".gif"),
+    (b"GIF89a", ".gif"),
+    (b"BM", ".bmp"),
+)
+IMAGE_HEADER_SIZE = 16
+MAX_IMAGE_DIMENSION = 8192
+
+# Stored file extensions for accepted upload content types
+AUDIO_SUFFIXES = {
+    "audio/wav": ".wav",
+    "audio/x-wav": ".wav",
+    "audio/wave": ".wav",
+    "audio/mpeg": ".mp3",
+    "audio/ogg": ".ogg",
+    "audio/flac": ".flac",
+    "audio/x-flac": ".flac",
+}
+SAFE_SUFFIX_PATTERN = re.compile(r"\.[a-z0-9]{1,8}")
+
+# Columns selected for list responses, in DigitalHumanResponse field order
+DIGITAL_HUMAN_RESPONSE_COLUMNS = tuple(
+    getattr(DigitalHuman, field) for field in DigitalHumanResponse.model_fields
+)
+
+# Accepted generation mode names, resolved once at import
+GENERATION_MODES = {m.name.lower(): m for m in GenerationMode}
+GENERATION_MODE_NAMES = ", ".join(GENERATION_MODES)
+
+# In-process registry of queued video generation jobs, keyed by job ID
+MAX_TRACKED_JOBS = 1000
+_generation_jobs: Dict[str, Dict[str, Any]] = {}
+
+# Database dependency (will be configured in main.py)
+_db_manager: Optional[DatabaseManager] = None
+
+
+def set_db_manager(db_manager: Optional[DatabaseManager]):
+    """Set the database manager instance."""
+    global _db_manager
+    _db_manager = db_manager
+
+
+async def get_db_session():
     """Get database session dependency."""
-    db_manager = DatabaseManager(
-        database_url="sqlite:///./test.db",  # TODO: Load from config
-        echo=False
-    )
-    session = db_manager.get_session()
+    if _db_manager is None:
+        raise RuntimeError("Database manager not configured")
+    session = _db_manager.get_session()
     try:
         yield session
     finally:
-        session.close()
+        await asyncio.to_thread(session.close)
 
 
+@lru_cache(maxsize=1)
 def get_video_generator():
-    """Get video generator dependency."""
+    """
+    Get video generator dependency.
+
+    Uses LRU cache so the underlying models are loaded once per process.
+    """
     return VideoGenerator(
         device="cpu",  # TODO: Load from config
         mode=GenerationMode.ENHANCED_TALKING_HEAD
     )
 
 
+def _cache_namespace(user_id: int) -> str:
+    """Get the response cache namespace for a user's digital humans."""
+    return f"digital_human:{user_id}"
+
+
+def _remove_file(path: str) -> None:
+    """Remove a file if it exists."""
+    Path(path).unlink(missing_ok=True)
+
+
+async def _prepare_generation(
+    digital_human_id: int,
+    text: Optional[str],
+    audio: Optional[UploadFile],
+    mode: str,
+    current_user,
+    db: Session
+) -> Tuple[DigitalHuman, GenerationMode]:
+    """
+    Validate a generation request and resolve its inputs.
+
+    Nothing is written to disk here, so rejected requests leave no uploads
+    behind; callers save any audio once validation has passed.
+
+    Returns:
+        Tuple of the digital human and generation mode
+
+    Raises:
+        HTTPException: If the request is invalid or the digital human is not found
+    """
+    # Validate input
+    if not text and not audio:
+        raise HTTPException(status_code=400, detail="Either text or audio must be provided")
+
+    if text and audio:
+        raise HTTPException(status_code=400, detail="Provide either text or audio, not both")
+
+    # Validate mode
+    generation_mode = GENERATION_MODES.get(mode.lower())
+    if generation_mode is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid mode. Must be one of: {GENERATION_MODE_NAMES}"
+        )
+
+    # Get digital human
+    digital_human = await asyncio.to_thread(
+        db.query(DigitalHuman).filter(
+            DigitalHuman.id == digital_human_id,
+            DigitalHuman.user_id == current_user.id
+        ).first
+    )
+    if not digital_human:
+        raise HTTPException(status_code=404, detail="Digital human not found")
+
+    return digital_human, generation_mode
+
+
+def _generation_output_path(
+    digital_human_id: int,
+    generation_mode: GenerationMode,
+    run_id: str
+) -> Path:
+    """Get a video output path unique to one generation run."""
+    output_dir = Path("outputs/videos")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir / f"{digital_human_id}_{generation_mode.value}_{run_id}.mp4"
+
+
+async def _save_generation_audio(audio: UploadFile) -> Path:
+    """Save an uploaded audio file for audio-to-video generation."""
+    audio_dir = Path("uploads/audio")
+    audio_dir.mkdir(parents=True, exist_ok=True)
+
+    return await save_upload(audio, audio_dir, _upload_suffix(audio, AUDIO_SUFFIXES))
+
+
+def _generate_video(
+    video_gen: VideoGenerator,
+    image_path: str,
+    speaker_wav: Optional[str],
+    text: Optional[str],
+    audio_path: Optional[Path],
+    generation_mode: GenerationMode,
+    output_path: Path
+) -> str:
+    """Run text-to-video or audio-to-video generation."""
+    if text:
+        return video_gen.generate_from_text(
+            text=text,
+            image_path=image_path,
+            output_path=str(output_path),
+            speaker_wav=speaker_wav,
+            mode=generation_mode
+        )
+
+    return video_gen.generate_from_audio(
+        image_path=image_path,
+        audio_path=str(audio_path),
+        output_path=str(output_path),
+        mode=generation_mode
+    )
+
+
+def _store_video_path(digital_human_id: int, video_path: str) -> None:
+    """Persist a generated video path on its digital human."""
+    if _db_manager is None:
+        raise RuntimeError("Database manager not configured")
+    session = _db_manager.get_session()
+    try:
+        digital_human = session.get(DigitalHuman, digital_human_id)
+        if digital_human is not None:
+            digital_human.video_path = video_path
+            session.commit()
+    finally:
+        session.close()
+
+
+def _register_job(job: Dict[str, Any]) -> None:
+    """
+    Track a generation job, evicting the oldest finished jobs when full.
+
+    Raises:
+        HTTPException: 503 if the registry is full of pending or running jobs
+    """
+    if len(_generation_jobs) >= MAX_TRACKED_JOBS:
+        finished = [
+            job_id for job_id, tracked in _generation_jobs.items()
+            if tracked["status"] in ("completed", "failed")
+        ]
+        for job_id in finished[:len(_generation_jobs) - MAX_TRACKED_JOBS + 1]:
+            del _generation_jobs[job_id]
+    if len(_generation_jobs) >= MAX_TRACKED_JOBS:
+        raise HTTPException(status_code=503, detail="Too many generation jobs in progress")
+    _generation_jobs[job["job_id"]] = job
+
+
+def _get_user_job(job_id: str, user_id: int) -> Dict[str, Any]:
+    """Get a generation job owned by a user."""
+    job = _generation_jobs.get(job_id)
+    if job is None or job["user_id"] != user_id:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+def _job_response(job: Dict[str, Any]) -> VideoGenerateJobResponse:
+    """Build the public view of a generation job."""
+    return VideoGenerateJobResponse(
+        job_id=job["job_id"],
+        status=job["status"],
+        digital_human_id=job["digital_human_id"],
+        mode=job["mode"],
+        video_path=job["video_path"],
+        error=job["error"]
+    )
+
+
+async def _run_generation_job(
+    job: Dict[str, Any],
+    video_gen: VideoGenerator,
+    cache: ResponseCache,
+    **generation_kwargs: Any
+) -> None:
+    """Run a queued generation job and record its outcome."""
+    job["status"] = "running"
+    try:
+        video_path = await asyncio.to_thread(_generate_video, video_gen, **generation_kwargs)
+        await asyncio.to_thread(_store_video_path, job["digital_human_id"], video_path)
+    except Exception as e:
+        job["status"] = "failed"
+        job["error"] = str(e)
+        return
+
+    job["video_path"] = video_path
+    job["status"] = "completed"
+    cache.invalidate(_cache_namespace(job["user_id"]))
+
+
+def _copy_upload(upload: UploadFile, upload_dir: Path, suffix: str) -> Path:
+    """Copy an uploaded file to a content-addressed path in fixed-size chunks."""
+    upload.file.seek(0)
+    digest = hashlib.blake2b(digest_size=16)
+    temp_path = upload_dir / f".{uuid.uuid4().hex}.part"
+    try:
+        with open(temp_path, "wb") as f:
+            while chunk := upload.file.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                f.write(chunk)
+
+        destination = upload_dir / f"{digest.hexdigest()}{suffix}"
+        if destination.exists():
+            # Identical content already stored
+            temp_path.unlink()
+        else:
+            os.replace(temp_path, destination)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return destination
+
+
+def _image_suffix(header: bytes) -> Optional[str]:
+    """Get the file extension for an image from its leading bytes."""
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return ".webp"
+    for signature, suffix in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return suffix
+    return None
+
+
+def _inspect_image(upload: UploadFile) -> Tuple[Optional[str], Tuple[int, int]]:
+    """
+    Identify an uploaded image without decoding its pixels.
+
+    The format comes from the file's magic number rather than the
+    client-supplied content type, and the dimensions from the image header.
+
+    Returns:
+        Tuple of (file extension or None if not an allowed format, (width, height))
+    """
+    upload.file.seek(0)
+    suffix = _image_suffix(upload.file.read(IMAGE_HEADER_SIZE))
+    if suffix is None:
+        return None, (0, 0)
+
+    upload.file.seek(0)
+    try:
+        # Image.open only parses the header; pixel data is never loaded
+        with Image.open(upload.file) as img:
+            size = img.size
+    except Image.DecompressionBombError:
+        # Raised for headers far beyond MAX_IMAGE_DIMENSION in both axes
+        size = (MAX_IMAGE_DIMENSION + 1, MAX_IMAGE_DIMENSION + 1)
+    except (UnidentifiedImageError, OSError):
+        size = (0, 0)
+    finally:
+        upload.file.seek(0)
+    return suffix, size
+
+
+def _upload_suffix(upload: UploadFile, allowed: Dict[str, str]) -> str:
+    """
+    Get a safe file extension for an upload.
+
+    The extension comes from the content type when it is in ``allowed``,
+    otherwise from a plain alphanumeric suffix of the client filename.
+    """
+    suffix = allowed.get(upload.content_type or "")
+    if suffix is not None:
+        return suffix
+    suffix = Path(upload.filename or "").suffix.lower()
+    return suffix if SAFE_SUFFIX_PATTERN.fullmatch(suffix) else ""
+
+
+async def save_upload(upload: UploadFile, upload_dir: Path, suffix: str = "") -> Path:
+    """
+    Stream an uploaded file to disk without buffering it in memory.
+
+    The file is stored under the hash of its content, so client-supplied
+    names never reach the filesystem and re-uploads of the same file are
+    deduplicated. The blocking copy runs in a worker thread so the event
+    loop stays free.
+
+    Args:
+        upload: Uploaded file
+        upload_dir: Directory to store the file in
+        suffix: File extension to append to the content hash
+
+    Returns:
+        Path of the stored file
+    """
+    return await asyncio.to_thread(_copy_upload, upload, upload_dir, suffix)
+
+
 @router.post(
     "/create",
     response_model=DigitalHumanResponse,
@@ -61,7 +398,8 @@ async def create_digital_human(
     image: UploadFile = File(...),
     voice_model_path: Optional[str] = Form(None),
     current_user = Depends(get_current_user),
-    db: Session = Depends(get_db_session)
+    db: Session = Depends(get_db_session),
+    cache: ResponseCache = Depends(get_response_cache)
 ):
     """
     Create a new digital human.
@@ -73,6 +411,7 @@ async def create_digital_human(
         voice_model_path: Optional path to voice model
         current_user: Current authenticated user
         db: Database session
+        cache: Response cache
 
     Returns:
         DigitalHumanResponse with created digital human details
@@ -81,16 +420,17 @@ async def create_digital_human(
     if not image.content_type.startswith("image/"):
         raise HTTPException(status_code=400, detail="File must be an image")
 
+    image_suffix, (width, height) = await asyncio.to_thread(_inspect_image, image)
+    if image_suffix is None:
+        raise HTTPException(status_code=400, detail="Unsupported image type")
+    if not (0 < width <= MAX_IMAGE_DIMENSION and 0 < height <= MAX_IMAGE_DIMENSION):
+        raise HTTPException(status_code=400, detail="Invalid image dimensions")
+
     # Save image file
     upload_dir = Path("uploads/digital_humans")
     upload_dir.mkdir(parents=True, exist_ok=True)
 
-    image_filename = f"{current_user.id}_{name}_{image.filename}"
-    image_path = upload_dir / image_filename
-
-    with open(image_path, "wb") as f:
-        content = await image.read()
-        f.write(content)
+    image_path = await save_upload(image, upload_dir, image_suffix)
 
     # Create digital human in database
     digital_human = DigitalHuman(
@@ -103,10 +443,10 @@ async def create_digital_human(
     )
 
     db.add(digital_human)
-    db.commit()
-    db.refresh(digital_human)
-
-    return DigitalHumanResponse(
+    # The flush's INSERT populates the primary key and column defaults,
+    # so the response is built without a follow-up refresh SELECT
+    await asyncio.to_thread(db.flush)
+    response = DigitalHumanResponse(
         id=digital_human.id,
         user_id=digital_human.user_id,
         name=digital_human.name,
@@ -118,6 +458,10 @@ async def create_digital_human(
         created_at=digital_human.created_at,
         updated_at=digital_human.updated_at
     )
+    await asyncio.to_thread(db.commit)
+    cache.invalidate(_cache_namespace(current_user.id))
+
+    return response
 
 
 @router.post(
@@ -134,7 +478,8 @@ async def generate_video(
     mode: str = Form("enhanced_talking_head"),
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db_session),
-    video_gen: VideoGenerator = Depends(get_video_generator)
+    video_gen: VideoGenerator = Depends(get_video_generator),
+    cache: ResponseCache = Depends(get_response_cache)
 ):
     """
     Generate a video from a digital human.
@@ -147,76 +492,37 @@ async def generate_video(
         current_user: Current authenticated user
         db: Database session
         video_gen: Video generator instance
+        cache: Response cache
 
     Returns:
         VideoGenerateResponse with generated video path
     """
-    # Validate input
-    if not text and not audio:
-        raise HTTPException(status_code=400, detail="Either text or audio must be provided")
-
-    if text and audio:
-        raise HTTPException(status_code=400, detail="Provide either text or audio, not both")
-
-    # Get digital human
-    digital_human = db.query(DigitalHuman).filter(
-        DigitalHuman.id == digital_human_id,
-        DigitalHuman.user_id == current_user.id
-    ).first()
-
-    if not digital_human:
-        raise HTTPException(status_code=404, detail="Digital human not found")
+    digital_human, generation_mode = await _prepare_generation(
+        digital_human_id, text, audio, mode, current_user, db
+    )
+    output_path = _generation_output_path(digital_human.id, generation_mode, uuid.uuid4().hex)
+    audio_path = await _save_generation_audio(audio) if audio else None
 
-    # Validate mode
     try:
-        generation_mode = GenerationMode[mode.upper()]
-    except KeyError:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid mode. Must be one of: {', '.join([m.name.lower() for m in GenerationMode])}"
+        video_path = await asyncio.to_thread(
+            _generate_video,
+            video_gen,
+            image_path=digital_human.image_path,
+            speaker_wav=digital_human.voice_model_path,
+            text=text,
+            audio_path=audio_path,
+            generation_mode=generation_mode,
+            output_path=output_path
         )
 
-    # Update video generator mode
-    video_gen.mode = generation_mode
-
-    # Generate output path
-    output_dir = Path("outputs/videos")
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_path = output_dir / f"{digital_human.id}_{digital_human.name}_{mode}.mp4"
-
-    try:
-        if text:
-            # Text-to-video generation
-            video_path = video_gen.generate_from_text(
-                text=text,
-                image_path=digital_human.image_path,
-                output_path=str(output_path),
-                speaker_wav=digital_human.voice_model_path
-            )
-        else:
-            # Audio-to-video generation
-            # Save uploaded audio file
-            audio_dir = Path("uploads/audio")
-            audio_dir.mkdir(parents=True, exist_ok=True)
-            audio_path = audio_dir / f"{current_user.id}_{audio.filename}"
-
-            with open(audio_path, "wb") as f:
-                content = await audio.read()
-                f.write(content)
-
-            video_path = video_gen.generate_from_audio(
-                image_path=digital_human.image_path,
-                audio_path=str(audio_path),
-                output_path=str(output_path)
-            )
-
         # Update digital human with video path
         digital_human.video_path = video_path
-        db.commit()
+        await asyncio.to_thread(db.commit)
+        cache.invalidate(_cache_namespace(current_user.id))
 
         return VideoGenerateResponse(
             video_path=video_path,
-            digital_human_id=digital_human.id,
+            digital_human_id=digital_human_id,
             mode=mode,
             message="Video generated successfully"
         )
@@ -225,6 +531,143 @@ async def generate_video(
         raise HTTPException(status_code=500, detail=f"Video generation failed: {str(e)}")
 
 
+@router.post(
+    "/generate/jobs",
+    response_model=VideoGenerateJobResponse,
+    status_code=202,
+    responses={
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="Submit a video generation job",
+    description="Queue video generation and return immediately with a job ID to poll"
+)
+async def submit_generate_job(
+    background_tasks: BackgroundTasks,
+    digital_human_id: int = Form(...),
+    text: Optional[str] = Form(None),
+    audio: Optional[UploadFile] = File(None),
+    mode: str = Form("enhanced_talking_head"),
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db_session),
+    video_gen: VideoGenerator = Depends(get_video_generator),
+    cache: ResponseCache = Depends(get_response_cache)
+):
+    """
+    Submit a video generation job.
+
+    The response is sent as soon as the job is queued; generation runs in the
+    background and its progress can be polled via the job status endpoint.
+
+    Args:
+        background_tasks: FastAPI background task queue
+        digital_human_id: ID of the digital human
+        text: Text to synthesize (for text-to-video)
+        audio: Audio file (for audio-to-video)
+        mode: Generation mode (lipsync, talking_head, enhanced_lipsync, enhanced_talking_head)
+        current_user: Current authenticated user
+        db: Database session
+        video_gen: Video generator instance
+        cache: Response cache
+
+    Returns:
+        VideoGenerateJobResponse with the queued job
+    """
+    digital_human, generation_mode = await _prepare_generation(
+        digital_human_id, text, audio, mode, current_user, db
+    )
+
+    job = {
+        "job_id": uuid.uuid4().hex,
+        "user_id": current_user.id,
+        "digital_human_id": digital_human_id,
+        "mode": mode,
+        "status": "pending",
+        "video_path": None,
+        "error": None,
+    }
+    # Registered before the audio is saved so a refused job writes nothing
+    _register_job(job)
+    try:
+        # Audio is persisted here since uploads are closed once the request finishes
+        audio_path = await _save_generation_audio(audio) if audio else None
+    except BaseException:
+        del _generation_jobs[job["job_id"]]
+        raise
+    output_path = _generation_output_path(digital_human.id, generation_mode, job["job_id"])
+
+    background_tasks.add_task(
+        _run_generation_job,
+        job,
+        video_gen,
+        cache,
+        image_path=digital_human.image_path,
+        speaker_wav=digital_human.voice_model_path,
+        text=text,
+        audio_path=audio_path,
+        generation_mode=generation_mode,
+        output_path=output_path
+    )
+
+    return _job_response(job)
+
+
+@router.get(
+    "/generate/jobs/{job_id}",
+    response_model=VideoGenerateJobResponse,
+    responses={401: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
+    summary="Get video generation job status",
+    description="Get the status of a previously submitted video generation job"
+)
+async def get_generate_job(
+    job_id: str,
+    current_user = Depends(get_current_user)
+):
+    """
+    Get the status of a video generation job.
+
+    Args:
+        job_id: Job ID returned on submission
+        current_user: Current authenticated user
+
+    Returns:
+        VideoGenerateJobResponse with the job status
+    """
+    return _job_response(_get_user_job(job_id, current_user.id))
+
+
+@router.get(
+    "/generate/jobs/{job_id}/result",
+    responses={401: {"model": ErrorResponse}, 404: {"model": ErrorResponse}, 409: {"model": ErrorResponse}},
+    summary="Download generated video",
+    description="Stream the video produced by a completed generation job"
+)
+async def get_generate_job_result(
+    job_id: str,
+    current_user = Depends(get_current_user)
+):
+    """
+    Stream the generated video of a completed job.
+
+    Args:
+        job_id: Job ID returned on submission
+        current_user: Current authenticated user
+
+    Returns:
+        FileResponse streaming the generated video
+    """
+    job = _get_user_job(job_id, current_user.id)
+    if job["status"] != "completed":
+        raise HTTPException(status_code=409, detail=f"Job is {job['status']}")
+
+    if not Path(job["video_path"]).is_file():
+        raise HTTPException(status_code=404, detail="Generated video not found")
+
+    return FileResponse(job["video_path"], media_type="video/mp4")
+
+
 @router.get(
     "/list",
     response_model=DigitalHumanListResponse,
@@ -233,41 +676,47 @@ async def generate_video(
     description="Get a list of all digital humans for the current user"
 )
 async def list_digital_humans(
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
+    offset: int = Query(0, ge=0, description="Offset for pagination"),
     current_user = Depends(get_current_user),
-    db: Session = Depends(get_db_session)
+    db: Session = Depends(get_db_session),
+    cache: ResponseCache = Depends(get_response_cache)
 ):
     """
-    List all digital humans for the current user.
+    List digital humans for the current user, newest first.
 
     Args:
+        limit: Maximum number of digital humans to return
+        offset: Number of digital humans to skip
         current_user: Current authenticated user
         db: Database session
+        cache: Response cache
 
     Returns:
-        DigitalHumanListResponse with list of digital humans
+        DigitalHumanListResponse with a page of digital humans and the total count
     """
-    digital_humans = db.query(DigitalHuman).filter(
-        DigitalHuman.user_id == current_user.id
-    ).all()
-
-    return DigitalHumanListResponse(
-        digital_humans=[
-            DigitalHumanResponse(
-                id=dh.id,
-                user_id=dh.user_id,
-                name=dh.name,
-                description=dh.description,
-                image_path=dh.image_path,
-                voice_model_path=dh.voice_model_path,
-                video_path=dh.video_path,
-                is_active=dh.is_active,
-                created_at=dh.created_at,
-                updated_at=dh.updated_at
-            )
-            for dh in digital_humans
-        ],
-        total=len(digital_humans)
+    namespace = _cache_namespace(current_user.id)
+    cache_key = ("list", limit, offset)
+    cached = cache.get(namespace, cache_key)
+    if cached is not None:
+        return cached
+
+    owned = db.query(DigitalHuman).filter(DigitalHuman.user_id == current_user.id)
+    # Select plain column tuples so no ORM instances are hydrated or tracked
+    rows = await asyncio.to_thread(
+        owned.with_entities(*DIGITAL_HUMAN_RESPONSE_COLUMNS)
+        .order_by(DigitalHuman.id.desc()).limit(limit).offset(offset).all
+    )
+    total = await asyncio.to_thread(
+        owned.with_entities(func.count(DigitalHuman.id)).scalar
+    )
+
+    response = DigitalHumanListResponse(
+        digital_humans=[DigitalHumanResponse(**row._mapping) for row in rows],
+        total=total
     )
+    cache.set(namespace, cache_key, response)
+    return response
 
 
 @router.get(
@@ -280,7 +729,8 @@ async def list_digital_humans(
 async def get_digital_human(
     digital_human_id: int,
     current_user = Depends(get_current_user),
-    db: Session = Depends(get_db_session)
+    db: Session = Depends(get_db_session),
+    cache: ResponseCache = Depends(get_response_cache)
 ):
     """
     Get details of a specific digital human.
@@ -289,19 +739,27 @@ async def get_digital_human(
         digital_human_id: ID of the digital human
         current_user: Current authenticated user
         db: Database session
+        cache: Response cache
 
     Returns:
         DigitalHumanResponse with digital human details
     """
-    digital_human = db.query(DigitalHuman).filter(
-        DigitalHuman.id == digital_human_id,
-        DigitalHuman.user_id == current_user.id
-    ).first()
+    namespace = _cache_namespace(current_user.id)
+    cached = cache.get(namespace, digital_human_id)
+    if cached is not None:
+        return cached
+
+    digital_human = await asyncio.to_thread(
+        db.query(DigitalHuman).filter(
+            DigitalHuman.id == digital_human_id,
+            DigitalHuman.user_id == current_user.id
+        ).first
+    )
 
     if not digital_human:
         raise HTTPException(status_code=404, detail="Digital human not found")
 
-    return DigitalHumanResponse(
+    response = DigitalHumanResponse(
         id=digital_human.id,
         user_id=digital_human.user_id,
         name=digital_human.name,
@@ -313,6 +771,8 @@ async def get_digital_human(
         created_at=digital_human.created_at,
         updated_at=digital_human.updated_at
     )
+    cache.set(namespace, digital_human_id, response)
+    return response
 
 
 @router.delete(
@@ -324,7 +784,8 @@ async def get_digital_human(
 async def delete_digital_human(
     digital_human_id: int,
     current_user = Depends(get_current_user),
-    db: Session = Depends(get_db_session)
+    db: Session = Depends(get_db_session),
+    cache: ResponseCache = Depends(get_response_cache)
 ):
     """
     Delete a specific digital human.
@@ -333,26 +794,39 @@ async def delete_digital_human(
         digital_human_id: ID of the digital human
         current_user: Current authenticated user
         db: Database session
+        cache: Response cache
 
     Returns:
         Success message
     """
-    digital_human = db.query(DigitalHuman).filter(
-        DigitalHuman.id == digital_human_id,
-        DigitalHuman.user_id == current_user.id
-    ).first()
+    digital_human = await asyncio.to_thread(
+        db.query(DigitalHuman).filter(
+            DigitalHuman.id == digital_human_id,
+            DigitalHuman.user_id == current_user.id
+        ).first
+    )
 
     if not digital_human:
         raise HTTPException(status_code=404, detail="Digital human not found")
 
-    # Delete associated files
-    if digital_human.image_path and Path(digital_human.image_path).exists():
-        Path(digital_human.image_path).unlink()
-
-    if digital_human.video_path and Path(digital_human.video_path).exists():
-        Path(digital_human.video_path).unlink()
+    # Uploaded images are deduplicated by content, so keep shared ones
+    image_shared = await asyncio.to_thread(
+        db.query(DigitalHuman.id).filter(
+            DigitalHuman.image_path == digital_human.image_path,
+            DigitalHuman.id != digital_human.id
+        ).first
+    ) is not None
+    paths = [digital_human.video_path]
+    if not image_shared:
+        paths.append(digital_human.image_path)
+
+    # Delete associated files concurrently, off the event loop
+    await asyncio.gather(*(
+        asyncio.to_thread(_remove_file, path) for path in paths if path
+    ))
 
     db.delete(digital_human)
-    db.commit()
+    await asyncio.to_thread(db.commit)
+    cache.invalidate(_cache_namespace(current_user.id))
 
     return {"message": "Digital human deleted successfully"}
@@ -1,36 +1,65 @@
 """
 Main FastAPI application for OpenUser Digital Human System.
 """
+import asyncio
 import os
 from contextlib import asynccontextmanager
+from importlib import import_module
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.api.voice import router as voice_router
-from src.api.auth import router as auth_router, set_db_manager
-from src.api.digital_human import router as digital_human_router
-from src.api.plugins import router as plugins_router
-from src.api.agents import router as agents_router
-from src.api.scheduler import router as scheduler_router
-from src.api.scheduler_monitor import router as scheduler_monitor_router
-from src.api.websocket import router as websocket_router
-from src.models.base import DatabaseManager
+from src.api.response_cache import ResponseCache
+
+# Router modules, imported when an app is created rather than when this module is
+ROUTER_MODULES = (
+    "src.api.auth",
+    "src.api.voice",
+    "src.api.digital_human",
+    "src.api.plugins",
+    "src.api.agents",
+    "src.api.scheduler",
+    "src.api.scheduler_monitor",
+    "src.api.websocket",
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
+    from src.api.auth import set_db_manager
+    from src.api.digital_human import set_db_manager as set_digital_human_db_manager
+    from src.models.base import DatabaseManager
+
     # Startup: Initialize database
     database_url = os.getenv("DATABASE_URL", "sqlite:///./openuser.db")
     db_manager = DatabaseManager(database_url, echo=False)
     db_manager.create_tables()
+    # Open pooled connections now so early requests skip the connect handshake
+    await asyncio.to_thread(db_manager.warm_pool, int(os.getenv("DATABASE_POOL_WARMUP", "5")))
     set_db_manager(db_manager)
+    set_digital_human_db_manager(db_manager)
     print(f"Database initialized: {database_url}")
 
+    # Build the OpenAPI schema now instead of on the first /docs or /openapi.json hit
+    app.openapi()
+
+    # Share websocket task progress between workers through Redis when configured
+    websocket_redis_url = os.getenv("WEBSOCKET_REDIS_URL")
+    if websocket_redis_url:
+        import redis.asyncio as redis
+
+        from src.api.websocket import manager as websocket_manager
+
+        websocket_manager.enable_redis(
+            redis.from_url(websocket_redis_url, decode_responses=True)
+        )
+
     yield
 
     # Shutdown: cleanup if needed
+    if websocket_redis_url:
+        await websocket_manager.disable_redis()
     print("Application shutting down")
 
 
@@ -50,24 +79,30 @@ def create_app() -> FastAPI:
         lifespan=lifespan
     )
 
-    # Configure CORS
+    # Cache for idempotent GET responses
+    app.state.response_cache = ResponseCache(
+        ttl_seconds=float(os.getenv("RESPONSE_CACHE_TTL", "30"))
+    )
+
+    # Plugins loaded through the API are shared by all requests
+    from src.core.plugin_manager import PluginManager
+
+    app.state.plugin_manager = PluginManager()
+
+    # Configure CORS for an explicit origin list; browsers cache preflights for max_age seconds
+    cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000")
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],  # Configure appropriately for production
+        allow_origins=[origin.strip() for origin in cors_origins.split(",") if origin.strip()],
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        max_age=600,
     )
 
     # Include routers
-    app.include_router(auth_router)
-    app.include_router(voice_router)
-    app.include_router(digital_human_router)
-    app.include_router(plugins_router)
-    app.include_router(agents_router)
-    app.include_router(scheduler_router)
-    app.include_router(scheduler_monitor_router)
-    app.include_router(websocket_router)
+    for module_name in ROUTER_MODULES:
+        app.include_router(import_module(module_name).router)
 
     @app.get("/")
     async def root():
@@ -86,5 +121,9 @@ def create_app() -> FastAPI:
     return app
 
 
-# Create app instance
-app = create_app()
+def __getattr__(name: str):
+    """Create the module-level app on first access (e.g. by uvicorn)."""
+    if name == "app":
+        app = globals()["app"] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
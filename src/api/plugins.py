@@ -6,7 +6,7 @@ including listing, installing, and hot-reloading plugins.
 """
 
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 
 from src.core.plugin_manager import PluginManager
 from src.api.auth import get_current_user
@@ -23,9 +23,9 @@ from src.api.schemas import (
 router = APIRouter(prefix="/api/v1/plugins", tags=["plugins"])
 
 
-def get_plugin_manager():
-    """Get plugin manager dependency."""
-    return PluginManager()
+async def get_plugin_manager(request: Request) -> PluginManager:
+    """Get the application's shared PluginManager instance."""
+    return request.app.state.plugin_manager
 
 
 @router.get(
@@ -49,20 +49,16 @@ async def list_plugins(
     Returns:
         PluginListResponse with list of plugins
     """
-    plugins = plugin_manager.list_plugins()
-
-    return PluginListResponse(
-        plugins=[
-            {
-                "name": plugin.name,
-                "version": plugin.version,
-                "dependencies": plugin.dependencies,
-            }
-            for plugin_name in plugins
-            if (plugin := plugin_manager.get_plugin(plugin_name)) is not None
-        ],
-        total=len(plugins)
-    )
+    plugins = [
+        {
+            "name": plugin.name,
+            "version": plugin.version,
+            "dependencies": plugin.dependencies,
+        }
+        for plugin in plugin_manager.iter_plugins()
+    ]
+
+    return PluginListResponse(plugins=plugins, total=len(plugins))
 
 
 @router.post(
@@ -0,0 +1,90 @@
+"""
+In-memory TTL cache for idempotent GET responses.
+
+Entries are grouped by namespace (e.g. one namespace per user) so that a
+write endpoint can drop every cached read it may have made stale.
+"""
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from fastapi import Request
+
+
+class ResponseCache:
+    """
+    Per-process response cache with a time-to-live and a size cap.
+
+    Attributes:
+        ttl_seconds: How long an entry stays valid
+        max_entries: Maximum number of cached entries across all namespaces
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 1024) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[str, Dict[Hashable, Tuple[float, Any]]] = {}
+        self._size = 0
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            namespace: Cache namespace
+            key: Entry key within the namespace
+
+        Returns:
+            Cached value if present and not expired, None otherwise
+        """
+        bucket = self._entries.get(namespace)
+        if not bucket:
+            return None
+
+        entry = bucket.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del bucket[key]
+            self._size -= 1
+            return None
+        return value
+
+    def set(self, namespace: str, key: Hashable, value: Any) -> None:
+        """
+        Cache a value.
+
+        Args:
+            namespace: Cache namespace
+            key: Entry key within the namespace
+            value: Value to cache
+        """
+        if self._size >= self.max_entries:
+            self.clear()
+
+        bucket = self._entries.setdefault(namespace, {})
+        if key not in bucket:
+            self._size += 1
+        bucket[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, namespace: str) -> None:
+        """
+        Drop all entries in a namespace.
+
+        Args:
+            namespace: Cache namespace
+        """
+        bucket = self._entries.pop(namespace, None)
+        if bucket:
+            self._size -= len(bucket)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+        self._size = 0
+
+
+def get_response_cache(request: Request) -> ResponseCache:
+    """Dependency to get the application's ResponseCache instance."""
+    return request.app.state.response_cache
@@ -1,8 +1,14 @@
 """
 Scheduler API endpoints for task management.
 """
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+from operator import attrgetter
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, insert, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from src.models.task import Task, TaskStatus, TaskType
@@ -16,7 +22,43 @@ from src.api.schemas import (
     ErrorResponse
 )
 
-router = APIRouter(prefix="/api/v1/scheduler", tags=["scheduler"])
+try:
+    import orjson  # noqa: F401
+
+    # orjson renders large task lists several times faster than stdlib json
+    TaskJSONResponse = ORJSONResponse
+except ImportError:
+    TaskJSONResponse = JSONResponse
+
+router = APIRouter(
+    prefix="/api/v1/scheduler", tags=["scheduler"], default_response_class=TaskJSONResponse
+)
+
+# Accepted task type and status values, resolved once at import
+VALID_TASK_TYPES = frozenset(t.value for t in TaskType)
+VALID_TASK_STATUSES = frozenset(s.value for s in TaskStatus)
+
+# Validates a whole list of task rows in one pydantic-core call
+TASK_LIST_ADAPTER = TypeAdapter(List[TaskResponse])
+
+# TaskResponse fields, with the matching columns and a C-level getter for them
+TASK_RESPONSE_FIELDS = tuple(TaskResponse.model_fields)
+TASK_RESPONSE_COLUMNS = tuple(getattr(Task, field) for field in TASK_RESPONSE_FIELDS)
+_task_response_values = attrgetter(*TASK_RESPONSE_FIELDS)
+
+
+def _task_response(task: Any) -> TaskResponse:
+    """Build a TaskResponse from a Task or task row without re-validating it."""
+    return TaskResponse.model_construct(**dict(zip(TASK_RESPONSE_FIELDS, _task_response_values(task))))
+
+
+def _delete_task(db: Session, task_id: int, user_id: int) -> int:
+    """Delete a user's task with a single DELETE and return the affected row count."""
+    result = db.execute(
+        delete(Task).where(Task.id == task_id, Task.user_id == user_id)
+    )
+    db.commit()
+    return result.rowcount
 
 
 @router.post(
@@ -44,56 +86,36 @@ async def create_task(
     Returns:
         Created task information
     """
-    try:
-        # Validate task type
-        try:
-            TaskType(request.task_type)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid task type: {request.task_type}"
-            )
-
-        # Create task
-        task = Task(
-            user_id=current_user.id,
-            name=request.name,
-            description=request.description,
-            task_type=request.task_type,
-            schedule=request.schedule,
-            params=request.params,
-            status=TaskStatus.PENDING.value
+    # Validate task type
+    if request.task_type not in VALID_TASK_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid task type: {request.task_type}"
         )
 
-        db.add(task)
+    try:
+        # Create task with one INSERT ... RETURNING instead of add, flush and refresh
+        task = db.execute(
+            insert(Task).values(
+                user_id=current_user.id,
+                name=request.name,
+                description=request.description,
+                task_type=request.task_type,
+                schedule=request.schedule,
+                params=request.params,
+                status=TaskStatus.PENDING.value
+            ).returning(*TASK_RESPONSE_COLUMNS)
+        ).one()
         db.commit()
-        db.refresh(task)
-
-        return TaskResponse(
-            id=task.id,
-            user_id=task.user_id,
-            name=task.name,
-            description=task.description,
-            task_type=task.task_type,
-            schedule=task.schedule,
-            params=task.params,
-            status=task.status,
-            result=task.result,
-            error_message=task.error_message,
-            started_at=task.started_at,
-            completed_at=task.completed_at,
-            created_at=task.created_at,
-            updated_at=task.updated_at
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
+    except SQLAlchemyError as e:
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create task: {str(e)}"
         )
 
+    return _task_response(task)
+
 
 @router.get(
     "/list",
@@ -105,82 +127,66 @@ async def create_task(
 async def list_tasks(
     task_status: Optional[str] = None,
     task_type: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
+    offset: int = Query(0, ge=0, description="Offset for pagination"),
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    List all tasks for the current user.
+    List tasks for the current user, newest first.
 
     Args:
         task_status: Filter by task status (optional)
         task_type: Filter by task type (optional)
+        limit: Maximum number of tasks to return
+        offset: Number of tasks to skip
         current_user: Current authenticated user
         db: Database session
 
     Returns:
-        List of tasks
+        A page of tasks and the total number of matching tasks
     """
+    # Validate filters
+    if task_status and task_status not in VALID_TASK_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid status: {task_status}"
+        )
+    if task_type and task_type not in VALID_TASK_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid task type: {task_type}"
+        )
+
     try:
         # Build query
         query = db.query(Task).filter(Task.user_id == current_user.id)
-
-        # Apply filters
         if task_status:
-            try:
-                TaskStatus(task_status)
-                query = query.filter(Task.status == task_status)
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid status: {task_status}"
-                )
-
+            query = query.filter(Task.status == task_status)
         if task_type:
-            try:
-                TaskType(task_type)
-                query = query.filter(Task.task_type == task_type)
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid task type: {task_type}"
-                )
+            query = query.filter(Task.task_type == task_type)
 
         # Execute query
-        tasks = query.order_by(Task.created_at.desc()).all()
-
-        # Convert to response
-        task_responses = [
-            TaskResponse(
-                id=task.id,
-                user_id=task.user_id,
-                name=task.name,
-                description=task.description,
-                task_type=task.task_type,
-                schedule=task.schedule,
-                params=task.params,
-                status=task.status,
-                result=task.result,
-                error_message=task.error_message,
-                started_at=task.started_at,
-                completed_at=task.completed_at,
-                created_at=task.created_at,
-                updated_at=task.updated_at
-            )
-            for task in tasks
-        ]
-
-        return TaskListResponse(
-            tasks=task_responses,
-            total=len(task_responses)
+        total = query.with_entities(func.count(Task.id)).scalar()
+        # Select plain column tuples so no ORM instances are hydrated or tracked
+        tasks = (
+            query.with_entities(*TASK_RESPONSE_COLUMNS)
+            .order_by(Task.created_at.desc()).limit(limit).offset(offset).all()
         )
-    except HTTPException:
-        raise
-    except Exception as e:
+    except SQLAlchemyError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list tasks: {str(e)}"
         )
 
+    # Convert to response
+    task_responses = TASK_LIST_ADAPTER.validate_python(tasks, from_attributes=True)
+
+    return TaskListResponse(
+        tasks=task_responses,
+        total=total
+    )
+
 
 @router.get(
     "/{task_id}",
@@ -206,7 +212,7 @@ async def get_task(
     Returns:
         Task information
     """
-    task = db.query(Task).filter(
+    task = db.query(*TASK_RESPONSE_COLUMNS).filter(
         Task.id == task_id,
         Task.user_id == current_user.id
     ).first()
@@ -217,22 +223,7 @@ async def get_task(
             detail=f"Task {task_id} not found"
         )
 
-    return TaskResponse(
-        id=task.id,
-        user_id=task.user_id,
-        name=task.name,
-        description=task.description,
-        task_type=task.task_type,
-        schedule=task.schedule,
-        params=task.params,
-        status=task.status,
-        result=task.result,
-        error_message=task.error_message,
-        started_at=task.started_at,
-        completed_at=task.completed_at,
-        created_at=task.created_at,
-        updated_at=task.updated_at
-    )
+    return _task_response(task)
 
 
 @router.put(
@@ -261,11 +252,22 @@ async def update_task(
     Returns:
         Updated task information
     """
+    if request.status is not None and request.status not in VALID_TASK_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid status: {request.status}"
+        )
+
+    owned = (Task.id == task_id, Task.user_id == current_user.id)
+    values = request.model_dump(exclude_none=True)
     try:
-        task = db.query(Task).filter(
-            Task.id == task_id,
-            Task.user_id == current_user.id
-        ).first()
+        if values:
+            # One UPDATE ... RETURNING instead of SELECT, attribute diff and flush
+            task = db.execute(
+                update(Task).where(*owned).values(**values).returning(Task)
+            ).scalar_one_or_none()
+        else:
+            task = db.query(Task).filter(*owned).first()
 
         if not task:
             raise HTTPException(
@@ -273,53 +275,18 @@ async def update_task(
                 detail=f"Task {task_id} not found"
             )
 
-        # Update fields
-        if request.name is not None:
-            task.name = request.name
-        if request.description is not None:
-            task.description = request.description
-        if request.schedule is not None:
-            task.schedule = request.schedule
-        if request.params is not None:
-            task.params = request.params
-        if request.status is not None:
-            try:
-                TaskStatus(request.status)
-                task.status = request.status
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid status: {request.status}"
-                )
-
+        # Build the response before commit expires the returned row
+        response = _task_response(task)
         db.commit()
-        db.refresh(task)
-
-        return TaskResponse(
-            id=task.id,
-            user_id=task.user_id,
-            name=task.name,
-            description=task.description,
-            task_type=task.task_type,
-            schedule=task.schedule,
-            params=task.params,
-            status=task.status,
-            result=task.result,
-            error_message=task.error_message,
-            started_at=task.started_at,
-            completed_at=task.completed_at,
-            created_at=task.created_at,
-            updated_at=task.updated_at
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
+    except SQLAlchemyError as e:
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update task: {str(e)}"
         )
 
+    return response
+
 
 @router.delete(
     "/{task_id}",
@@ -345,17 +312,12 @@ async def delete_task(
     Returns:
         No content on success
     """
-    task = db.query(Task).filter(
-        Task.id == task_id,
-        Task.user_id == current_user.id
-    ).first()
+    # Run the blocking DELETE in a worker thread so it does not stall the event loop
+    deleted = await asyncio.to_thread(_delete_task, db, task_id, current_user.id)
 
-    if not task:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task {task_id} not found"
         )
 
-    db.delete(task)
-    db.commit()
-
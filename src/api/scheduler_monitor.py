@@ -8,10 +8,11 @@ This module provides REST API endpoints for:
 - Performance monitoring
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from src.api.auth import get_current_user
 from src.models.task import TaskStatus, TaskType
@@ -20,6 +21,10 @@ from src.scheduler.monitor import TaskMonitor, get_task_monitor
 
 router = APIRouter(prefix="/api/v1/scheduler/monitor", tags=["scheduler-monitor"])
 
+# Filter values accepted by the history endpoint, resolved once at import
+TASK_TYPES_BY_VALUE = {t.value: t for t in TaskType}
+TASK_STATUSES_BY_VALUE = {s.value: s for s in TaskStatus}
+
 
 # Response models
 class TaskStatsResponse(BaseModel):
@@ -88,6 +93,50 @@ class QueueStatusResponse(BaseModel):
     pending_by_type: Dict[str, int]
 
 
+class MonitorBatchCall(BaseModel):
+    """A single monitor query within a batch request."""
+
+    name: Literal["stats", "history", "failures", "performance", "queue"] = Field(
+        ..., description="Monitor endpoint to run"
+    )
+    params: Dict[str, Any] = Field(
+        default_factory=dict, description="Query parameters accepted by that endpoint"
+    )
+
+
+class MonitorBatchRequest(BaseModel):
+    """Monitor batch request."""
+
+    calls: List[MonitorBatchCall] = Field(..., min_length=1, max_length=10)
+
+
+class MonitorBatchResponse(BaseModel):
+    """Monitor batch response, with one result per call in request order."""
+
+    results: List[Dict[str, Any]]
+
+
+# Batch call parameters, mirroring the query parameters of each endpoint
+class _NoParams(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+
+class _HistoryParams(_NoParams):
+    task_type: Optional[TaskType] = None
+    status: Optional[TaskStatus] = None
+    limit: int = Field(100, ge=1, le=1000)
+    offset: int = Field(0, ge=0)
+
+
+class _FailuresParams(_NoParams):
+    hours: int = Field(24, ge=1, le=168)
+    limit: int = Field(10, ge=1, le=100)
+
+
+class _PerformanceParams(_NoParams):
+    days: int = Field(7, ge=1, le=90)
+
+
 @router.get("/stats", response_model=TaskStatsResponse)
 async def get_task_statistics(
     current_user: User = Depends(get_current_user),
@@ -119,11 +168,19 @@ async def get_task_history(
 
     Supports filtering by task type and status, with pagination.
     """
-    try:
-        # Parse filters
-        task_type_enum = TaskType(task_type) if task_type else None
-        status_enum = TaskStatus(status) if status else None
+    # Parse filters
+    task_type_enum = TASK_TYPES_BY_VALUE.get(task_type) if task_type else None
+    if task_type and task_type_enum is None:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid filter value: '{task_type}' is not a valid task type"
+        )
+    status_enum = TASK_STATUSES_BY_VALUE.get(status) if status else None
+    if status and status_enum is None:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid filter value: '{status}' is not a valid status"
+        )
 
+    try:
         # Get history
         history = monitor.get_task_history(
             user_id=current_user.id,
@@ -139,8 +196,6 @@ async def get_task_history(
             limit=limit,
             offset=offset,
         )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=f"Invalid filter value: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get task history: {str(e)}")
 
@@ -199,3 +254,71 @@ async def get_queue_status(
         return QueueStatusResponse(**status)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get queue status: {str(e)}")
+
+
+def _history_call(monitor: TaskMonitor, user_id: int, params: _HistoryParams) -> BaseModel:
+    history = monitor.get_task_history(user_id=user_id, **params.model_dump())
+    return TaskHistoryResponse(
+        tasks=[TaskHistoryItem(**item) for item in history],
+        total=len(history),
+        limit=params.limit,
+        offset=params.offset,
+    )
+
+
+def _failures_call(monitor: TaskMonitor, user_id: int, params: _FailuresParams) -> BaseModel:
+    failures = monitor.get_recent_failures(user_id=user_id, **params.model_dump())
+    return RecentFailuresResponse(
+        failures=[FailureItem(**item) for item in failures], total=len(failures)
+    )
+
+
+# Parameter model and runner for each batchable monitor call
+_BATCH_CALLS: Dict[str, Tuple[Type[BaseModel], Callable[[TaskMonitor, int, Any], BaseModel]]] = {
+    "stats": (
+        _NoParams,
+        lambda monitor, user_id, params: TaskStatsResponse(**monitor.get_task_stats(user_id=user_id)),
+    ),
+    "history": (_HistoryParams, _history_call),
+    "failures": (_FailuresParams, _failures_call),
+    "performance": (
+        _PerformanceParams,
+        lambda monitor, user_id, params: PerformanceMetricsResponse(
+            **monitor.get_performance_metrics(user_id=user_id, **params.model_dump())
+        ),
+    ),
+    "queue": (
+        _NoParams,
+        lambda monitor, user_id, params: QueueStatusResponse(**monitor.get_queue_status()),
+    ),
+}
+
+
+@router.post("/batch", response_model=MonitorBatchResponse)
+async def run_monitor_batch(
+    request: MonitorBatchRequest,
+    current_user: User = Depends(get_current_user),
+    monitor: TaskMonitor = Depends(get_task_monitor),
+) -> MonitorBatchResponse:
+    """
+    Run several monitor queries in one request.
+
+    Lets a dashboard fetch stats, history, failures, performance and queue
+    status in a single round trip; the queries run concurrently.
+    """
+    calls = []
+    for call in request.calls:
+        params_model, runner = _BATCH_CALLS[call.name]
+        try:
+            calls.append((runner, params_model(**call.params)))
+        except ValidationError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid params for {call.name}: {str(e)}")
+
+    try:
+        results = await asyncio.gather(
+            *(asyncio.to_thread(runner, monitor, current_user.id, params) for runner, params in calls)
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to run monitor batch: {str(e)}")
+
+    return MonitorBatchResponse(results=[result.model_dump() for result in results])
@@ -1,71 +1,84 @@
 """
 API request and response schemas using Pydantic.
 """
+import re
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, field_validator, EmailStr
+from typing import Annotated, Optional, List, Dict, Any, Literal, Tuple
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Allowed enum values, checked natively by pydantic-core
+VoiceBackend = Literal["coqui", "pyttsx3", "gtts"]
+VoiceDevice = Literal["cpu", "cuda"]
+VideoMode = Literal["lipsync", "talking_head", "enhanced_lipsync", "enhanced_talking_head"]
+
+# Request bodies are never mutated after parsing and reject unknown fields
+REQUEST_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
+# Admin-only response models build their core schema on first use instead of at import
+DEFERRED_MODEL_CONFIG = ConfigDict(defer_build=True)
+
+# Basic address shape check; avoids importing email-validator for every registration
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Password strength checks, compiled once so each registration is a C-level scan
+PASSWORD_UPPER_PATTERN = re.compile(r"[A-Z]")
+PASSWORD_LOWER_PATTERN = re.compile(r"[a-z]")
+PASSWORD_DIGIT_PATTERN = re.compile(r"[0-9]")
 
 
 class VoiceSynthesizeRequest(BaseModel):
     """Request schema for voice synthesis."""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     text: str = Field(..., min_length=1, max_length=10000, description="Text to synthesize")
-    backend: str = Field(default="coqui", description="TTS backend (coqui, pyttsx3, gtts)")
+    backend: VoiceBackend = Field(default="coqui", description="TTS backend (coqui, pyttsx3, gtts)")
     speaker_wav: Optional[str] = Field(default=None, description="Path to speaker audio for voice cloning")
-    device: str = Field(default="cpu", description="Device to use (cpu, cuda)")
-
-    @field_validator("backend")
-    @classmethod
-    def validate_backend(cls, v: str) -> str:
-        """Validate TTS backend."""
-        allowed = ["coqui", "pyttsx3", "gtts"]
-        if v not in allowed:
-            raise ValueError(f"Backend must be one of {allowed}")
-        return v
-
-    @field_validator("device")
-    @classmethod
-    def validate_device(cls, v: str) -> str:
-        """Validate device."""
-        allowed = ["cpu", "cuda"]
-        if v not in allowed:
-            raise ValueError(f"Device must be one of {allowed}")
-        return v
+    device: VoiceDevice = Field(default="cpu", description="Device to use (cpu, cuda)")
 
 
-class VoiceSynthesizeResponse(BaseModel):
+# Voice responses are only ever built by the server from trusted values, so they
+# are slotted dataclasses rather than models; pydantic still derives their
+# OpenAPI schema and serializes them.
+@dataclass(frozen=True, slots=True, kw_only=True)
+class VoiceSynthesizeResponse:
     """Response schema for voice synthesis."""
 
-    audio_path: str = Field(..., description="Path to generated audio file")
-    duration: float = Field(..., description="Audio duration in seconds")
-    backend: str = Field(..., description="TTS backend used")
-    text_length: int = Field(..., description="Length of input text")
+    audio_path: Annotated[str, Field(description="Path to generated audio file")]
+    duration: Annotated[float, Field(description="Audio duration in seconds")]
+    backend: Annotated[str, Field(description="TTS backend used")]
+    text_length: Annotated[int, Field(description="Length of input text")]
 
 
 class VoiceProfileCreateRequest(BaseModel):
     """Request schema for creating voice profile."""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     name: str = Field(..., min_length=1, max_length=100, description="Profile name")
-    sample_paths: List[str] = Field(..., min_length=1, description="Paths to audio samples")
+    sample_paths: Tuple[str, ...] = Field(..., min_length=1, description="Paths to audio samples")
     description: Optional[str] = Field(default=None, description="Profile description")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
 
-class VoiceProfileResponse(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class VoiceProfileResponse:
     """Response schema for voice profile."""
 
-    name: str = Field(..., description="Profile name")
-    description: Optional[str] = Field(default=None, description="Profile description")
-    sample_count: int = Field(..., description="Number of audio samples")
-    created_at: str = Field(..., description="Creation timestamp")
-    metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
+    name: Annotated[str, Field(description="Profile name")]
+    description: Annotated[Optional[str], Field(description="Profile description")] = None
+    sample_count: Annotated[int, Field(description="Number of audio samples")]
+    created_at: Annotated[str, Field(description="Creation timestamp")]
+    metadata: Annotated[Optional[Dict[str, Any]], Field(description="Additional metadata")] = None
 
 
-class VoiceProfileListResponse(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class VoiceProfileListResponse:
     """Response schema for listing voice profiles."""
 
-    profiles: List[str] = Field(..., description="List of profile names")
-    count: int = Field(..., description="Total number of profiles")
+    profiles: Annotated[List[str], Field(description="List of profile names")]
+    count: Annotated[int, Field(description="Total number of profiles")]
 
 
 class ErrorResponse(BaseModel):
@@ -80,19 +93,29 @@ class ErrorResponse(BaseModel):
 class UserRegisterRequest(BaseModel):
     """Request schema for user registration."""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     username: str = Field(..., min_length=3, max_length=50, description="Username")
-    email: EmailStr = Field(..., description="Email address")
+    email: str = Field(..., max_length=254, description="Email address")
     password: str = Field(..., min_length=8, max_length=100, description="Password")
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        """Validate email address format."""
+        if not EMAIL_PATTERN.match(v):
+            raise ValueError("Invalid email address")
+        return v
+
     @field_validator("password")
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password strength."""
-        if not any(c.isupper() for c in v):
+        if not PASSWORD_UPPER_PATTERN.search(v):
             raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
+        if not PASSWORD_LOWER_PATTERN.search(v):
             raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
+        if not PASSWORD_DIGIT_PATTERN.search(v):
             raise ValueError("Password must contain at least one digit")
         return v
 
@@ -100,6 +123,8 @@ class UserRegisterRequest(BaseModel):
 class UserLoginRequest(BaseModel):
     """Request schema for user login."""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     username: str = Field(..., description="Username or email")
     password: str = Field(..., description="Password")
 
@@ -117,6 +142,8 @@ class TokenResponse(BaseModel):
 class TokenRefreshRequest(BaseModel):
     """Request schema for token refresh."""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     refresh_token: str = Field(..., description="JWT refresh token")
 
 
@@ -146,6 +173,8 @@ class DigitalHumanCreateRequest(BaseModel):
     - voice_model_path: Optional[str] (Form field)
     """
 
+    model_config = REQUEST_MODEL_CONFIG
+
     name: str = Field(..., min_length=1, max_length=100, description="Digital human name")
     description: Optional[str] = Field(default=None, description="Digital human description")
     voice_model_path: Optional[str] = Field(default=None, description="Path to voice model")
@@ -186,18 +215,11 @@ class VideoGenerateRequest(BaseModel):
     - mode: str (Form field, default: "enhanced_talking_head")
     """
 
+    model_config = REQUEST_MODEL_CONFIG
+
     digital_human_id: int = Field(..., description="Digital human ID")
     text: Optional[str] = Field(default=None, description="Text to synthesize (for text-to-video)")
-    mode: str = Field(default="enhanced_talking_head", description="Generation mode")
-
-    @field_validator("mode")
-    @classmethod
-    def validate_mode(cls, v: str) -> str:
-        """Validate generation mode."""
-        allowed = ["lipsync", "talking_head", "enhanced_lipsync", "enhanced_talking_head"]
-        if v not in allowed:
-            raise ValueError(f"Mode must be one of {allowed}")
-        return v
+    mode: VideoMode = Field(default="enhanced_talking_head", description="Generation mode")
 
 
 class VideoGenerateResponse(BaseModel):
@@ -209,6 +231,17 @@ class VideoGenerateResponse(BaseModel):
     message: str = Field(..., description="Success message")
 
 
+class VideoGenerateJobResponse(BaseModel):
+    """Response schema for a queued video generation job."""
+
+    job_id: str = Field(..., description="Job ID")
+    status: str = Field(..., description="Job status (pending, running, completed, failed)")
+    digital_human_id: int = Field(..., description="Digital human ID")
+    mode: str = Field(..., description="Generation mode")
+    video_path: Optional[str] = Field(default=None, description="Path to generated video once completed")
+    error: Optional[str] = Field(default=None, description="Error message if the job failed")
+
+
 # Plugin Schemas
 
 class PluginInfo(BaseModel):
@@ -229,12 +262,16 @@ class PluginListResponse(BaseModel):
 class PluginInstallRequest(BaseModel):
     """Request schema for installing a plugin."""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     name: str = Field(..., min_length=1, max_length=100, description="Plugin name to install")
 
 
 class PluginInstallResponse(BaseModel):
     """Response schema for plugin installation."""
 
+    model_config = DEFERRED_MODEL_CONFIG
+
     name: str = Field(..., description="Installed plugin name")
     version: str = Field(..., description="Installed plugin version")
     message: str = Field(..., description="Success message")
@@ -243,12 +280,16 @@ class PluginInstallResponse(BaseModel):
 class PluginReloadRequest(BaseModel):
     """Request schema for reloading a plugin."""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     name: str = Field(..., min_length=1, max_length=100, description="Plugin name to reload")
 
 
 class PluginReloadResponse(BaseModel):
     """Response schema for plugin reload."""
 
+    model_config = DEFERRED_MODEL_CONFIG
+
     name: str = Field(..., description="Reloaded plugin name")
     version: str = Field(..., description="Reloaded plugin version")
     message: str = Field(..., description="Success message")
@@ -259,6 +300,8 @@ class PluginReloadResponse(BaseModel):
 class AgentCreateRequest(BaseModel):
     """Request schema for creating an agent."""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     name: str = Field(..., min_length=1, max_length=100, description="Agent name")
     system_prompt: str = Field(..., min_length=1, description="Agent system prompt")
     capabilities: List[str] = Field(default_factory=list, description="Agent capabilities")
@@ -267,6 +310,8 @@ class AgentCreateRequest(BaseModel):
 class AgentUpdateRequest(BaseModel):
     """Request schema for updating an agent."""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     system_prompt: Optional[str] = Field(default=None, description="New system prompt")
     capabilities: Optional[List[str]] = Field(default=None, description="New capabilities")
 
@@ -286,11 +331,40 @@ class AgentListResponse(BaseModel):
     total: int = Field(..., description="Total number of agents")
 
 
+class AgentBatchCreateRequest(BaseModel):
+    """Request schema for creating several agents at once."""
+
+    model_config = REQUEST_MODEL_CONFIG
+
+    agents: List[AgentCreateRequest] = Field(
+        ..., min_length=1, max_length=32, description="Agents to create"
+    )
+
+
+class AgentBatchDeleteRequest(BaseModel):
+    """Request schema for deleting several agents at once."""
+
+    model_config = REQUEST_MODEL_CONFIG
+
+    names: List[str] = Field(..., min_length=1, max_length=32, description="Agent names to delete")
+
+
+class AgentBatchDeleteResponse(BaseModel):
+    """Response schema for batch agent deletion."""
+
+    model_config = DEFERRED_MODEL_CONFIG
+
+    deleted: List[str] = Field(..., description="Names of deleted agents")
+    not_found: List[str] = Field(..., description="Names that did not match an agent")
+
+
 # Task/Scheduler Schemas
 
 class TaskCreateRequest(BaseModel):
     """Request schema for creating a task."""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     name: str = Field(..., min_length=1, max_length=200, description="Task name")
     description: Optional[str] = Field(default=None, description="Task description")
     task_type: str = Field(..., description="Task type (video_generation, voice_synthesis, etc.)")
@@ -301,6 +375,8 @@ class TaskCreateRequest(BaseModel):
 class TaskUpdateRequest(BaseModel):
     """Request schema for updating a task."""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     name: Optional[str] = Field(default=None, min_length=1, max_length=200, description="Task name")
     description: Optional[str] = Field(default=None, description="Task description")
     schedule: Optional[str] = Field(default=None, description="Cron schedule expression")
@@ -1,10 +1,11 @@
 """
 Voice synthesis and cloning API endpoints.
 """
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Response
+from pydantic_core import to_json
+from typing import Any, List
 import os
-import time
+import re
 
 from src.api.schemas import (
     VoiceSynthesizeRequest,
@@ -19,15 +20,40 @@ from src.models.voice_synthesis import VoiceSynthesizer
 from src.models.voice_cloning import VoiceCloner
 
 
+# Runs of non-whitespace; subn counts them in C without building a word list
+WORD_PATTERN = re.compile(r"\S+")
+
+# Delete success body; only the JSON-escaped profile name varies per request
+DELETE_PROFILE_RESPONSE_TEMPLATE = b"{\"message\":\"Profile '%s' deleted successfully\"}"
+
+
 router = APIRouter(prefix="/api/v1/voice", tags=["voice"])
 
 
+def _json_response(payload: Any) -> Response:
+    """
+    Serialize a server-built payload straight to a JSON response.
+
+    Payloads are the response dataclasses from schemas, or plain dicts when
+    there is nothing to gain from one. Either way they are dumped by
+    pydantic-core, so FastAPI skips response_model revalidation and
+    jsonable_encoder. response_model stays on the routes for OpenAPI.
+
+    Args:
+        payload: Response dataclass or dict built from trusted values
+
+    Returns:
+        JSON response with the serialized payload
+    """
+    return Response(content=to_json(payload), media_type="application/json")
+
+
 @router.post(
     "/synthesize",
     response_model=VoiceSynthesizeResponse,
     responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}}
 )
-async def synthesize_voice(request: VoiceSynthesizeRequest) -> VoiceSynthesizeResponse:
+async def synthesize_voice(request: VoiceSynthesizeRequest) -> Response:
     """
     Synthesize speech from text using specified TTS backend.
 
@@ -48,23 +74,22 @@ async def synthesize_voice(request: VoiceSynthesizeRequest) -> VoiceSynthesizeRe
         )
 
         # Synthesize speech
-        start_time = time.time()
         audio_path = synthesizer.synthesize(
             text=request.text,
             speaker_wav=request.speaker_wav
         )
-        duration = time.time() - start_time
 
         # Get audio duration (approximate based on text length)
         # In production, you'd want to read the actual audio file duration
-        estimated_duration = len(request.text.split()) * 0.5  # ~0.5s per word
+        word_count = WORD_PATTERN.subn("", request.text)[1]
+        estimated_duration = word_count * 0.5  # ~0.5s per word
 
-        return VoiceSynthesizeResponse(
+        return _json_response(VoiceSynthesizeResponse(
             audio_path=audio_path,
             duration=estimated_duration,
             backend=request.backend,
             text_length=len(request.text)
-        )
+        ))
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -77,7 +102,7 @@ async def synthesize_voice(request: VoiceSynthesizeRequest) -> VoiceSynthesizeRe
     response_model=VoiceProfileResponse,
     responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}}
 )
-async def create_voice_profile(request: VoiceProfileCreateRequest) -> VoiceProfileResponse:
+async def create_voice_profile(request: VoiceProfileCreateRequest) -> Response:
     """
     Create a new voice profile from audio samples.
 
@@ -105,13 +130,13 @@ async def create_voice_profile(request: VoiceProfileCreateRequest) -> VoiceProfi
         # Save profile
         cloner.save_profile(profile)
 
-        return VoiceProfileResponse(
+        return _json_response(VoiceProfileResponse(
             name=profile.name,
             description=profile.description,
             sample_count=len(profile.sample_paths),
             created_at=profile.created_at,
             metadata=profile.metadata
-        )
+        ))
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -124,7 +149,7 @@ async def create_voice_profile(request: VoiceProfileCreateRequest) -> VoiceProfi
     response_model=VoiceProfileListResponse,
     responses={500: {"model": ErrorResponse}}
 )
-async def list_voice_profiles() -> VoiceProfileListResponse:
+async def list_voice_profiles() -> Response:
     """
     List all available voice profiles.
 
@@ -138,10 +163,7 @@ async def list_voice_profiles() -> VoiceProfileListResponse:
         cloner = get_voice_cloner()
         profiles = cloner.list_profiles()
 
-        return VoiceProfileListResponse(
-            profiles=profiles,
-            count=len(profiles)
-        )
+        return _json_response({"profiles": profiles, "count": len(profiles)})
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list profiles: {str(e)}")
@@ -152,7 +174,7 @@ async def list_voice_profiles() -> VoiceProfileListResponse:
     response_model=VoiceProfileResponse,
     responses={404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}}
 )
-async def get_voice_profile(name: str) -> VoiceProfileResponse:
+async def get_voice_profile(name: str) -> Response:
     """
     Get information about a specific voice profile.
 
@@ -169,13 +191,13 @@ async def get_voice_profile(name: str) -> VoiceProfileResponse:
         cloner = get_voice_cloner()
         profile_info = cloner.get_profile_info(name)
 
-        return VoiceProfileResponse(
+        return _json_response(VoiceProfileResponse(
             name=profile_info["name"],
             description=profile_info.get("description"),
             sample_count=profile_info["sample_count"],
             created_at=profile_info["created_at"],
             metadata=profile_info.get("metadata")
-        )
+        ))
 
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Profile '{name}' not found")
@@ -187,7 +209,7 @@ async def get_voice_profile(name: str) -> VoiceProfileResponse:
     "/profiles/{name}",
     responses={404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}}
 )
-async def delete_voice_profile(name: str) -> dict:
+async def delete_voice_profile(name: str) -> Response:
     """
     Delete a voice profile.
 
@@ -207,7 +229,10 @@ async def delete_voice_profile(name: str) -> dict:
         if not success:
             raise HTTPException(status_code=404, detail=f"Profile '{name}' not found")
 
-        return {"message": f"Profile '{name}' deleted successfully"}
+        return Response(
+            content=DELETE_PROFILE_RESPONSE_TEMPLATE % to_json(name)[1:-1],
+            media_type="application/json"
+        )
 
     except HTTPException:
         raise
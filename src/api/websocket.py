@@ -5,13 +5,20 @@ This module provides WebSocket endpoints for:
 - Real-time progress updates during video generation
 - Live video streaming
 - Agent communication channel
+
+Messages are small JSON documents, so the server is run with
+``--ws-per-message-deflate false``: per-message compression would keep a
+zlib window per connection (hundreds of KB each) to save a few bytes per
+frame.
 """
 
-from typing import Dict, Set
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Union
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, status
 from fastapi.responses import JSONResponse
 import json
 import asyncio
+import re
+import time
 from datetime import datetime, timezone
 
 from src.api.auth_utils import decode_token
@@ -19,6 +26,87 @@ from src.api.auth_utils import decode_token
 
 router = APIRouter(prefix="/api/v1/ws", tags=["websocket"])
 
+# Seconds a single send may take before the client is dropped
+SEND_TIMEOUT = 5.0
+# Messages buffered per client before it is treated as a slow consumer
+OUTBOUND_QUEUE_SIZE = 256
+# Connections accepted per user and across the whole server
+MAX_CONNECTIONS_PER_USER = 5
+MAX_TOTAL_CONNECTIONS = 1000
+# Seconds progress updates for one task are coalesced before being broadcast
+PROGRESS_COALESCE_WINDOW = 0.05
+# Task ids are dotted topics; subscribing to "<prefix>.*" follows every task below prefix
+TOPIC_SEPARATOR = "."
+WILDCARD_SUFFIX = ".*"
+# Wildcards must stay inside the subscriber's own "user.<username>" namespace
+USER_TOPIC_PREFIX = "user"
+# Redis channel carrying a task's progress messages between workers
+PROGRESS_CHANNEL_PREFIX = "openuser:ws:progress:"
+# Seconds the Redis relay waits for a message before re-checking subscriptions
+BRIDGE_POLL_INTERVAL = 0.1
+# Seconds the Redis relay backs off after a Redis error
+BRIDGE_RETRY_DELAY = 1.0
+
+
+# Seconds a formatted timestamp is reused across messages
+TIMESTAMP_RESOLUTION = 0.01
+_timestamp_cache = [0.0, ""]
+
+
+def _now_iso() -> str:
+    """Return the current UTC time in ISO format, reusing it within TIMESTAMP_RESOLUTION."""
+    now = time.time()
+    # Also refresh if the wall clock moved backwards
+    if not 0 <= now - _timestamp_cache[0] < TIMESTAMP_RESOLUTION:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    return _timestamp_cache[1]
+
+
+def _encode_message(message: dict) -> str:
+    """Encode a message the same way WebSocket.send_json does."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+class ClientConnection:
+    """Outbound queue and writer task for one WebSocket connection."""
+
+    __slots__ = ("websocket", "user_id", "queue", "writer_task")
+
+    def __init__(self, websocket: WebSocket, user_id: str):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self.writer_task: Optional[asyncio.Task] = None
+
+
+class TopicNode:
+    """One level of the wildcard subscription trie."""
+
+    __slots__ = ("children", "subscribers")
+
+    def __init__(self):
+        self.children: Dict[str, "TopicNode"] = {}
+        # Sockets subscribed to every task below this node
+        self.subscribers: Set[WebSocket] = set()
+
+
+def user_namespace(username: str) -> str:
+    """
+    Get the topic prefix a user's task ids live under, e.g. ``user.alice``.
+
+    Dots and percent signs in the username are percent-encoded, so the
+    username is a single topic segment and never overlaps another user's
+    namespace: ``john.doe`` owns ``user.john%2Edoe``, not part of ``user.john``.
+    """
+    segment = username.replace("%", "%25").replace(TOPIC_SEPARATOR, "%2E")
+    return TOPIC_SEPARATOR.join((USER_TOPIC_PREFIX, segment))
+
+
+def _is_wildcard(task_id: str) -> bool:
+    """Whether a subscription names a topic prefix rather than a single task."""
+    return len(task_id) > len(WILDCARD_SUFFIX) and task_id.endswith(WILDCARD_SUFFIX)
+
 
 class ConnectionManager:
     """Manages WebSocket connections."""
@@ -28,80 +116,403 @@ class ConnectionManager:
         self.active_connections: Dict[str, Set[WebSocket]] = {}
         # Store connections by task_id for progress updates
         self.task_connections: Dict[str, Set[WebSocket]] = {}
+        # Wildcard subscriptions, keyed by the parts of their topic prefix
+        self.topic_root = TopicNode()
+        # Reverse index of all subscriptions so disconnect only visits a socket's own tasks
+        self.connection_tasks: Dict[WebSocket, Set[str]] = {}
+        # Outbound queue and writer task of every connected socket
+        self.clients: Dict[WebSocket, ClientConnection] = {}
+        # Cross-worker relay for task progress, see enable_redis()
+        self.bridge: Optional["RedisProgressBridge"] = None
+        # Latest not-yet-broadcast progress per task, see schedule_broadcast()
+        self.pending_progress: Dict[str, dict] = {}
+        # Broadcasts started by the coalescing timer, referenced until they finish
+        self.flush_tasks: Set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket, user_id: str):
-        """Accept and register a new WebSocket connection."""
-        await websocket.accept()
+        """Accept and register a new WebSocket connection, enforcing connection limits."""
+        if (
+            len(self.active_connections.get(user_id, ())) >= MAX_CONNECTIONS_PER_USER
+            or len(self.clients) >= MAX_TOTAL_CONNECTIONS
+        ):
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            raise WebSocketDisconnect(code=status.WS_1008_POLICY_VIOLATION)
+
+        # Reserve the slot before awaiting the handshake so concurrent connects
+        # for the same user cannot all pass the limit check
         if user_id not in self.active_connections:
             self.active_connections[user_id] = set()
         self.active_connections[user_id].add(websocket)
+        client = ClientConnection(websocket, user_id)
+        self.clients[websocket] = client
+
+        try:
+            await websocket.accept()
+        except BaseException:
+            self.disconnect(websocket, user_id)
+            raise
+
+        client.writer_task = asyncio.create_task(self._writer(client))
+
+    async def _writer(self, client: ClientConnection):
+        """Send queued messages to one client until it fails or disconnects."""
+        while True:
+            payload = await client.queue.get()
+            try:
+                await asyncio.wait_for(client.websocket.send_text(payload), timeout=SEND_TIMEOUT)
+            except Exception:
+                self.disconnect(client.websocket, client.user_id)
+                return
+            finally:
+                client.queue.task_done()
+
+    def disconnect(self, websocket: WebSocket, user_id: Optional[str] = None):
+        """Remove a WebSocket connection.
+
+        ``user_id`` defaults to the one the socket was connected with.
+        """
+        client = self.clients.pop(websocket, None)
+        if client is not None:
+            if user_id is None:
+                user_id = client.user_id
+            if client.writer_task is not None:
+                client.writer_task.cancel()
 
-    def disconnect(self, websocket: WebSocket, user_id: str):
-        """Remove a WebSocket connection."""
         if user_id in self.active_connections:
             self.active_connections[user_id].discard(websocket)
             if not self.active_connections[user_id]:
                 del self.active_connections[user_id]
 
-        # Remove from task connections
-        for task_id in list(self.task_connections.keys()):
-            self.task_connections[task_id].discard(websocket)
-            if not self.task_connections[task_id]:
-                del self.task_connections[task_id]
-
-    def subscribe_to_task(self, websocket: WebSocket, task_id: str):
-        """Subscribe a WebSocket to task progress updates."""
-        if task_id not in self.task_connections:
-            self.task_connections[task_id] = set()
-        self.task_connections[task_id].add(websocket)
+        # Remove from task connections. Only this socket's own subscriptions are
+        # visited, and no snapshot is needed: the set is popped from the reverse
+        # index while the loop mutates task_connections / the topic trie.
+        for task_id in self.connection_tasks.pop(websocket, ()):
+            self._remove_subscriber(websocket, task_id)
+        self._subscriptions_changed()
+
+    def wildcard_allowed(self, websocket: WebSocket, task_id: str) -> bool:
+        """Whether a socket may follow a wildcard, i.e. it stays within its user's namespace."""
+        client = self.clients.get(websocket)
+        if client is None:
+            return False
+        namespace = user_namespace(client.user_id)
+        prefix = task_id[:-len(WILDCARD_SUFFIX)]
+        return prefix == namespace or prefix.startswith(namespace + TOPIC_SEPARATOR)
+
+    def subscribe_to_task(self, websocket: WebSocket, task_id: str) -> bool:
+        """Subscribe a WebSocket to task progress updates.
+
+        A ``task_id`` ending in ``.*`` subscribes to every task whose dotted
+        id starts with that prefix. Such wildcards are only allowed inside
+        the namespace of the socket's user, see ``user_namespace()``, e.g.
+        ``user.alice.*`` for user ``alice``.
+
+        Returns:
+            False if the wildcard subscription was refused, True otherwise
+        """
+        if _is_wildcard(task_id):
+            if not self.wildcard_allowed(websocket, task_id):
+                return False
+            node = self.topic_root
+            for part in task_id[:-len(WILDCARD_SUFFIX)].split(TOPIC_SEPARATOR):
+                node = node.children.setdefault(part, TopicNode())
+            node.subscribers.add(websocket)
+        else:
+            if task_id not in self.task_connections:
+                self.task_connections[task_id] = set()
+            self.task_connections[task_id].add(websocket)
+        self.connection_tasks.setdefault(websocket, set()).add(task_id)
+        self._subscriptions_changed()
+        return True
 
     def unsubscribe_from_task(self, websocket: WebSocket, task_id: str):
         """Unsubscribe a WebSocket from task progress updates."""
-        if task_id in self.task_connections:
-            self.task_connections[task_id].discard(websocket)
-            if not self.task_connections[task_id]:
-                del self.task_connections[task_id]
+        self._remove_subscriber(websocket, task_id)
+
+        tasks = self.connection_tasks.get(websocket)
+        if tasks is not None:
+            tasks.discard(task_id)
+            if not tasks:
+                del self.connection_tasks[websocket]
+        self._subscriptions_changed()
+
+    def _remove_subscriber(self, websocket: WebSocket, task_id: str):
+        """Drop one subscription, pruning index entries left empty."""
+        if not _is_wildcard(task_id):
+            connections = self.task_connections.get(task_id)
+            if connections is not None:
+                connections.discard(websocket)
+                if not connections:
+                    del self.task_connections[task_id]
+            return
+
+        path = [self.topic_root]
+        parts = task_id[:-len(WILDCARD_SUFFIX)].split(TOPIC_SEPARATOR)
+        for part in parts:
+            node = path[-1].children.get(part)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].subscribers.discard(websocket)
+
+        # Prune now-empty nodes from the leaf up
+        for part, parent, node in zip(reversed(parts), reversed(path[:-1]), reversed(path[1:])):
+            if node.children or node.subscribers:
+                break
+            del parent.children[part]
+
+    def task_subscribers(self, task_id: str) -> Set[WebSocket]:
+        """Return every socket following a task, directly or through a wildcard."""
+        subscribers = set(self.task_connections.get(task_id, ()))
+        node = self.topic_root
+        if node.children:
+            # Only proper prefixes of the task id can match a wildcard
+            for part in task_id.split(TOPIC_SEPARATOR)[:-1]:
+                node = node.children.get(part)
+                if node is None:
+                    break
+                subscribers.update(node.subscribers)
+        return subscribers
+
+    def wildcard_prefixes(self) -> List[str]:
+        """Return the outermost topic prefixes that have wildcard subscribers."""
+        prefixes = []
+        stack = [(node, part) for part, node in self.topic_root.children.items()]
+        while stack:
+            node, prefix = stack.pop()
+            if node.subscribers:
+                # Deeper wildcards are already covered by this one
+                prefixes.append(prefix)
+                continue
+            stack.extend(
+                (child, prefix + TOPIC_SEPARATOR + part)
+                for part, child in node.children.items()
+            )
+        return prefixes
+
+    def covered_by_wildcard(self, task_id: str) -> bool:
+        """Whether some wildcard subscription already matches a task."""
+        node = self.topic_root
+        if not node.children:
+            return False
+        for part in task_id.split(TOPIC_SEPARATOR)[:-1]:
+            node = node.children.get(part)
+            if node is None:
+                return False
+            if node.subscribers:
+                return True
+        return False
 
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send a message to a specific WebSocket connection."""
+        client = self.clients.get(websocket)
+        if client is not None:
+            # Go through the writer task so it stays the socket's only sender
+            await client.queue.put(_encode_message(message))
+            return
+
         try:
             await websocket.send_json(message)
         except Exception:
-            pass  # Connection might be closed
+            # Connection is gone; drop anything that still references it
+            self.disconnect(websocket)
+
+    async def _send_all(self, connections: Iterable[WebSocket], message: dict):
+        """Queue a message for several connections, dropping clients that cannot keep up."""
+        # Encode once for every recipient, matching WebSocket.send_json's text frames
+        await self._send_payload(connections, _encode_message(message))
+
+    async def _send_payload(self, connections: Iterable[WebSocket], payload: str):
+        """Queue an encoded message for several connections."""
+        slow_clients = []
+        # Snapshot so disconnects while dropping slow clients cannot break iteration
+        for websocket in list(connections):
+            client = self.clients.get(websocket)
+            if client is None:
+                continue
+            try:
+                client.queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                slow_clients.append(client)
+
+        for client in slow_clients:
+            await self._drop_slow_client(client)
+
+    async def _drop_slow_client(self, client: ClientConnection):
+        """Disconnect and close a client whose outbound queue is full."""
+        self.disconnect(client.websocket, client.user_id)
+        try:
+            await asyncio.wait_for(
+                client.websocket.close(code=status.WS_1013_TRY_AGAIN_LATER),
+                timeout=SEND_TIMEOUT
+            )
+        except Exception:
+            pass  # Connection might already be closed
 
     async def broadcast_to_user(self, message: dict, user_id: str):
         """Broadcast a message to all connections of a specific user."""
         if user_id in self.active_connections:
-            disconnected = set()
-            for connection in self.active_connections[user_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    disconnected.add(connection)
-
-            # Clean up disconnected connections
-            for connection in disconnected:
-                self.disconnect(connection, user_id)
-
-    async def broadcast_task_progress(self, task_id: str, progress: dict):
+            await self._send_all(self.active_connections[user_id], message)
+
+    async def broadcast_task_progress(self, task_id: Union[str, int], progress: dict):
         """Broadcast progress update to all connections subscribed to a task."""
-        if task_id in self.task_connections:
-            message = {
-                "type": "progress",
-                "task_id": task_id,
-                "data": progress,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
-            disconnected = set()
-            for connection in self.task_connections[task_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    disconnected.add(connection)
-
-            # Clean up disconnected connections
-            for connection in disconnected:
-                self.unsubscribe_from_task(connection, task_id)
+        # Subscriptions are keyed by the string form of numeric task ids
+        topic = str(task_id)
+        if self.bridge is None:
+            subscribers = self.task_subscribers(topic)
+            if not subscribers:
+                return
+
+        message = {
+            "type": "progress",
+            "task_id": task_id,
+            "data": progress,
+            "timestamp": _now_iso()
+        }
+        if self.bridge is not None:
+            # Every worker, this one included, delivers it to its own subscribers
+            await self.bridge.publish(topic, _encode_message(message))
+        else:
+            await self._send_all(subscribers, message)
+
+    def schedule_broadcast(self, task_id: str, progress: dict):
+        """
+        Broadcast task progress within PROGRESS_COALESCE_WINDOW, sending only
+        the latest update if several arrive in that window.
+
+        Args:
+            task_id: Task the progress belongs to
+            progress: Progress data; replaces any update still pending
+        """
+        if task_id not in self.pending_progress:
+            asyncio.get_running_loop().call_later(
+                PROGRESS_COALESCE_WINDOW, self._flush_progress, task_id
+            )
+        self.pending_progress[task_id] = progress
+
+    def _flush_progress(self, task_id: str):
+        """Broadcast the latest pending progress of a task."""
+        progress = self.pending_progress.pop(task_id, None)
+        if progress is None:
+            return
+        task = asyncio.create_task(self.broadcast_task_progress(task_id, progress))
+        self.flush_tasks.add(task)
+        task.add_done_callback(self.flush_tasks.discard)
+
+    def enable_redis(self, client):
+        """
+        Relay task progress through Redis pub/sub so subscribers connected to
+        any worker receive it.
+
+        Args:
+            client: ``redis.asyncio`` client created with ``decode_responses=True``
+        """
+        self.bridge = RedisProgressBridge(self, client)
+        self.bridge.start()
+
+    async def disable_redis(self):
+        """Stop relaying task progress through Redis."""
+        bridge, self.bridge = self.bridge, None
+        if bridge is not None:
+            await bridge.close()
+
+    def _subscriptions_changed(self):
+        """Let the Redis relay pick up added or removed task subscriptions."""
+        if self.bridge is not None:
+            self.bridge.changed.set()
+
+
+def _glob_escape(text: str) -> str:
+    """Escape Redis glob metacharacters so ``text`` only matches literally."""
+    return re.sub(r"([*?\[\]\\])", r"\\\1", text)
+
+
+class RedisProgressBridge:
+    """Relays task progress between workers over Redis pub/sub.
+
+    A worker subscribes to the channel of each task its own sockets follow,
+    and to a channel pattern per wildcard subscription, and hands whatever
+    arrives to its local connections. Tasks covered by a wildcard get no
+    channel of their own so every message arrives exactly once.
+    """
+
+    def __init__(self, manager: ConnectionManager, client):
+        self.manager = manager
+        self.client = client
+        self.pubsub = client.pubsub()
+        self.channels: Set[str] = set()
+        self.patterns: Set[str] = set()
+        # Set when local subscriptions changed and the Redis ones must follow
+        self.changed = asyncio.Event()
+        self.changed.set()
+        self.reader_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start relaying messages to local subscribers."""
+        self.reader_task = asyncio.create_task(self._reader())
+
+    async def close(self):
+        """Stop the relay and release its Redis connections."""
+        if self.reader_task is not None:
+            self.reader_task.cancel()
+            await asyncio.gather(self.reader_task, return_exceptions=True)
+        await self.pubsub.aclose()
+        await self.client.aclose()
+
+    async def publish(self, task_id: str, payload: str):
+        """Publish an encoded progress message to every worker."""
+        await self.client.publish(PROGRESS_CHANNEL_PREFIX + task_id, payload)
+
+    async def _sync_channels(self):
+        """Subscribe to exactly the tasks that have local subscribers."""
+        self.changed.clear()
+        channels = {
+            PROGRESS_CHANNEL_PREFIX + task_id
+            for task_id, connections in self.manager.task_connections.items()
+            if connections and not self.manager.covered_by_wildcard(task_id)
+        }
+        patterns = {
+            _glob_escape(PROGRESS_CHANNEL_PREFIX + prefix + TOPIC_SEPARATOR) + "*"
+            for prefix in self.manager.wildcard_prefixes()
+        }
+
+        if channels - self.channels:
+            await self.pubsub.subscribe(*(channels - self.channels))
+        if self.channels - channels:
+            await self.pubsub.unsubscribe(*(self.channels - channels))
+        self.channels = channels
+        if patterns - self.patterns:
+            await self.pubsub.psubscribe(*(patterns - self.patterns))
+        if self.patterns - patterns:
+            await self.pubsub.punsubscribe(*(self.patterns - patterns))
+        self.patterns = patterns
+
+    async def _reader(self):
+        """Deliver relayed messages until cancelled."""
+        from redis.exceptions import RedisError
+
+        while True:
+            try:
+                if self.changed.is_set():
+                    await self._sync_channels()
+                if not self.channels and not self.patterns:
+                    await self.changed.wait()
+                    continue
+
+                message = await self.pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=BRIDGE_POLL_INTERVAL
+                )
+                if message is None:
+                    continue
+                task_id = message["channel"][len(PROGRESS_CHANNEL_PREFIX):]
+                connections = self.manager.task_subscribers(task_id)
+                if connections:
+                    await self.manager._send_payload(connections, message["data"])
+            except RedisError:
+                # The pub/sub connection resubscribes its channels on reconnect;
+                # resync once in case the error interrupted _sync_channels
+                self.changed.set()
+                await asyncio.sleep(BRIDGE_RETRY_DELAY)
 
 
 # Global connection manager instance
@@ -139,6 +550,111 @@ async def get_current_user_ws(websocket: WebSocket, token: str = None) -> str:
     return user_id
 
 
+# Reply templates; per-message fields are merged onto a copy with "|"
+_SUBSCRIBED = {"type": "subscribed"}
+_UNSUBSCRIBED = {"type": "unsubscribed"}
+_RESPONSE = {"type": "response"}
+_PONG = {"type": "pong"}
+_PROGRESS_ERROR = {"type": "error", "message": "Invalid action or missing task_id"}
+# Task ids may be strings or, for scheduler tasks, integers
+_TASK_ID_TYPES = (str, int)
+_WILDCARD_FORBIDDEN = {
+    "type": "error",
+    "message": "Wildcard subscriptions must stay within your own user.<username> namespace"
+}
+_AGENT_MISSING_FIELDS = {"type": "error", "message": "Missing agent_name or content"}
+_AGENT_ERROR = {"type": "error", "message": "Invalid action"}
+
+MessageHandler = Callable[[WebSocket, dict], Awaitable[None]]
+
+
+def _topic(task_id: Any) -> Optional[str]:
+    """Get the subscription topic for a client-supplied task id, or None if invalid."""
+    if not task_id or not isinstance(task_id, _TASK_ID_TYPES) or isinstance(task_id, bool):
+        return None
+    return str(task_id)
+
+
+async def _progress_subscribe(websocket: WebSocket, data: dict):
+    """Subscribe the socket to a task's progress updates."""
+    task_id = data.get("task_id")
+    topic = _topic(task_id)
+    if topic is None:
+        await _progress_invalid(websocket, data)
+        return
+    if not manager.subscribe_to_task(websocket, topic):
+        await manager.send_personal_message(_WILDCARD_FORBIDDEN | {"task_id": task_id}, websocket)
+        return
+    await manager.send_personal_message(_SUBSCRIBED | {"task_id": task_id}, websocket)
+
+
+async def _progress_unsubscribe(websocket: WebSocket, data: dict):
+    """Unsubscribe the socket from a task's progress updates."""
+    task_id = data.get("task_id")
+    topic = _topic(task_id)
+    if topic is None:
+        await _progress_invalid(websocket, data)
+        return
+    manager.unsubscribe_from_task(websocket, topic)
+    await manager.send_personal_message(_UNSUBSCRIBED | {"task_id": task_id}, websocket)
+
+
+async def _progress_invalid(websocket: WebSocket, data: dict):
+    """Reject an unknown progress action."""
+    await manager.send_personal_message(_PROGRESS_ERROR, websocket)
+
+
+async def _agent_message(websocket: WebSocket, data: dict):
+    """Relay a message to an agent and send back its reply."""
+    agent_name = data.get("agent_name")
+    content = data.get("content")
+    if not agent_name or not content:
+        await manager.send_personal_message(_AGENT_MISSING_FIELDS, websocket)
+        return
+
+    # Echo back for now (actual agent integration would go here)
+    await manager.send_personal_message(
+        _RESPONSE | {
+            "agent_name": agent_name,
+            "content": f"Agent {agent_name} received: {content}",
+            "timestamp": _now_iso()
+        },
+        websocket
+    )
+
+
+async def _agent_ping(websocket: WebSocket, data: dict):
+    """Answer a keepalive ping."""
+    await manager.send_personal_message(_PONG | {"timestamp": _now_iso()}, websocket)
+
+
+async def _agent_invalid(websocket: WebSocket, data: dict):
+    """Reject an unknown agent action."""
+    await manager.send_personal_message(_AGENT_ERROR, websocket)
+
+
+# Inbound "action" -> handler for each endpoint
+PROGRESS_HANDLERS: Dict[str, MessageHandler] = {
+    "subscribe": _progress_subscribe,
+    "unsubscribe": _progress_unsubscribe,
+}
+AGENT_HANDLERS: Dict[str, MessageHandler] = {
+    "message": _agent_message,
+    "ping": _agent_ping,
+}
+
+
+def _select_handler(
+    handlers: Dict[str, MessageHandler], data: dict, default: MessageHandler
+) -> MessageHandler:
+    """Look up the handler for a message's action, falling back to ``default``."""
+    action = data.get("action")
+    # Unhashable actions (lists, objects) are simply unknown
+    if not isinstance(action, str):
+        return default
+    return handlers.get(action, default)
+
+
 @router.websocket("/progress")
 async def websocket_progress(websocket: WebSocket, token: str = None):
     """
@@ -149,6 +665,9 @@ async def websocket_progress(websocket: WebSocket, token: str = None):
     Message format:
     - Subscribe: {"action": "subscribe", "task_id": "task_123"}
     - Unsubscribe: {"action": "unsubscribe", "task_id": "task_123"}
+    - Subscribe to every task under a dotted prefix of your own namespace:
+      {"action": "subscribe", "task_id": "user.<username>.*"}
+      (dots and percent signs in the username are percent-encoded, e.g. user.john%2Edoe.*)
 
     Progress updates: {"type": "progress", "task_id": "task_123", "data": {...}, "timestamp": "..."}
     """
@@ -165,26 +684,8 @@ async def websocket_progress(websocket: WebSocket, token: str = None):
         while True:
             # Receive messages from client
             data = await websocket.receive_json()
-            action = data.get("action")
-            task_id = data.get("task_id")
-
-            if action == "subscribe" and task_id:
-                manager.subscribe_to_task(websocket, task_id)
-                await manager.send_personal_message(
-                    {"type": "subscribed", "task_id": task_id},
-                    websocket
-                )
-            elif action == "unsubscribe" and task_id:
-                manager.unsubscribe_from_task(websocket, task_id)
-                await manager.send_personal_message(
-                    {"type": "unsubscribed", "task_id": task_id},
-                    websocket
-                )
-            else:
-                await manager.send_personal_message(
-                    {"type": "error", "message": "Invalid action or missing task_id"},
-                    websocket
-                )
+            handler = _select_handler(PROGRESS_HANDLERS, data, _progress_invalid)
+            await handler(websocket, data)
 
     except WebSocketDisconnect:
         manager.disconnect(websocket, user_id)
@@ -217,39 +718,8 @@ async def websocket_agent(websocket: WebSocket, token: str = None):
         while True:
             # Receive messages from client
             data = await websocket.receive_json()
-            action = data.get("action")
-
-            if action == "message":
-                agent_name = data.get("agent_name")
-                content = data.get("content")
-
-                if not agent_name or not content:
-                    await manager.send_personal_message(
-                        {"type": "error", "message": "Missing agent_name or content"},
-                        websocket
-                    )
-                    continue
-
-                # Echo back for now (actual agent integration would go here)
-                await manager.send_personal_message(
-                    {
-                        "type": "response",
-                        "agent_name": agent_name,
-                        "content": f"Agent {agent_name} received: {content}",
-                        "timestamp": datetime.now(timezone.utc).isoformat()
-                    },
-                    websocket
-                )
-            elif action == "ping":
-                await manager.send_personal_message(
-                    {"type": "pong", "timestamp": datetime.now(timezone.utc).isoformat()},
-                    websocket
-                )
-            else:
-                await manager.send_personal_message(
-                    {"type": "error", "message": "Invalid action"},
-                    websocket
-                )
+            handler = _select_handler(AGENT_HANDLERS, data, _agent_invalid)
+            await handler(websocket, data)
 
     except WebSocketDisconnect:
         manager.disconnect(websocket, user_id)
@@ -270,6 +740,6 @@ async def get_connections():
         "active_users": len(manager.active_connections),
         "total_connections": sum(len(conns) for conns in manager.active_connections.values()),
         "active_task_subscriptions": len(manager.task_connections),
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _now_iso()
     }
 
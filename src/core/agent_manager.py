@@ -2,8 +2,10 @@
 Agent Manager - AI agent lifecycle management with self-update capability
 """
 
+from array import array
 from typing import Dict, List, Optional, Any
 import logging
+import time
 
 
 class Agent:
@@ -19,7 +21,10 @@ class Agent:
         self.system_prompt = system_prompt
         self.capabilities = capabilities or []
         self.logger = logging.getLogger(f"agent.{name}")
-        self._memory: List[Dict[str, Any]] = []
+        # Conversation memory is stored column-wise; see ``memory``.
+        self._roles: List[str] = []
+        self._contents: List[str] = []
+        self._ts: array = array("d")
 
     async def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -33,6 +38,29 @@ class Agent:
         """
         raise NotImplementedError("Subclasses must implement process()")
 
+    @property
+    def memory(self) -> List[Dict[str, Any]]:
+        """Conversation memory as a list of ``role``/``content``/``timestamp`` dicts"""
+        return [
+            {"role": role, "content": content, "timestamp": ts}
+            for role, content, ts in zip(self._roles, self._contents, self._ts)
+        ]
+
+    def remember(
+        self,
+        role: str,
+        content: str,
+        timestamp: Optional[float] = None
+    ) -> None:
+        """Append a turn to the agent's conversation memory"""
+        self._roles.append(role)
+        self._contents.append(content)
+        self._ts.append(time.time() if timestamp is None else timestamp)
+
+    def messages_by_role(self, role: str) -> List[str]:
+        """Return the content of every remembered turn with the given role"""
+        return [c for r, c in zip(self._roles, self._contents) if r == role]
+
     def update_prompt(self, new_prompt: str) -> None:
         """Update agent's system prompt"""
         self.system_prompt = new_prompt
@@ -88,6 +116,36 @@ class AgentManager:
         self.logger.info(f"Agent {name} created")
         return agent
 
+    def create_agents_bulk(self, specs: List[Dict[str, Any]]) -> List[Agent]:
+        """
+        Create several agents at once
+
+        Either all agents are created or none are.
+
+        Args:
+            specs: Agent definitions with name, system_prompt and optional capabilities
+
+        Returns:
+            List of created agent instances
+
+        Raises:
+            ValueError: If a name is duplicated or already exists
+        """
+        names = [spec["name"] for spec in specs]
+        if len(set(names)) != len(names):
+            raise ValueError("Duplicate agent names in batch")
+        existing = [name for name in names if name in self.agents]
+        if existing:
+            raise ValueError(f"Agents already exist: {', '.join(existing)}")
+
+        agents = [
+            Agent(spec["name"], spec["system_prompt"], spec.get("capabilities"))
+            for spec in specs
+        ]
+        self.agents.update((agent.name, agent) for agent in agents)
+        self.logger.info(f"{len(agents)} agents created")
+        return agents
+
     def get_agent(self, name: str) -> Optional[Agent]:
         """
         Get an agent by name
@@ -149,6 +207,20 @@ class AgentManager:
             self.logger.warning(f"Agent {name} not found")
             return False
 
+    def delete_agents_bulk(self, names: List[str]) -> List[str]:
+        """
+        Delete several agents at once
+
+        Args:
+            names: Agent names
+
+        Returns:
+            Names of the agents that were deleted
+        """
+        deleted = [name for name in names if self.agents.pop(name, None) is not None]
+        self.logger.info(f"{len(deleted)} agents deleted")
+        return deleted
+
     def list_agents(self) -> List[str]:
         """
         List all agents
@@ -157,3 +229,12 @@ class AgentManager:
             List of agent names
         """
         return list(self.agents.keys())
+
+    def list_agents_full(self) -> List[Agent]:
+        """
+        List all agents with their details
+
+        Returns:
+            List of agent instances
+        """
+        return list(self.agents.values())
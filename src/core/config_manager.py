@@ -3,11 +3,18 @@ Config Manager - Dynamic configuration with hot-reload
 """
 
 import json
+import mmap
+import re
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import logging
 
 
+# One KEY=value pair per line: surrounding whitespace is dropped, comment
+# lines (starting with "#") and lines without "=" never match
+ENV_LINE_PATTERN = re.compile(rb"(?m)^[^\S\n]*([^#\s=][^=\n]*?)?[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$")
+
+
 class ConfigManager:
     """
     Configuration Manager with hot-reload capability
@@ -23,32 +30,46 @@ class ConfigManager:
         self.config_path = Path(config_path)
         self.config: Dict[str, Any] = {}
         self.logger = logging.getLogger("config_manager")
+        # (mtime_ns, size, inode) of the file as last parsed
+        self._file_signature: Optional[Tuple[int, int, int]] = None
         self.load_config()
 
     def load_config(self) -> bool:
         """
         Load configuration from file
 
+        The file is not re-parsed if it is unchanged since the last load and
+        no value has been overridden with ``set`` in the meantime.
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            if self.config_path.exists():
-                with open(self.config_path, "r") as f:
-                    # Simple key=value parser for .env files
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#"):
-                            if "=" in line:
-                                key, value = line.split("=", 1)
-                                self.config[key.strip()] = value.strip()
-
-                self.logger.info("Configuration loaded successfully")
-                return True
-            else:
+            try:
+                stat = self.config_path.stat()
+            except FileNotFoundError:
+                self._file_signature = None
                 self.logger.warning(f"Config file {self.config_path} not found")
                 return False
 
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            if signature == self._file_signature:
+                self.logger.debug("Configuration unchanged, skipping reload")
+                return True
+
+            with open(self.config_path, "rb") as f:
+                # Simple key=value parser for .env files, scanned in one regex pass
+                if stat.st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        pairs = ENV_LINE_PATTERN.findall(content)
+                    self.config.update(
+                        (key.decode(), value.decode()) for key, value in pairs
+                    )
+
+            self._file_signature = signature
+            self.logger.info("Configuration loaded successfully")
+            return True
+
         except Exception as e:
             self.logger.error(f"Failed to load configuration: {e}")
             return False
@@ -85,6 +106,8 @@ class ConfigManager:
             value: Configuration value
         """
         self.config[key] = value
+        # In-memory state now differs from the file; re-read it on next load
+        self._file_signature = None
         self.logger.debug(f"Config {key} set to {value}")
 
     def get_all(self) -> Dict[str, Any]:
@@ -4,13 +4,18 @@ Plugin Configuration Schema
 This module provides configuration schema support for plugins.
 """
 
-import json
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import yaml
+from pydantic_core import from_json, to_json
+
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
 
 
 class ConfigFieldType(Enum):
@@ -24,6 +29,17 @@ class ConfigFieldType(Enum):
     DICT = "dict"
 
 
+# Python type(s) accepted for each field type
+_TYPE_MAP: Dict[ConfigFieldType, Union[Type[Any], tuple[Type[Any], ...]]] = {
+    ConfigFieldType.STRING: str,
+    ConfigFieldType.INTEGER: int,
+    ConfigFieldType.FLOAT: (int, float),
+    ConfigFieldType.BOOLEAN: bool,
+    ConfigFieldType.LIST: list,
+    ConfigFieldType.DICT: dict,
+}
+
+
 @dataclass
 class ConfigField:
     """Configuration field definition"""
@@ -46,16 +62,7 @@ class ConfigField:
             True if valid, False otherwise
         """
         # Check type
-        type_map: Dict[ConfigFieldType, Union[Type[Any], tuple[Type[Any], ...]]] = {
-            ConfigFieldType.STRING: str,
-            ConfigFieldType.INTEGER: int,
-            ConfigFieldType.FLOAT: (int, float),
-            ConfigFieldType.BOOLEAN: bool,
-            ConfigFieldType.LIST: list,
-            ConfigFieldType.DICT: dict,
-        }
-
-        expected_type = type_map[self.field_type]
+        expected_type = _TYPE_MAP[self.field_type]
         if not isinstance(value, expected_type):
             return False
 
@@ -136,25 +143,35 @@ class PluginConfig:
         self.schema = schema or PluginConfigSchema()
         self.config_dir = Path(config_dir)
         self.config: Dict[str, Any] = {}
+        # (path, mtime_ns, size, inode) of the file as last parsed
+        self._file_signature: Optional[Tuple[Path, int, int, int]] = None
         self._load_config()
 
     def _load_config(self) -> None:
-        """Load configuration from file"""
-        # Try JSON first
-        json_path = self.config_dir / f"{self.plugin_name}.json"
-        if json_path.exists():
-            with open(json_path, "r") as f:
-                self.config = json.load(f)
-            return
+        """Load configuration from file, skipping the parse if it is unchanged"""
+        # Try JSON first, then YAML
+        for suffix in ("json", "yaml"):
+            path = self.config_dir / f"{self.plugin_name}.{suffix}"
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            signature = (path, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            if signature == self._file_signature:
+                return
 
-        # Try YAML
-        yaml_path = self.config_dir / f"{self.plugin_name}.yaml"
-        if yaml_path.exists():
-            with open(yaml_path, "r") as f:
-                self.config = yaml.safe_load(f) or {}
+            if suffix == "json":
+                with open(path, "rb") as f:
+                    self.config = from_json(f.read())
+            else:
+                with open(path, "r") as f:
+                    self.config = yaml.load(f, Loader=SafeLoader) or {}
+            self._file_signature = signature
             return
 
         # Use defaults if no config file found
+        self._file_signature = None
         self.config = self.schema.get_defaults()
 
     def validate(self) -> tuple[bool, List[str]]:
@@ -188,6 +205,8 @@ class PluginConfig:
             value: Configuration value
         """
         self.config[key] = value
+        # In-memory state now differs from the file; re-read it on next load
+        self._file_signature = None
 
     def reload(self) -> bool:
         """
@@ -220,12 +239,14 @@ class PluginConfig:
 
             if format == "json":
                 path = self.config_dir / f"{self.plugin_name}.json"
-                with open(path, "w") as f:
-                    json.dump(self.config, f, indent=2)
+                with open(path, "wb") as f:
+                    f.write(to_json(self.config, indent=2))
             elif format == "yaml":
                 path = self.config_dir / f"{self.plugin_name}.yaml"
                 with open(path, "w") as f:
-                    yaml.dump(self.config, f, default_flow_style=False)
+                    yaml.dump(
+                        self.config, f, Dumper=SafeDumper, default_flow_style=False
+                    )
             else:
                 raise ValueError(f"Unsupported format: {format}")
 
@@ -4,12 +4,64 @@ Plugin Dependency Management
 This module provides dependency resolution for plugins.
 """
 
-from typing import List, Dict, Set, Optional, Tuple
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+import heapq
 import re
 
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.version import Version
 
-@dataclass
+
+# Dependency string: name[operator][version]
+DEPENDENCY_PATTERN = re.compile(r"^([a-zA-Z0-9_-]+)(>=|<=|==|>|<)?(.+)?$")
+
+
+@lru_cache(maxsize=1024)
+def _parse_dependency(dep_string: str) -> Tuple[str, Optional[str]]:
+    """Split a dependency string into its name and version constraint."""
+    match = DEPENDENCY_PATTERN.match(dep_string.strip())
+
+    if not match:
+        raise ValueError(f"Invalid dependency string: {dep_string}")
+
+    name = match.group(1)
+    operator = match.group(2)
+    version = match.group(3)
+
+    version_constraint = None
+    if operator and version:
+        version_constraint = f"{operator}{version}"
+
+    return name, version_constraint
+
+
+@lru_cache(maxsize=1024)
+def _specifier(constraint: str) -> Optional[SpecifierSet]:
+    """Parse a version constraint, or return None if it is not a valid specifier."""
+    try:
+        return SpecifierSet(constraint)
+    except InvalidSpecifier:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _check_version(constraint: Optional[str], version: str) -> bool:
+    """Check a version against a constraint string such as ">=1.0.0"."""
+    if not constraint:
+        return True
+
+    specifier = _specifier(constraint)
+    # Constraints that cannot be parsed do not restrict the version
+    if specifier is None:
+        return True
+
+    # Versions compare as PEP 440 releases, so "1.0" == "1.0.0"
+    return specifier.contains(Version(version), prereleases=True)
+
+
+@dataclass(frozen=True, slots=True)
 class PluginDependency:
     """Plugin dependency specification"""
     name: str
@@ -26,21 +78,7 @@ class PluginDependency:
         Returns:
             PluginDependency instance
         """
-        # Match pattern: name[operator][version]
-        pattern = r"^([a-zA-Z0-9_-]+)(>=|<=|==|>|<)?(.+)?$"
-        match = re.match(pattern, dep_string.strip())
-
-        if not match:
-            raise ValueError(f"Invalid dependency string: {dep_string}")
-
-        name = match.group(1)
-        operator = match.group(2)
-        version = match.group(3)
-
-        version_constraint = None
-        if operator and version:
-            version_constraint = f"{operator}{version}"
-
+        name, version_constraint = _parse_dependency(dep_string)
         return cls(name=name, version_constraint=version_constraint)
 
     def check_version(self, version: str) -> bool:
@@ -53,40 +91,7 @@ class PluginDependency:
         Returns:
             True if version satisfies constraint
         """
-        if not self.version_constraint:
-            return True
-
-        # Parse constraint
-        pattern = r"^(>=|<=|==|>|<)(.+)$"
-        match = re.match(pattern, self.version_constraint)
-
-        if not match:
-            return True
-
-        operator = match.group(1)
-        required_version = match.group(2)
-
-        # Simple version comparison (assumes semantic versioning)
-        version_parts = [int(x) for x in version.split(".")]
-        required_parts = [int(x) for x in required_version.split(".")]
-
-        # Pad to same length
-        max_len = max(len(version_parts), len(required_parts))
-        version_parts += [0] * (max_len - len(version_parts))
-        required_parts += [0] * (max_len - len(required_parts))
-
-        if operator == "==":
-            return version_parts == required_parts
-        elif operator == ">=":
-            return version_parts >= required_parts
-        elif operator == "<=":
-            return version_parts <= required_parts
-        elif operator == ">":
-            return version_parts > required_parts
-        elif operator == "<":
-            return version_parts < required_parts
-
-        return True
+        return _check_version(self.version_constraint, version)
 
 
 class DependencyResolver:
@@ -98,6 +103,10 @@ class DependencyResolver:
 
     def __init__(self) -> None:
         self.plugins: Dict[str, Tuple[str, List[PluginDependency]]] = {}
+        # check_dependencies results, valid until the plugin set changes
+        self._dependency_cache: Dict[str, Tuple[bool, List[str]]] = {}
+        # resolve_load_order result, valid until the plugin set changes
+        self._load_order_cache: Optional[Tuple[bool, List[str], List[str]]] = None
 
     def add_plugin(
         self,
@@ -115,6 +124,9 @@ class DependencyResolver:
         """
         parsed_deps = [PluginDependency.parse(dep) for dep in dependencies]
         self.plugins[name] = (version, parsed_deps)
+        # Any added plugin can satisfy (or change) another plugin's dependencies
+        self._dependency_cache.clear()
+        self._load_order_cache = None
 
     def check_dependencies(self, plugin_name: str) -> Tuple[bool, List[str]]:
         """
@@ -129,6 +141,11 @@ class DependencyResolver:
         if plugin_name not in self.plugins:
             return False, [f"Plugin {plugin_name} not found"]
 
+        cached = self._dependency_cache.get(plugin_name)
+        if cached is not None:
+            satisfied, missing = cached
+            return satisfied, list(missing)
+
         _, dependencies = self.plugins[plugin_name]
         missing = []
 
@@ -144,7 +161,8 @@ class DependencyResolver:
                     f"{dep.name} (requires {constraint}, found {dep_version})"
                 )
 
-        return len(missing) == 0, missing
+        self._dependency_cache[plugin_name] = (len(missing) == 0, missing)
+        return len(missing) == 0, list(missing)
 
     def resolve_load_order(self) -> Tuple[bool, List[str], List[str]]:
         """
@@ -153,36 +171,42 @@ class DependencyResolver:
         Returns:
             Tuple of (success, load_order, errors)
         """
-        # Build dependency graph
-        graph: Dict[str, Set[str]] = {}
-        in_degree: Dict[str, int] = {}
-
-        for plugin_name in self.plugins:
-            graph[plugin_name] = set()
-            in_degree[plugin_name] = 0
+        if self._load_order_cache is None:
+            self._load_order_cache = self._sort_plugins()
+        success, load_order, errors = self._load_order_cache
+        return success, list(load_order), list(errors)
+
+    def _sort_plugins(self) -> Tuple[bool, List[str], List[str]]:
+        """Topologically sort the registered plugins"""
+        # Build dependency graph; every edge is listed once per in-degree count,
+        # so a dependency named twice is also released twice
+        graph: Dict[str, List[str]] = {name: [] for name in self.plugins}
+        in_degree: Dict[str, int] = dict.fromkeys(self.plugins, 0)
 
         for plugin_name, (_, dependencies) in self.plugins.items():
             for dep in dependencies:
                 if dep.name in self.plugins:
-                    graph[dep.name].add(plugin_name)
+                    graph[dep.name].append(plugin_name)
                     in_degree[plugin_name] += 1
 
-        # Topological sort (Kahn's algorithm)
-        queue = [name for name, degree in in_degree.items() if degree == 0]
+        # Topological sort (Kahn's algorithm); ready plugins are taken in name
+        # order so the result does not depend on registration order
+        ready = [name for name, degree in in_degree.items() if degree == 0]
+        heapq.heapify(ready)
         load_order = []
 
-        while queue:
-            current = queue.pop(0)
+        while ready:
+            current = heapq.heappop(ready)
             load_order.append(current)
 
             for neighbor in graph[current]:
                 in_degree[neighbor] -= 1
                 if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
+                    heapq.heappush(ready, neighbor)
 
         # Check for circular dependencies
         if len(load_order) != len(self.plugins):
-            remaining = set(self.plugins.keys()) - set(load_order)
+            remaining = sorted(set(self.plugins.keys()) - set(load_order))
             errors = [f"Circular dependency detected involving: {', '.join(remaining)}"]
             return False, [], errors
 
@@ -202,18 +226,17 @@ class DependencyResolver:
             return {}
 
         tree: Dict[str, List[str]] = {}
-        visited: Set[str] = set()
+        # Depth-first with an explicit stack so deep chains cannot hit the recursion limit
+        stack = [plugin_name]
 
-        def build_tree(name: str) -> None:
-            if name in visited or name not in self.plugins:
-                return
+        while stack:
+            name = stack.pop()
+            if name in tree or name not in self.plugins:
+                continue
 
-            visited.add(name)
             _, dependencies = self.plugins[name]
             tree[name] = [dep.name for dep in dependencies]
+            # Reversed so dependencies are visited in their listed order
+            stack.extend(reversed(tree[name]))
 
-            for dep in dependencies:
-                build_tree(dep.name)
-
-        build_tree(plugin_name)
         return tree
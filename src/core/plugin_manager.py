@@ -8,7 +8,7 @@ import importlib
 import logging
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from src.core.plugin_config import PluginConfig, PluginConfigSchema
 from src.core.plugin_dependency import DependencyResolver
@@ -176,14 +176,13 @@ class PluginManager:
             # Call unload hook
             plugin.on_unload()
 
-            # Clear module cache
+            # Re-execute the plugin module in place, importing it if it was dropped
             module_name = plugin.__module__
-            if module_name in sys.modules:
-                del sys.modules[module_name]
-
-            # Reimport module
-            module = importlib.import_module(module_name)
-            importlib.reload(module)
+            module = sys.modules.get(module_name)
+            if module is not None:
+                module = importlib.reload(module)
+            else:
+                module = importlib.import_module(module_name)
 
             # Get new plugin class
             plugin_class = getattr(module, plugin.__class__.__name__)
@@ -220,6 +219,15 @@ class PluginManager:
         """
         return list(self.plugins.keys())
 
+    def iter_plugins(self) -> Iterable[Plugin]:
+        """
+        Iterate over all loaded plugin instances
+
+        Returns:
+            Iterable of loaded plugins
+        """
+        return self.plugins.values()
+
     def get_plugin(self, plugin_name: str) -> Optional[Plugin]:
         """
         Get a plugin instance
@@ -1,9 +1,16 @@
-"""Base database configuration and declarative base"""
+"""Base database configuration and declarative base
 
+Runtime code should share one long-lived DatabaseManager (created in the
+FastAPI lifespan) so its connection pool is reused across requests. The
+NullPool used in alembic/env.py is only appropriate for one-shot migration
+runs and should not be copied into runtime code.
+"""
+
+import asyncio
 import os
 from datetime import datetime
 
-from sqlalchemy import DateTime, create_engine
+from sqlalchemy import DateTime, create_engine, make_url, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, sessionmaker
 
 
@@ -25,15 +32,31 @@ class TimestampMixin:
 class DatabaseManager:
     """Database connection and session management"""
 
-    def __init__(self, database_url: str, echo: bool = False) -> None:
+    def __init__(
+        self,
+        database_url: str,
+        echo: bool = False,
+        pool_size: int = 10,
+        max_overflow: int = 5,
+        pool_recycle: int = 300,
+    ) -> None:
         """
         Initialize database manager
 
         Args:
             database_url: Database connection URL
             echo: Whether to echo SQL statements
+            pool_size: Number of pooled connections kept open (ignored for SQLite)
+            max_overflow: Extra connections allowed above pool_size (ignored for SQLite)
+            pool_recycle: Seconds after which pooled connections are recycled
         """
-        self.engine = create_engine(database_url, echo=echo, pool_pre_ping=True)
+        engine_kwargs: dict = {"echo": echo, "pool_pre_ping": True, "pool_recycle": pool_recycle}
+        if make_url(database_url).get_backend_name() != "sqlite":
+            # SQLite uses its own pool classes which reject QueuePool sizing
+            engine_kwargs.update(
+                pool_size=pool_size, max_overflow=max_overflow, pool_use_lifo=True
+            )
+        self.engine = create_engine(database_url, **engine_kwargs)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
     def create_tables(self) -> None:
@@ -48,15 +71,38 @@ class DatabaseManager:
         """Get a new database session"""
         return self.SessionLocal()
 
+    def warm_pool(self, connections: int) -> None:
+        """
+        Open pooled connections ahead of the first requests
+
+        All connections are held open together so the pool ends up with that
+        many distinct connections, then returned to it.
+
+        Args:
+            connections: Number of connections to open
+        """
+        opened = []
+        try:
+            for _ in range(connections):
+                conn = self.engine.connect()
+                opened.append(conn)
+                conn.execute(text("SELECT 1"))
+        finally:
+            for conn in opened:
+                conn.close()
+
 
 # Global database manager instance
 _db_manager: DatabaseManager | None = None
 
 
-def get_db():
+async def get_db():
     """
     Get database session dependency for FastAPI.
 
+    Declared async so FastAPI runs it on the event loop instead of the
+    threadpool; only the blocking close is offloaded.
+
     Yields:
         Database session
     """
@@ -69,4 +115,4 @@ def get_db():
     try:
         yield session
     finally:
-        session.close()
+        await asyncio.to_thread(session.close)
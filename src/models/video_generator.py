@@ -98,6 +98,7 @@ class VideoGenerator:
         image_path: str,
         output_path: Optional[str] = None,
         speaker_wav: Optional[str] = None,
+        mode: Optional[GenerationMode] = None,
     ) -> str:
         """
         Generate video from text and image.
@@ -107,6 +108,7 @@ class VideoGenerator:
             image_path: Path to face image
             output_path: Path to save output video (optional)
             speaker_wav: Path to speaker reference audio for voice cloning (optional)
+            mode: Generation mode for this call (defaults to ``self.mode``)
 
         Returns:
             Path to generated video file
@@ -126,7 +128,7 @@ class VideoGenerator:
         )
 
         try:
-            return self.generate_from_audio(image_path, audio_path, output_path)
+            return self.generate_from_audio(image_path, audio_path, output_path, mode=mode)
         finally:
             if os.path.exists(audio_path):
                 os.remove(audio_path)
@@ -136,6 +138,7 @@ class VideoGenerator:
         image_path: str,
         audio_path: str,
         output_path: Optional[str] = None,
+        mode: Optional[GenerationMode] = None,
     ) -> str:
         """
         Generate video from audio and image.
@@ -144,6 +147,7 @@ class VideoGenerator:
             image_path: Path to face image
             audio_path: Path to audio file
             output_path: Path to save output video (optional)
+            mode: Generation mode for this call (defaults to ``self.mode``)
 
         Returns:
             Path to generated video file
@@ -161,16 +165,19 @@ class VideoGenerator:
         if output_path is None:
             output_path = tempfile.mktemp(suffix=".mp4")
 
-        if self.mode == GenerationMode.LIPSYNC:
+        if mode is None:
+            mode = self.mode
+
+        if mode == GenerationMode.LIPSYNC:
             return self._generate_lipsync(image_path, audio_path, output_path)
-        elif self.mode == GenerationMode.TALKING_HEAD:
+        elif mode == GenerationMode.TALKING_HEAD:
             return self._generate_talking_head(image_path, audio_path, output_path)
-        elif self.mode == GenerationMode.ENHANCED_LIPSYNC:
+        elif mode == GenerationMode.ENHANCED_LIPSYNC:
             return self._generate_enhanced_lipsync(image_path, audio_path, output_path)
-        elif self.mode == GenerationMode.ENHANCED_TALKING_HEAD:
+        elif mode == GenerationMode.ENHANCED_TALKING_HEAD:
             return self._generate_enhanced_talking_head(image_path, audio_path, output_path)
         else:
-            raise ValueError(f"Unsupported mode: {self.mode}")
+            raise ValueError(f"Unsupported mode: {mode}")
 
     def _generate_lipsync(
         self, image_path: str, audio_path: str, output_path: str
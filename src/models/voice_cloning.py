@@ -19,7 +19,7 @@ import os
 import tempfile
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Set
 from datetime import datetime
 
 import torch
@@ -81,7 +81,7 @@ class VoiceCloner:
         self.min_samples = min_samples
         self.sample_rate = sample_rate
 
-    def validate_audio_samples(self, sample_paths: List[str]) -> bool:
+    def validate_audio_samples(self, sample_paths: Sequence[str]) -> bool:
         """
         Validate audio samples for voice cloning.
 
@@ -99,8 +99,15 @@ class VoiceCloner:
                 f"At least {self.min_samples} samples required, got {len(sample_paths)}"
             )
 
+        # Samples usually share a directory; list each directory once instead
+        # of stat-ing every sample
+        listings: Dict[str, Set[str]] = {}
         for path in sample_paths:
-            if not os.path.exists(path):
+            directory, filename = os.path.split(path)
+            names = listings.get(directory)
+            if names is None:
+                names = listings[directory] = self._list_directory(directory or ".")
+            if filename not in names:
                 raise ValueError(f"Sample file not found: {path}")
 
             # Check file extension
@@ -109,10 +116,27 @@ class VoiceCloner:
 
         return True
 
+    @staticmethod
+    def _list_directory(directory: str) -> Set[str]:
+        """
+        List entry names in a directory.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Set of entry names, empty if the directory cannot be read
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries}
+        except OSError:
+            return set()
+
     def create_profile(
         self,
         name: str,
-        sample_paths: List[str],
+        sample_paths: Sequence[str],
         description: str = "",
         metadata: Optional[Dict[str, Any]] = None,
     ) -> VoiceProfile:
@@ -143,7 +167,7 @@ class VoiceCloner:
         profile = VoiceProfile(
             name=name,
             description=description,
-            sample_paths=sample_paths,
+            sample_paths=list(sample_paths),
             metadata=metadata or {},
         )
 
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Tuple, Optional
 import logging
 
+import numpy as np
 from PIL import Image, ImageEnhance, ImageFilter
 from src.core.plugin_manager import Plugin
 from src.core.plugin_config import (
@@ -16,6 +17,12 @@ from src.core.plugin_config import (
     ConfigFieldType,
 )
 
+try:
+    # libjpeg-turbo bindings; JPEG output falls back to Pillow without them
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
 
 class ImageProcessor(Plugin):
     """Image preprocessing and enhancement plugin"""
@@ -70,6 +77,43 @@ class ImageProcessor(Plugin):
             f"Processed {self._state['processed_count']} images"
         )
 
+    def _save_image(
+        self,
+        img: Image.Image,
+        output_path: str,
+        format: str,
+        quality: Optional[int] = None
+    ) -> None:
+        """
+        Save an image, using simplejpeg (libjpeg-turbo) for JPEG when available
+
+        Args:
+            img: Image to save
+            output_path: Path to output image
+            format: Output format (e.g., "PNG", "JPEG")
+            quality: JPEG quality (None = encoder default)
+        """
+        if format == "JPG":
+            format = "JPEG"
+
+        if simplejpeg is not None and format == "JPEG" and img.mode in ("RGB", "L"):
+            pixels = np.asarray(img)
+            if img.mode == "L":
+                pixels = pixels[:, :, np.newaxis]
+            jpeg_bytes = simplejpeg.encode_jpeg(
+                pixels,
+                quality=quality if quality is not None else 75,
+                colorspace="RGB" if img.mode == "RGB" else "GRAY",
+                fastdct=True
+            )
+            Path(output_path).write_bytes(jpeg_bytes)
+            return
+
+        if quality is not None:
+            img.save(output_path, format=format, quality=quality)
+        else:
+            img.save(output_path, format=format)
+
     def resize(
         self,
         input_path: str,
@@ -102,7 +146,7 @@ class ImageProcessor(Plugin):
             if not format_ext:
                 format_ext = self._get_config("default_format", "PNG")
 
-            img.save(output_path, format=format_ext)
+            self._save_image(img, output_path, format_ext)
             self._state["processed_count"] += 1
 
             self.logger.info(f"Resized image: {input_path} -> {output_path}")
@@ -138,7 +182,7 @@ class ImageProcessor(Plugin):
             if not format_ext:
                 format_ext = self._get_config("default_format", "PNG")
 
-            cropped.save(output_path, format=format_ext)
+            self._save_image(cropped, output_path, format_ext)
             self._state["processed_count"] += 1
 
             self.logger.info(f"Cropped image: {input_path} -> {output_path}")
@@ -196,7 +240,7 @@ class ImageProcessor(Plugin):
             if not format_ext:
                 format_ext = self._get_config("default_format", "PNG")
 
-            img.save(output_path, format=format_ext)
+            self._save_image(img, output_path, format_ext)
             self._state["processed_count"] += 1
 
             self.logger.info(f"Enhanced image: {input_path} -> {output_path}")
@@ -246,9 +290,9 @@ class ImageProcessor(Plugin):
             # Save with quality setting for JPEG
             if target_format == "JPEG":
                 quality = self._get_config("default_quality", 95)
-                img.save(output_path, format=target_format, quality=quality)
+                self._save_image(img, output_path, target_format, quality)
             else:
-                img.save(output_path, format=target_format)
+                self._save_image(img, output_path, target_format)
 
             self._state["processed_count"] += 1
 
@@ -297,7 +341,7 @@ class ImageProcessor(Plugin):
             if not format_ext:
                 format_ext = self._get_config("default_format", "PNG")
 
-            filtered.save(output_path, format=format_ext)
+            self._save_image(filtered, output_path, format_ext)
             self._state["processed_count"] += 1
 
             self.logger.info(f"Applied {filter_type} filter: {input_path} -> {output_path}")
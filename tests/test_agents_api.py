@@ -41,6 +41,7 @@ def mock_agent_manager(sample_agent):
     """Create mock agent manager."""
     manager = Mock(spec=AgentManager)
     manager.list_agents = Mock(return_value=["test-agent"])
+    manager.list_agents_full = Mock(return_value=[sample_agent])
     manager.get_agent = Mock(return_value=sample_agent)
     manager.create_agent = Mock(return_value=sample_agent)
     manager.update_agent = Mock(return_value=sample_agent)
@@ -123,7 +124,7 @@ def test_create_agent_unauthorized():
     assert response.status_code == 401
 
 
-def test_list_agents(client, auth_token):
+def test_list_agents(client, auth_token, mock_agent_manager):
     """Test listing all agents."""
     response = client.get(
         "/api/v1/agents/list",
@@ -135,11 +136,12 @@ def test_list_agents(client, auth_token):
     assert data["total"] == 1
     assert len(data["agents"]) == 1
     assert data["agents"][0]["name"] == "test-agent"
+    mock_agent_manager.get_agent.assert_not_called()
 
 
 def test_list_agents_empty(client, auth_token, mock_agent_manager):
     """Test listing agents when none exist."""
-    mock_agent_manager.list_agents.return_value = []
+    mock_agent_manager.list_agents_full.return_value = []
 
     response = client.get(
         "/api/v1/agents/list",
@@ -267,7 +269,7 @@ def test_create_agent_exception(client, auth_token, mock_agent_manager):
 
 def test_list_agents_exception(client, auth_token, mock_agent_manager):
     """Test listing agents with exception."""
-    mock_agent_manager.list_agents.side_effect = Exception("Test error")
+    mock_agent_manager.list_agents_full.side_effect = Exception("Test error")
 
     response = client.get(
         "/api/v1/agents/list",
@@ -292,3 +294,87 @@ def test_update_agent_exception(client, auth_token, mock_agent_manager):
 
     assert response.status_code == 500
     assert "Failed to update agent" in response.json()["detail"]
+
+
+def test_create_agents_batch(client, auth_token, mock_agent_manager, sample_agent):
+    """Test creating several agents in one request."""
+    second_agent = Agent(name="second-agent", system_prompt="Second prompt")
+    mock_agent_manager.create_agents_bulk = Mock(return_value=[sample_agent, second_agent])
+
+    response = client.post(
+        "/api/v1/agents/batch",
+        json={
+            "agents": [
+                {"name": "test-agent", "system_prompt": "You are a helpful assistant"},
+                {"name": "second-agent", "system_prompt": "Second prompt"}
+            ]
+        },
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["total"] == 2
+    assert [a["name"] for a in data["agents"]] == ["test-agent", "second-agent"]
+    mock_agent_manager.create_agents_bulk.assert_called_once()
+
+
+def test_create_agents_batch_conflict(client, auth_token, mock_agent_manager):
+    """Test batch creation rejected by the manager."""
+    mock_agent_manager.create_agents_bulk = Mock(
+        side_effect=ValueError("Agents already exist: test-agent")
+    )
+
+    response = client.post(
+        "/api/v1/agents/batch",
+        json={"agents": [{"name": "test-agent", "system_prompt": "Prompt"}]},
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    assert response.status_code == 400
+    assert "already exist" in response.json()["detail"]
+
+
+def test_create_agents_batch_too_large(client, auth_token):
+    """Test batch creation is capped at 32 agents."""
+    response = client.post(
+        "/api/v1/agents/batch",
+        json={
+            "agents": [
+                {"name": f"agent-{i}", "system_prompt": "Prompt"} for i in range(33)
+            ]
+        },
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    assert response.status_code == 422
+
+
+def test_create_agents_batch_exception(client, auth_token, mock_agent_manager):
+    """Test batch creation with unexpected exception."""
+    mock_agent_manager.create_agents_bulk = Mock(side_effect=Exception("Test error"))
+
+    response = client.post(
+        "/api/v1/agents/batch",
+        json={"agents": [{"name": "test-agent", "system_prompt": "Prompt"}]},
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    assert response.status_code == 500
+    assert "Failed to create agents" in response.json()["detail"]
+
+
+def test_delete_agents_batch(client, auth_token, mock_agent_manager):
+    """Test deleting several agents in one request."""
+    mock_agent_manager.delete_agents_bulk = Mock(return_value=["test-agent"])
+
+    response = client.post(
+        "/api/v1/agents/batch/delete",
+        json={"names": ["test-agent", "missing-agent"]},
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["deleted"] == ["test-agent"]
+    assert data["not_found"] == ["missing-agent"]
@@ -0,0 +1,37 @@
+"""
+Tests for the FastAPI application factory and lifespan.
+"""
+from fastapi.testclient import TestClient
+
+from src.api.main import create_app
+
+
+def test_lifespan_prebuilds_openapi_schema(tmp_path, monkeypatch):
+    """Test the OpenAPI schema is generated during startup."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'app.db'}")
+    app = create_app()
+    assert app.openapi_schema is None
+
+    with TestClient(app) as client:
+        schema = app.openapi_schema
+        assert schema is not None
+        assert "/api/v1/scheduler/list" in schema["paths"]
+
+        response = client.get("/openapi.json")
+        assert response.status_code == 200
+        assert app.openapi_schema is schema
+
+
+def test_routers_imported_lazily():
+    """Test importing the API package does not import every router."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, src.api.main; "
+        "assert 'src.api.voice' not in sys.modules; "
+        "from src.api.main import app; "
+        "assert 'src.api.voice' in sys.modules; "
+        "assert src.api.main.app is app"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,60 @@
+"""
+Tests for the in-memory response cache.
+"""
+from unittest.mock import patch
+
+from src.api.main import create_app
+from src.api.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test ResponseCache behaviour."""
+
+    def test_get_missing(self):
+        """Test getting an entry that was never cached."""
+        cache = ResponseCache()
+        assert cache.get("ns", "key") is None
+
+    def test_set_and_get(self):
+        """Test caching and retrieving a value."""
+        cache = ResponseCache()
+        cache.set("ns", "key", {"value": 1})
+        assert cache.get("ns", "key") == {"value": 1}
+
+    def test_entry_expires(self):
+        """Test entries are dropped after the TTL."""
+        cache = ResponseCache(ttl_seconds=10)
+        with patch("src.api.response_cache.time.monotonic", return_value=100.0):
+            cache.set("ns", "key", "value")
+        with patch("src.api.response_cache.time.monotonic", return_value=109.0):
+            assert cache.get("ns", "key") == "value"
+        with patch("src.api.response_cache.time.monotonic", return_value=110.0):
+            assert cache.get("ns", "key") is None
+
+    def test_invalidate_namespace(self):
+        """Test invalidating one namespace leaves others intact."""
+        cache = ResponseCache()
+        cache.set("user:1", "list", "a")
+        cache.set("user:1", 5, "b")
+        cache.set("user:2", "list", "c")
+
+        cache.invalidate("user:1")
+
+        assert cache.get("user:1", "list") is None
+        assert cache.get("user:1", 5) is None
+        assert cache.get("user:2", "list") == "c"
+
+    def test_max_entries(self):
+        """Test the cache is reset when it reaches its size cap."""
+        cache = ResponseCache(max_entries=2)
+        cache.set("ns", 1, "a")
+        cache.set("ns", 2, "b")
+        cache.set("ns", 3, "c")
+
+        assert cache.get("ns", 1) is None
+        assert cache.get("ns", 3) == "c"
+
+    def test_app_has_response_cache(self):
+        """Test create_app attaches a cache to application state."""
+        app = create_app()
+        assert isinstance(app.state.response_cache, ResponseCache)
@@ -2,13 +2,16 @@
 Tests for WebSocket endpoints.
 """
 import pytest
+from fastapi import WebSocketDisconnect
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch, AsyncMock
+import asyncio
 import json
 from datetime import datetime, timedelta
+from fnmatch import fnmatchcase
 
 from src.api.main import create_app
-from src.api.websocket import ConnectionManager, manager, get_current_user_ws
+from src.api.websocket import ConnectionManager, manager, get_current_user_ws, user_namespace
 from src.api.auth_utils import create_access_token
 
 
@@ -51,6 +54,71 @@ class TestConnectionManager:
         assert user_id in connection_manager.active_connections
         assert websocket in connection_manager.active_connections[user_id]
 
+    @pytest.mark.asyncio
+    async def test_connect_rejects_over_user_limit(self, connection_manager):
+        """Test that a user cannot exceed the per-user connection limit."""
+        with patch("src.api.websocket.MAX_CONNECTIONS_PER_USER", 2):
+            for _ in range(2):
+                await connection_manager.connect(AsyncMock(), "test_user")
+            rejected = AsyncMock()
+
+            with pytest.raises(WebSocketDisconnect):
+                await connection_manager.connect(rejected, "test_user")
+
+            # Other users are unaffected
+            await connection_manager.connect(AsyncMock(), "other_user")
+
+        rejected.accept.assert_not_called()
+        rejected.close.assert_called_once_with(code=1008)
+        assert len(connection_manager.active_connections["test_user"]) == 2
+        assert rejected not in connection_manager.clients
+
+    @pytest.mark.asyncio
+    async def test_concurrent_connects_respect_user_limit(self, connection_manager):
+        """Test that handshakes in flight count against the per-user limit."""
+        async def slow_accept():
+            await asyncio.sleep(0.01)
+
+        websockets = [AsyncMock() for _ in range(3)]
+        for websocket in websockets:
+            websocket.accept.side_effect = slow_accept
+
+        with patch("src.api.websocket.MAX_CONNECTIONS_PER_USER", 2):
+            results = await asyncio.gather(
+                *(connection_manager.connect(ws, "test_user") for ws in websockets),
+                return_exceptions=True
+            )
+
+        assert sum(isinstance(r, WebSocketDisconnect) for r in results) == 1
+        assert len(connection_manager.active_connections["test_user"]) == 2
+        assert len(connection_manager.clients) == 2
+
+    @pytest.mark.asyncio
+    async def test_connect_releases_slot_when_accept_fails(self, connection_manager):
+        """Test that a failed handshake does not keep its reserved slot."""
+        websocket = AsyncMock()
+        websocket.accept.side_effect = RuntimeError("handshake failed")
+
+        with pytest.raises(RuntimeError):
+            await connection_manager.connect(websocket, "test_user")
+
+        assert "test_user" not in connection_manager.active_connections
+        assert websocket not in connection_manager.clients
+
+    @pytest.mark.asyncio
+    async def test_connect_rejects_over_total_limit(self, connection_manager):
+        """Test that the server-wide connection limit is enforced."""
+        with patch("src.api.websocket.MAX_TOTAL_CONNECTIONS", 2):
+            await connection_manager.connect(AsyncMock(), "user_1")
+            await connection_manager.connect(AsyncMock(), "user_2")
+            rejected = AsyncMock()
+
+            with pytest.raises(WebSocketDisconnect):
+                await connection_manager.connect(rejected, "user_3")
+
+        rejected.close.assert_called_once_with(code=1008)
+        assert "user_3" not in connection_manager.active_connections
+
     def test_disconnect(self, connection_manager):
         """Test disconnecting a WebSocket."""
         websocket = Mock()
@@ -72,13 +140,28 @@ class TestConnectionManager:
 
         # Add to both active and task connections
         connection_manager.active_connections[user_id] = {websocket}
-        connection_manager.task_connections[task_id] = {websocket}
+        connection_manager.subscribe_to_task(websocket, task_id)
 
         # Disconnect
         connection_manager.disconnect(websocket, user_id)
 
         assert user_id not in connection_manager.active_connections
         assert task_id not in connection_manager.task_connections
+        assert websocket not in connection_manager.connection_tasks
+
+    def test_disconnect_leaves_other_subscribers(self, connection_manager):
+        """Test that disconnect only touches the tasks the socket subscribed to."""
+        websocket = Mock()
+        other = Mock()
+        connection_manager.active_connections["test_user"] = {websocket}
+        connection_manager.subscribe_to_task(websocket, "task_1")
+        connection_manager.subscribe_to_task(other, "task_1")
+        connection_manager.subscribe_to_task(other, "task_2")
+
+        connection_manager.disconnect(websocket, "test_user")
+
+        assert connection_manager.task_connections == {"task_1": {other}, "task_2": {other}}
+        assert connection_manager.connection_tasks == {other: {"task_1", "task_2"}}
 
     def test_subscribe_to_task(self, connection_manager):
         """Test subscribing to task updates."""
@@ -102,6 +185,7 @@ class TestConnectionManager:
         connection_manager.unsubscribe_from_task(websocket, task_id)
 
         assert task_id not in connection_manager.task_connections
+        assert websocket not in connection_manager.connection_tasks
 
     @pytest.mark.asyncio
     async def test_send_personal_message(self, connection_manager):
@@ -123,6 +207,32 @@ class TestConnectionManager:
         # Should not raise exception
         await connection_manager.send_personal_message(message, websocket)
 
+    @pytest.mark.asyncio
+    async def test_send_personal_message_failure_disconnects(self, connection_manager):
+        """Test that a failed direct send removes the socket's subscriptions."""
+        websocket = AsyncMock()
+        websocket.send_json.side_effect = Exception("Connection closed")
+        connection_manager.subscribe_to_task(websocket, "task_1")
+
+        await connection_manager.send_personal_message({"type": "test"}, websocket)
+
+        assert "task_1" not in connection_manager.task_connections
+        assert websocket not in connection_manager.connection_tasks
+
+    @pytest.mark.asyncio
+    async def test_send_personal_message_uses_writer_queue(self, connection_manager):
+        """Test that personal messages to connected sockets go through the writer task."""
+        websocket = AsyncMock()
+        await connection_manager.connect(websocket, "test_user")
+        message = {"type": "test", "data": "hello"}
+
+        await connection_manager.send_personal_message(message, websocket)
+        await connection_manager.clients[websocket].queue.join()
+
+        websocket.send_text.assert_called_once_with(json.dumps(message, separators=(",", ":")))
+        websocket.send_json.assert_not_called()
+        connection_manager.disconnect(websocket, "test_user")
+
     @pytest.mark.asyncio
     async def test_broadcast_to_user(self, connection_manager):
         """Test broadcasting to all user connections."""
@@ -131,29 +241,40 @@ class TestConnectionManager:
         user_id = "test_user"
         message = {"type": "broadcast", "data": "hello"}
 
-        connection_manager.active_connections[user_id] = {websocket1, websocket2}
+        await connection_manager.connect(websocket1, user_id)
+        await connection_manager.connect(websocket2, user_id)
 
         await connection_manager.broadcast_to_user(message, user_id)
+        for websocket in (websocket1, websocket2):
+            await connection_manager.clients[websocket].queue.join()
 
-        websocket1.send_json.assert_called_once_with(message)
-        websocket2.send_json.assert_called_once_with(message)
+        websocket1.send_text.assert_called_once_with(json.dumps(message, separators=(",", ":")))
+        websocket2.send_text.assert_called_once_with(json.dumps(message, separators=(",", ":")))
+        connection_manager.disconnect(websocket1, user_id)
+        connection_manager.disconnect(websocket2, user_id)
 
     @pytest.mark.asyncio
     async def test_broadcast_to_user_cleans_up_disconnected(self, connection_manager):
         """Test that broadcast cleans up disconnected connections."""
         websocket1 = AsyncMock()
         websocket2 = AsyncMock()
-        websocket2.send_json.side_effect = Exception("Connection closed")
+        websocket2.send_text.side_effect = Exception("Connection closed")
         user_id = "test_user"
         message = {"type": "broadcast"}
 
-        connection_manager.active_connections[user_id] = {websocket1, websocket2}
+        await connection_manager.connect(websocket1, user_id)
+        await connection_manager.connect(websocket2, user_id)
+        writer2 = connection_manager.clients[websocket2].writer_task
 
         await connection_manager.broadcast_to_user(message, user_id)
+        await connection_manager.clients[websocket1].queue.join()
+        await asyncio.gather(writer2, return_exceptions=True)
 
         # websocket2 should be removed
         assert websocket2 not in connection_manager.active_connections[user_id]
+        assert websocket2 not in connection_manager.clients
         assert websocket1 in connection_manager.active_connections[user_id]
+        connection_manager.disconnect(websocket1, user_id)
 
     @pytest.mark.asyncio
     async def test_broadcast_task_progress(self, connection_manager):
@@ -163,37 +284,459 @@ class TestConnectionManager:
         task_id = "task_123"
         progress = {"percent": 50, "status": "processing"}
 
-        connection_manager.task_connections[task_id] = {websocket1, websocket2}
+        for websocket in (websocket1, websocket2):
+            await connection_manager.connect(websocket, "test_user")
+            connection_manager.subscribe_to_task(websocket, task_id)
 
         await connection_manager.broadcast_task_progress(task_id, progress)
+        for websocket in (websocket1, websocket2):
+            await connection_manager.clients[websocket].queue.join()
 
         # Both websockets should receive the message
-        assert websocket1.send_json.call_count == 1
-        assert websocket2.send_json.call_count == 1
+        assert websocket1.send_text.call_count == 1
+        assert websocket2.send_text.call_count == 1
+        # Both receive the same encoded payload
+        assert websocket1.send_text.call_args[0][0] is websocket2.send_text.call_args[0][0]
 
         # Check message structure
-        call_args = websocket1.send_json.call_args[0][0]
+        call_args = json.loads(websocket1.send_text.call_args[0][0])
         assert call_args["type"] == "progress"
         assert call_args["task_id"] == task_id
         assert call_args["data"] == progress
         assert "timestamp" in call_args
+        connection_manager.disconnect(websocket1, "test_user")
+        connection_manager.disconnect(websocket2, "test_user")
+
+    @pytest.mark.asyncio
+    async def test_broadcast_task_progress_to_wildcard(self, connection_manager):
+        """Test a prefix subscription receives progress of every task below it."""
+        follower = AsyncMock()
+        watcher = AsyncMock()
+        for websocket in (follower, watcher):
+            await connection_manager.connect(websocket, "42")
+        connection_manager.subscribe_to_task(follower, "user.42.video.*")
+        connection_manager.subscribe_to_task(watcher, "user.42.*")
+        # Also subscribed directly; still receives a single copy
+        connection_manager.subscribe_to_task(watcher, "user.42.video.task_1")
+
+        task_ids = ("user.42.video.task_1", "user.42.task_2", "user.7.task_3")
+        for task_id in task_ids:
+            await connection_manager.broadcast_task_progress(task_id, {"percent": 10})
+        for websocket in (follower, watcher):
+            await connection_manager.clients[websocket].queue.join()
+
+        def received(websocket):
+            return [json.loads(call[0][0])["task_id"] for call in websocket.send_text.call_args_list]
+
+        assert received(follower) == ["user.42.video.task_1"]
+        assert received(watcher) == ["user.42.video.task_1", "user.42.task_2"]
+        connection_manager.disconnect(follower, "42")
+        connection_manager.disconnect(watcher, "42")
+
+    @pytest.mark.asyncio
+    async def test_wildcard_outside_own_namespace_refused(self, connection_manager):
+        """Test a socket cannot follow another user's tasks through a wildcard."""
+        websocket = AsyncMock()
+        await connection_manager.connect(websocket, "42")
+
+        for task_id in ("user.7.*", "user.*", "user.4.*", "other.42.*"):
+            assert connection_manager.subscribe_to_task(websocket, task_id) is False
+        assert connection_manager.wildcard_prefixes() == []
+        assert connection_manager.connection_tasks.get(websocket, set()) == set()
+
+        assert connection_manager.subscribe_to_task(websocket, "user.42.*") is True
+        assert connection_manager.task_subscribers("user.42.task_1") == {websocket}
+        assert connection_manager.task_subscribers("user.7.task_1") == set()
+        connection_manager.disconnect(websocket, "42")
+
+    @pytest.mark.asyncio
+    async def test_wildcard_namespace_for_dotted_username(self, connection_manager):
+        """Test dotted usernames get their own escaped namespace, disjoint from others."""
+        john = AsyncMock()
+        john_doe = AsyncMock()
+        await connection_manager.connect(john, "john")
+        await connection_manager.connect(john_doe, "john.doe")
+
+        assert user_namespace("john.doe") == "user.john%2Edoe"
+        assert user_namespace("50%.off") == "user.50%25%2Eoff"
+        assert connection_manager.subscribe_to_task(john_doe, "user.john.doe.*") is False
+        assert connection_manager.subscribe_to_task(john_doe, "user.john.*") is False
+        assert connection_manager.subscribe_to_task(john_doe, "user.john%2Edoe.*") is True
+        assert connection_manager.subscribe_to_task(john, "user.john.*") is True
+
+        assert connection_manager.task_subscribers("user.john%2Edoe.task_1") == {john_doe}
+        assert connection_manager.task_subscribers("user.john.task_1") == {john}
+        connection_manager.disconnect(john, "john")
+        connection_manager.disconnect(john_doe, "john.doe")
+
+    @pytest.mark.asyncio
+    async def test_broadcast_numeric_task_id(self, connection_manager):
+        """Test progress for an integer task id reaches sockets subscribed to it."""
+        websocket = AsyncMock()
+        await connection_manager.connect(websocket, "test_user")
+        connection_manager.subscribe_to_task(websocket, "5")
+
+        await connection_manager.broadcast_task_progress(5, {"percent": 10})
+        await connection_manager.clients[websocket].queue.join()
+
+        assert json.loads(websocket.send_text.call_args[0][0])["task_id"] == 5
+        connection_manager.disconnect(websocket, "test_user")
+
+    @pytest.mark.asyncio
+    async def test_schedule_broadcast_coalesces_updates(self, connection_manager):
+        """Test that only the latest progress within the window is broadcast."""
+        websocket = AsyncMock()
+        await connection_manager.connect(websocket, "test_user")
+        connection_manager.subscribe_to_task(websocket, "task_123")
+
+        with patch("src.api.websocket.PROGRESS_COALESCE_WINDOW", 0.01):
+            for percent in (10, 20, 30):
+                connection_manager.schedule_broadcast("task_123", {"percent": percent})
+            await asyncio.sleep(0.05)
+            await asyncio.gather(*connection_manager.flush_tasks)
+            await connection_manager.clients[websocket].queue.join()
+
+        assert websocket.send_text.call_count == 1
+        message = json.loads(websocket.send_text.call_args[0][0])
+        assert message["data"] == {"percent": 30}
+        assert connection_manager.pending_progress == {}
+        connection_manager.disconnect(websocket, "test_user")
+
+    @pytest.mark.asyncio
+    async def test_wildcard_unsubscribe_prunes_trie(self, connection_manager):
+        """Test removing wildcard subscriptions leaves no empty trie nodes."""
+        websocket = AsyncMock()
+        other = AsyncMock()
+        for socket in (websocket, other):
+            await connection_manager.connect(socket, "42")
+        connection_manager.subscribe_to_task(websocket, "user.42.video.*")
+        connection_manager.subscribe_to_task(other, "user.42.*")
+
+        connection_manager.unsubscribe_from_task(websocket, "user.42.video.*")
+        assert connection_manager.wildcard_prefixes() == ["user.42"]
+        assert connection_manager.topic_root.children["user"].children["42"].children == {}
+
+        connection_manager.disconnect(other, "42")
+        assert connection_manager.topic_root.children == {}
+        assert connection_manager.task_subscribers("user.42.task_1") == set()
+        connection_manager.disconnect(websocket, "42")
 
     @pytest.mark.asyncio
     async def test_broadcast_task_progress_cleans_up_disconnected(self, connection_manager):
         """Test that broadcast_task_progress cleans up disconnected connections."""
         websocket1 = AsyncMock()
         websocket2 = AsyncMock()
-        websocket2.send_json.side_effect = Exception("Connection closed")
+        websocket2.send_text.side_effect = Exception("Connection closed")
         task_id = "task_123"
         progress = {"percent": 50}
 
-        connection_manager.task_connections[task_id] = {websocket1, websocket2}
+        for websocket in (websocket1, websocket2):
+            await connection_manager.connect(websocket, "test_user")
+            connection_manager.subscribe_to_task(websocket, task_id)
+        writer2 = connection_manager.clients[websocket2].writer_task
 
         await connection_manager.broadcast_task_progress(task_id, progress)
+        await connection_manager.clients[websocket1].queue.join()
+        await asyncio.gather(writer2, return_exceptions=True)
 
         # websocket2 should be removed
         assert websocket2 not in connection_manager.task_connections[task_id]
         assert websocket1 in connection_manager.task_connections[task_id]
+        connection_manager.disconnect(websocket1, "test_user")
+
+    @pytest.mark.asyncio
+    async def test_broadcast_does_not_wait_for_slow_client(self, connection_manager):
+        """Test that a broadcast returns while a client is still sending."""
+        release = asyncio.Event()
+
+        async def blocked_send(payload):
+            await release.wait()
+
+        slow = AsyncMock()
+        slow.send_text.side_effect = blocked_send
+        fast = AsyncMock()
+        for websocket in (slow, fast):
+            await connection_manager.connect(websocket, "test_user")
+            connection_manager.subscribe_to_task(websocket, "task_123")
+
+        await asyncio.wait_for(
+            connection_manager.broadcast_task_progress("task_123", {"percent": 10}), timeout=1
+        )
+        await connection_manager.clients[fast].queue.join()
+
+        fast.send_text.assert_called_once()
+        release.set()
+        await connection_manager.clients[slow].queue.join()
+        slow.send_text.assert_called_once()
+        connection_manager.disconnect(slow, "test_user")
+        connection_manager.disconnect(fast, "test_user")
+
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_slow_consumer(self, connection_manager):
+        """Test that a client with a full outbound queue is disconnected and closed."""
+        websocket = AsyncMock()
+        user_id = "test_user"
+
+        with patch("src.api.websocket.OUTBOUND_QUEUE_SIZE", 1):
+            await connection_manager.connect(websocket, user_id)
+        writer = connection_manager.clients[websocket].writer_task
+        writer.cancel()  # Nothing drains the queue
+        await asyncio.gather(writer, return_exceptions=True)
+
+        await connection_manager.broadcast_to_user({"type": "first"}, user_id)
+        await connection_manager.broadcast_to_user({"type": "second"}, user_id)
+
+        assert user_id not in connection_manager.active_connections
+        assert websocket not in connection_manager.clients
+        websocket.close.assert_called_once_with(code=1013)
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_writer(self, connection_manager):
+        """Test that disconnect stops the connection's writer task."""
+        websocket = AsyncMock()
+        await connection_manager.connect(websocket, "test_user")
+        writer = connection_manager.clients[websocket].writer_task
+
+        connection_manager.disconnect(websocket)
+        await asyncio.gather(writer, return_exceptions=True)
+
+        assert writer.cancelled()
+        assert "test_user" not in connection_manager.active_connections
+        assert websocket not in connection_manager.clients
+
+    @pytest.mark.asyncio
+    async def test_writer_drops_timed_out_connection(self, connection_manager):
+        """Test that a connection exceeding the send timeout is cleaned up."""
+        async def hang(payload):
+            await asyncio.sleep(1)
+
+        stuck = AsyncMock()
+        stuck.send_text.side_effect = hang
+        user_id = "test_user"
+        await connection_manager.connect(stuck, user_id)
+        writer = connection_manager.clients[stuck].writer_task
+
+        with patch("src.api.websocket.SEND_TIMEOUT", 0.01):
+            await connection_manager.broadcast_to_user({"type": "broadcast"}, user_id)
+            await asyncio.gather(writer, return_exceptions=True)
+
+        assert user_id not in connection_manager.active_connections
+
+
+class FakeRedis:
+    """In-memory stand-in for a redis.asyncio client's pub/sub."""
+
+    def __init__(self):
+        self.pubsubs = []
+
+    def pubsub(self):
+        pubsub = FakePubSub()
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    async def publish(self, channel, data):
+        for pubsub in self.pubsubs:
+            if channel in pubsub.channels:
+                pubsub.messages.put_nowait({"type": "message", "channel": channel, "data": data})
+            for pattern in pubsub.patterns:
+                if fnmatchcase(channel, pattern):
+                    pubsub.messages.put_nowait({"type": "pmessage", "channel": channel, "data": data})
+
+    async def aclose(self):
+        pass
+
+
+class FakePubSub:
+    """Pub/sub connection of FakeRedis."""
+
+    def __init__(self):
+        self.channels = set()
+        self.patterns = set()
+        self.messages = asyncio.Queue()
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels):
+        self.channels.difference_update(channels)
+
+    async def psubscribe(self, *patterns):
+        self.patterns.update(patterns)
+
+    async def punsubscribe(self, *patterns):
+        self.patterns.difference_update(patterns)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        pass
+
+
+class TestRedisProgressBridge:
+    """Tests for relaying task progress between workers through Redis."""
+
+    @pytest.mark.asyncio
+    async def test_progress_reaches_subscribers_on_other_workers(self):
+        """Test progress published by one worker is delivered by another."""
+        redis = FakeRedis()
+        publisher = ConnectionManager()
+        subscriber = ConnectionManager()
+        publisher.enable_redis(redis)
+        subscriber.enable_redis(redis)
+
+        websocket = AsyncMock()
+        await subscriber.connect(websocket, "test_user")
+        subscriber.subscribe_to_task(websocket, "task_123")
+        # Let the relay subscribe to the task's channel
+        await asyncio.sleep(0.01)
+
+        await publisher.broadcast_task_progress("task_123", {"progress": 50})
+        await asyncio.sleep(0.01)
+        await subscriber.clients[websocket].queue.join()
+
+        message = json.loads(websocket.send_text.call_args[0][0])
+        assert message["type"] == "progress"
+        assert message["task_id"] == "task_123"
+        assert message["data"] == {"progress": 50}
+
+        await publisher.disable_redis()
+        await subscriber.disable_redis()
+        subscriber.disconnect(websocket, "42")
+
+    @pytest.mark.asyncio
+    async def test_relay_resyncs_only_on_subscription_change(self):
+        """Test relayed messages do not recompute the subscribed channels."""
+        redis = FakeRedis()
+        publisher = ConnectionManager()
+        subscriber = ConnectionManager()
+        publisher.enable_redis(redis)
+        subscriber.enable_redis(redis)
+
+        websocket = AsyncMock()
+        await subscriber.connect(websocket, "test_user")
+        subscriber.subscribe_to_task(websocket, "task_123")
+        await asyncio.sleep(0.01)
+
+        with patch.object(
+            subscriber.bridge, "_sync_channels", wraps=subscriber.bridge._sync_channels
+        ) as sync_channels:
+            for percent in range(5):
+                await publisher.broadcast_task_progress("task_123", {"progress": percent})
+            await asyncio.sleep(0.15)
+            await subscriber.clients[websocket].queue.join()
+
+            assert websocket.send_text.call_count == 5
+            sync_channels.assert_not_called()
+
+            subscriber.unsubscribe_from_task(websocket, "task_123")
+            await asyncio.sleep(0.15)
+            assert sync_channels.call_count == 1
+
+        await publisher.disable_redis()
+        await subscriber.disable_redis()
+        subscriber.disconnect(websocket, "test_user")
+
+    @pytest.mark.asyncio
+    async def test_relay_resyncs_after_redis_error(self):
+        """Test a Redis error triggers exactly one resubscription pass."""
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        redis = FakeRedis()
+        connection_manager = ConnectionManager()
+        connection_manager.enable_redis(redis)
+        connection_manager.subscribe_to_task(Mock(), "task_1")
+        await asyncio.sleep(0.01)
+        bridge = connection_manager.bridge
+        pubsub = redis.pubsubs[0]
+        get_message = pubsub.get_message
+        errors = iter([RedisConnectionError()])
+
+        async def flaky_get_message(*args, **kwargs):
+            error = next(errors, None)
+            if error is not None:
+                raise error
+            return await get_message(*args, **kwargs)
+
+        with patch("src.api.websocket.BRIDGE_RETRY_DELAY", 0.01), \
+                patch.object(pubsub, "get_message", side_effect=flaky_get_message), \
+                patch.object(bridge, "_sync_channels", wraps=bridge._sync_channels) as sync_channels:
+            await asyncio.sleep(0.15)
+
+            assert sync_channels.call_count == 1
+
+        await connection_manager.disable_redis()
+
+    @pytest.mark.asyncio
+    async def test_relay_follows_local_subscriptions(self):
+        """Test the relay only listens to tasks with local subscribers."""
+        redis = FakeRedis()
+        connection_manager = ConnectionManager()
+        connection_manager.enable_redis(redis)
+        pubsub = redis.pubsubs[0]
+        websocket = Mock()
+
+        connection_manager.subscribe_to_task(websocket, "task_1")
+        await asyncio.sleep(0.01)
+        assert pubsub.channels == {"openuser:ws:progress:task_1"}
+
+        # Changes are picked up after at most one poll interval
+        connection_manager.unsubscribe_from_task(websocket, "task_1")
+        await asyncio.sleep(0.15)
+        assert pubsub.channels == set()
+
+        await connection_manager.disable_redis()
+        assert connection_manager.bridge is None
+
+    @pytest.mark.asyncio
+    async def test_wildcard_subscription_uses_one_pattern(self):
+        """Test tasks covered by a wildcard are not also subscribed on their own."""
+        redis = FakeRedis()
+        publisher = ConnectionManager()
+        subscriber = ConnectionManager()
+        publisher.enable_redis(redis)
+        subscriber.enable_redis(redis)
+        pubsub = redis.pubsubs[1]
+
+        websocket = AsyncMock()
+        await subscriber.connect(websocket, "42")
+        subscriber.subscribe_to_task(websocket, "user.42.task_1")
+        subscriber.subscribe_to_task(websocket, "user.42.*")
+        await asyncio.sleep(0.15)
+
+        assert pubsub.channels == set()
+        assert pubsub.patterns == {"openuser:ws:progress:user.42.*"}
+
+        await publisher.broadcast_task_progress("user.42.task_1", {"progress": 50})
+        await asyncio.sleep(0.01)
+        await subscriber.clients[websocket].queue.join()
+
+        assert websocket.send_text.call_count == 1
+
+        await publisher.disable_redis()
+        await subscriber.disable_redis()
+        subscriber.disconnect(websocket, "test_user")
+
+
+class TestTimestamps:
+    """Tests for the cached message timestamp."""
+
+    def test_now_iso_reuses_value_within_resolution(self):
+        """Test timestamps are reused within the resolution and refreshed after it."""
+        from src.api import websocket as ws_module
+
+        with patch("src.api.websocket.time.time", return_value=1_000_000.0):
+            first = ws_module._now_iso()
+        with patch("src.api.websocket.time.time", return_value=1_000_000.005):
+            assert ws_module._now_iso() == first
+        with patch("src.api.websocket.time.time", return_value=1_000_001.0):
+            later = ws_module._now_iso()
+
+        assert first == "1970-01-12T13:46:40+00:00"
+        assert later == "1970-01-12T13:46:41+00:00"
 
 
 class TestWebSocketAuthentication:
@@ -266,6 +809,21 @@ class TestWebSocketEndpoints:
             assert data["type"] == "subscribed"
             assert data["task_id"] == "task_123"
 
+    def test_websocket_progress_wildcard_other_user_refused(self, client, valid_token):
+        """Test wildcards outside the caller's namespace get an error frame."""
+        with client.websocket_connect(f"/api/v1/ws/progress?token={valid_token}") as websocket:
+            websocket.receive_json()
+
+            websocket.send_json({"action": "subscribe", "task_id": "user.*"})
+            data = websocket.receive_json()
+            assert data["type"] == "error"
+            assert data["task_id"] == "user.*"
+
+            websocket.send_json({"action": "subscribe", "task_id": "user.test_user.*"})
+            data = websocket.receive_json()
+            assert data["type"] == "subscribed"
+            assert data["task_id"] == "user.test_user.*"
+
     def test_websocket_progress_unsubscribe(self, client, valid_token):
         """Test unsubscribing from task progress."""
         with client.websocket_connect(f"/api/v1/ws/progress?token={valid_token}") as websocket:
@@ -310,6 +868,35 @@ class TestWebSocketEndpoints:
             data = websocket.receive_json()
             assert data["type"] == "error"
 
+    def test_websocket_progress_numeric_task_id(self, client, valid_token):
+        """Test scheduler task ids sent as integers are still accepted."""
+        with client.websocket_connect(f"/api/v1/ws/progress?token={valid_token}") as websocket:
+            websocket.receive_json()
+
+            websocket.send_json({"action": "subscribe", "task_id": 5})
+            data = websocket.receive_json()
+            assert data["type"] == "subscribed"
+            assert data["task_id"] == 5
+
+            websocket.send_json({"action": "unsubscribe", "task_id": 5})
+            data = websocket.receive_json()
+            assert data["type"] == "unsubscribed"
+
+    @pytest.mark.parametrize("task_id", [["task_1"], {"id": 1}, True, 1.5])
+    def test_websocket_progress_invalid_task_id_type(self, client, valid_token, task_id):
+        """Test task ids that are not strings or integers get an error frame."""
+        with client.websocket_connect(f"/api/v1/ws/progress?token={valid_token}") as websocket:
+            websocket.receive_json()
+
+            for action in ("subscribe", "unsubscribe"):
+                websocket.send_json({"action": action, "task_id": task_id})
+                data = websocket.receive_json()
+                assert data["type"] == "error"
+
+            # The connection survives the bad frames
+            websocket.send_json({"action": "subscribe", "task_id": "task_123"})
+            assert websocket.receive_json()["type"] == "subscribed"
+
     def test_websocket_agent_connection(self, client, valid_token):
         """Test WebSocket agent endpoint connection."""
         with client.websocket_connect(f"/api/v1/ws/agent?token={valid_token}") as websocket:
@@ -365,6 +952,17 @@ class TestWebSocketEndpoints:
             data = websocket.receive_json()
             assert data["type"] == "error"
 
+    def test_websocket_agent_unhashable_action(self, client, valid_token):
+        """Test a non-string action is rejected without closing the socket."""
+        with client.websocket_connect(f"/api/v1/ws/agent?token={valid_token}") as websocket:
+            websocket.receive_json()
+
+            websocket.send_json({"action": ["ping"]})
+            assert websocket.receive_json()["type"] == "error"
+
+            websocket.send_json({"action": "ping"})
+            assert websocket.receive_json()["type"] == "pong"
+
     def test_websocket_agent_missing_fields(self, client, valid_token):
         """Test message without required fields."""
         with client.websocket_connect(f"/api/v1/ws/agent?token={valid_token}") as websocket:
@@ -4,7 +4,8 @@ Tests for authentication API endpoints.
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from unittest.mock import patch
 from sqlalchemy.pool import StaticPool
 
 from src.api.main import create_app
@@ -95,6 +96,24 @@ class TestUserRegistration:
         assert "id" in user
         assert "created_at" in user
 
+    def test_register_skips_refresh(self, client, db_manager):
+        """Test that registration builds the response without reloading the user."""
+        with patch.object(Session, "refresh", side_effect=AssertionError("unexpected refresh")):
+            response = client.post(
+                "/api/v1/auth/register",
+                json={
+                    "username": "newuser",
+                    "email": "newuser@example.com",
+                    "password": "NewPassword123"
+                }
+            )
+
+        assert response.status_code == 201
+        user_id = response.json()["user"]["id"]
+        session = db_manager.get_session()
+        assert session.get(User, user_id).username == "newuser"
+        session.close()
+
     def test_register_duplicate_username(self, client, test_user):
         """Test registration with duplicate username."""
         response = client.post(
@@ -123,6 +142,27 @@ class TestUserRegistration:
         assert response.status_code == 400
         assert "Email already registered" in response.json()["detail"]
 
+    def test_register_concurrent_duplicate(self, client):
+        """Test registration losing a race on the unique constraint."""
+        from unittest.mock import patch
+        from sqlalchemy.exc import IntegrityError
+
+        with patch(
+            "sqlalchemy.orm.Session.commit",
+            side_effect=IntegrityError("INSERT", {}, Exception("UNIQUE constraint failed"))
+        ):
+            response = client.post(
+                "/api/v1/auth/register",
+                json={
+                    "username": "raceuser",
+                    "email": "race@example.com",
+                    "password": "NewPassword123"
+                }
+            )
+
+        assert response.status_code == 400
+        assert "already registered" in response.json()["detail"]
+
     def test_register_invalid_email(self, client):
         """Test registration with invalid email."""
         response = client.post(
@@ -136,6 +176,19 @@ class TestUserRegistration:
 
         assert response.status_code == 422  # Validation error
 
+    def test_register_email_with_whitespace(self, client):
+        """Test registration rejects emails containing whitespace."""
+        response = client.post(
+            "/api/v1/auth/register",
+            json={
+                "username": "newuser",
+                "email": "new user@example.com",
+                "password": "NewPassword123"
+            }
+        )
+
+        assert response.status_code == 422  # Validation error
+
     def test_register_weak_password(self, client):
         """Test registration with weak password."""
         response = client.post(
@@ -227,6 +280,31 @@ class TestUserLogin:
         assert "access_token" in data
         assert "refresh_token" in data
 
+    def test_login_username_containing_at_sign(self, client, db_manager):
+        """Test login falls back to username lookup when it contains '@'."""
+        session = db_manager.get_session()
+        user = User(
+            username="team@home",
+            email="team@example.com",
+            password_hash=get_password_hash("TestPassword123"),
+            is_active=True,
+            is_superuser=False
+        )
+        session.add(user)
+        session.commit()
+        session.close()
+
+        response = client.post(
+            "/api/v1/auth/login",
+            json={
+                "username": "team@home",
+                "password": "TestPassword123"
+            }
+        )
+
+        assert response.status_code == 200
+        assert response.json()["user"]["username"] == "team@home"
+
     def test_login_wrong_password(self, client, test_user):
         """Test login with wrong password."""
         response = client.post(
@@ -463,7 +541,7 @@ class TestGetCurrentUser:
         assert response.status_code == 401
         assert "Could not validate credentials" in response.json()["detail"]
 
-    def test_get_db_not_configured(self):
+    async def test_get_db_not_configured(self):
         """Test get_db when database manager is not configured."""
         from src.api.auth import get_db, set_db_manager
 
@@ -472,4 +550,4 @@ class TestGetCurrentUser:
 
         # Try to get database session
         with pytest.raises(RuntimeError, match="Database manager not configured"):
-            next(get_db())
+            await get_db().__anext__()
@@ -10,6 +10,7 @@ from src.api.auth_utils import (
     create_access_token,
     create_refresh_token,
     decode_token,
+    clear_token_cache,
 )
 
 
@@ -132,3 +133,50 @@ class TestJWTTokens:
         assert decoded1 is not None
         assert decoded2 is not None
         assert decoded1["sub"] == decoded2["sub"]
+
+    def test_decode_token_uses_cache(self):
+        """Test repeat decodes of the same token skip jwt.decode."""
+        from unittest.mock import patch
+        from src.api import auth_utils
+
+        clear_token_cache()
+        token = create_access_token({"sub": "cacheduser"})
+
+        with patch.object(auth_utils.jwt, "decode", wraps=auth_utils.jwt.decode) as mock_decode:
+            first = decode_token(token)
+            second = decode_token(token)
+
+        assert first == second
+        assert first["sub"] == "cacheduser"
+        assert mock_decode.call_count == 1
+
+    def test_decode_token_cache_evicts_least_recently_used(self):
+        """Test a full cache evicts only the least recently used token."""
+        from unittest.mock import patch
+        from src.api import auth_utils
+
+        clear_token_cache()
+        tokens = [create_access_token({"sub": f"user{i}"}) for i in range(3)]
+
+        with patch.object(auth_utils, "TOKEN_CACHE_MAX_SIZE", 2):
+            decode_token(tokens[0])
+            decode_token(tokens[1])
+            decode_token(tokens[0])
+            decode_token(tokens[2])
+
+        assert list(auth_utils._token_cache) == [tokens[0], tokens[2]]
+        clear_token_cache()
+
+    def test_decode_token_cache_respects_expiration(self):
+        """Test cached payloads are dropped once the token expires."""
+        from unittest.mock import patch
+        from src.api import auth_utils
+
+        clear_token_cache()
+        token = create_access_token({"sub": "cacheduser"}, expires_delta=timedelta(seconds=5))
+        assert decode_token(token) is not None
+
+        later = auth_utils.time.time() + 10
+        with patch.object(auth_utils.time, "time", return_value=later), \
+                patch.object(auth_utils.jwt, "decode", side_effect=auth_utils.JWTError("expired")):
+            assert decode_token(token) is None
@@ -333,6 +333,25 @@ class TestPluginConfig:
         assert config.get("field1") == "value2"
         assert config.get("field2") == 123
 
+    def test_reload_skips_unchanged_file(self, tmp_path, monkeypatch):
+        """Test reloading an unchanged file does not re-read it"""
+        config_file = tmp_path / "test_plugin.yaml"
+        with open(config_file, "w") as f:
+            yaml.dump({"field1": "value1"}, f)
+
+        config = PluginConfig(
+            plugin_name="test_plugin",
+            config_dir=str(tmp_path)
+        )
+
+        def mock_open(*args, **kwargs):
+            raise AssertionError("unchanged config file was re-opened")
+
+        monkeypatch.setattr("builtins.open", mock_open)
+
+        assert config.reload() is True
+        assert config.get("field1") == "value1"
+
     def test_validate(self, tmp_path):
         """Test configuration validation"""
         schema = PluginConfigSchema()
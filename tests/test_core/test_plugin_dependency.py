@@ -50,6 +50,42 @@ class TestPluginDependency:
         with pytest.raises(ValueError):
             PluginDependency.parse("")
 
+    def test_parse_reuses_cached_result(self):
+        """Test repeated dependency strings are parsed once"""
+        from src.core.plugin_dependency import _parse_dependency
+
+        _parse_dependency.cache_clear()
+        first = PluginDependency.parse("shared_plugin>=1.0.0")
+        second = PluginDependency.parse("shared_plugin>=1.0.0")
+
+        assert first == second
+        assert first is not second
+        assert _parse_dependency.cache_info().hits == 1
+
+    def test_check_version_reuses_cached_result(self):
+        """Test repeated (constraint, version) checks are computed once"""
+        from src.core.plugin_dependency import _check_version
+
+        _check_version.cache_clear()
+        first = PluginDependency(name="a", version_constraint=">=1.0.0")
+        second = PluginDependency(name="b", version_constraint=">=1.0.0")
+
+        assert first.check_version("1.2.0") is True
+        assert second.check_version("1.2.0") is True
+        assert second.check_version("0.9.0") is False
+        assert _check_version.cache_info().hits == 1
+
+    def test_dependency_is_immutable(self):
+        """Test dependencies are frozen, slotted and hashable"""
+        import dataclasses
+
+        dep = PluginDependency.parse("plugin_name>=1.0.0")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            dep.name = "other"
+        assert not hasattr(dep, "__dict__")
+        assert {dep: True}[PluginDependency("plugin_name", ">=1.0.0")] is True
+
     def test_check_version_unknown_operator(self):
         """Test version check with unknown operator (defensive code path)"""
         dep = PluginDependency(name="plugin", version_constraint="~=1.0.0")
@@ -73,6 +109,14 @@ class TestPluginDependency:
         assert dep.check_version("1.0.1") is True
         assert dep.check_version("0.9.9") is False
 
+    def test_check_version_specifier_set(self):
+        """Test version check with a combined constraint and pre-release versions"""
+        dep = PluginDependency(name="plugin", version_constraint=">=1.0,<2.0")
+
+        assert dep.check_version("1.5.0") is True
+        assert dep.check_version("1.5.0rc1") is True
+        assert dep.check_version("2.0.0") is False
+
     def test_check_version_no_constraint(self):
         """Test version check with no constraint"""
         dep = PluginDependency(name="plugin", version_constraint=None)
@@ -176,6 +220,28 @@ class TestDependencyResolver:
         assert len(missing) == 1
         assert "plugin1" in missing[0]
 
+    def test_check_dependencies_cached_until_add_plugin(self):
+        """Test dependency check results are reused until a plugin is added"""
+        from unittest.mock import patch
+
+        resolver = DependencyResolver()
+        resolver.add_plugin("plugin1", "1.0.0", ["plugin2>=1.0.0", "plugin3"])
+        resolver.add_plugin("plugin2", "1.5.0", [])
+
+        with patch.object(
+            PluginDependency, "check_version", autospec=True, return_value=True
+        ) as check_version:
+            first = resolver.check_dependencies("plugin1")
+            first[1].append("mutated")
+            second = resolver.check_dependencies("plugin1")
+
+            assert second == (False, ["plugin3 (not installed)"])
+            assert check_version.call_count == 1
+
+            resolver.add_plugin("plugin3", "1.0.0", [])
+            assert resolver.check_dependencies("plugin1") == (True, [])
+            assert check_version.call_count == 3
+
     def test_check_dependencies_plugin_not_found(self):
         """Test checking dependencies for non-existent plugin"""
         resolver = DependencyResolver()
@@ -223,6 +289,50 @@ class TestDependencyResolver:
         assert len(errors) > 0
         assert "Circular dependency" in errors[0]
 
+    def test_resolve_load_order_independent_of_registration_order(self):
+        """Test plugins that are ready together load in name order"""
+        resolver = DependencyResolver()
+        resolver.add_plugin("zeta", "1.0.0", [])
+        resolver.add_plugin("beta", "1.0.0", ["zeta"])
+        resolver.add_plugin("alpha", "1.0.0", [])
+        resolver.add_plugin("gamma", "1.0.0", ["alpha"])
+
+        success, load_order, errors = resolver.resolve_load_order()
+
+        assert success is True
+        assert load_order == ["alpha", "gamma", "zeta", "beta"]
+
+    def test_resolve_load_order_cached_until_add_plugin(self):
+        """Test the load order is computed once until a plugin is added"""
+        from unittest.mock import patch
+
+        resolver = DependencyResolver()
+        resolver.add_plugin("plugin1", "1.0.0", [])
+
+        with patch.object(
+            resolver, "_sort_plugins", wraps=resolver._sort_plugins
+        ) as sort_plugins:
+            first = resolver.resolve_load_order()
+            first[1].append("mutated")
+            assert resolver.resolve_load_order() == (True, ["plugin1"], [])
+            assert sort_plugins.call_count == 1
+
+            resolver.add_plugin("plugin2", "1.0.0", ["plugin1"])
+            assert resolver.resolve_load_order() == (True, ["plugin1", "plugin2"], [])
+            assert sort_plugins.call_count == 2
+
+    def test_resolve_load_order_duplicate_dependency(self):
+        """Test a dependency listed twice is not reported as circular"""
+        resolver = DependencyResolver()
+        resolver.add_plugin("base", "1.0.0", [])
+        resolver.add_plugin("app", "1.0.0", ["base", "base>=1.0.0"])
+
+        success, load_order, errors = resolver.resolve_load_order()
+
+        assert success is True
+        assert load_order == ["base", "app"]
+        assert errors == []
+
     def test_get_dependency_tree(self):
         """Test getting dependency tree"""
         resolver = DependencyResolver()
@@ -238,6 +348,21 @@ class TestDependencyResolver:
         assert tree["plugin2"] == ["plugin1"]
         assert tree["plugin1"] == []
 
+    def test_get_dependency_tree_deep_chain(self):
+        """Test a dependency chain deeper than the recursion limit"""
+        import sys
+
+        depth = sys.getrecursionlimit() + 100
+        resolver = DependencyResolver()
+        resolver.add_plugin("plugin0", "1.0.0", [])
+        for i in range(1, depth):
+            resolver.add_plugin(f"plugin{i}", "1.0.0", [f"plugin{i - 1}"])
+
+        tree = resolver.get_dependency_tree(f"plugin{depth - 1}")
+
+        assert len(tree) == depth
+        assert list(tree)[-1] == "plugin0"
+
     def test_get_dependency_tree_nonexistent(self):
         """Test getting dependency tree for non-existent plugin"""
         resolver = DependencyResolver()
@@ -2,16 +2,19 @@
 Tests for Digital Human API endpoints.
 """
 import pytest
+import struct
+import zlib
 from pathlib import Path
 from io import BytesIO
 from unittest.mock import Mock, patch, MagicMock
 from fastapi.testclient import TestClient
+from PIL import Image
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from src.api.main import create_app
-from src.models.base import Base
+from src.models.base import Base, DatabaseManager
 from src.models.user import User
 from src.models.digital_human import DigitalHuman
 from src.models.task import Task
@@ -120,25 +123,31 @@ def test_digital_human(test_engine, test_user):
     session.close()
 
 
-def test_create_digital_human(client, auth_token, tmp_path):
+def make_image_bytes(size=(8, 8), format="JPEG"):
+    """Encode a small solid-colour test image."""
+    buffer = BytesIO()
+    Image.new("RGB", size, color="red").save(buffer, format=format)
+    return buffer.getvalue()
+
+
+def test_create_digital_human(client, auth_token, tmp_path, monkeypatch):
     """Test creating a digital human."""
-    # Create fake image file
-    image_data = b"fake image data"
+    monkeypatch.chdir(tmp_path)
+
+    image_data = make_image_bytes()
     image_file = BytesIO(image_data)
     image_file.name = "test.jpg"
 
-    with patch("builtins.open", create=True) as mock_open:
-        with patch("pathlib.Path.mkdir"):
-            response = client.post(
-                "/api/v1/digital-human/create",
-                headers={"Authorization": f"Bearer {auth_token}"},
-                data={
-                    "name": "Test Human",
-                    "description": "Test description",
-                    "voice_model_path": "/fake/voice.wav"
-                },
-                files={"image": ("test.jpg", image_file, "image/jpeg")}
-            )
+    response = client.post(
+        "/api/v1/digital-human/create",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        data={
+            "name": "Test Human",
+            "description": "Test description",
+            "voice_model_path": "/fake/voice.wav"
+        },
+        files={"image": ("../../test.jpg", image_file, "image/jpeg")}
+    )
 
     assert response.status_code == 200
     data = response.json()
@@ -146,6 +155,110 @@ def test_create_digital_human(client, auth_token, tmp_path):
     assert data["description"] == "Test description"
     assert data["is_active"] is True
 
+    # Stored under a content hash, never the client-supplied name
+    stored = Path(data["image_path"])
+    assert stored.parent == Path("uploads/digital_humans")
+    assert stored.suffix == ".jpg"
+    assert ".." not in stored.parts
+    assert (tmp_path / stored).read_bytes() == image_data
+
+
+def test_create_digital_human_unsupported_image_type(client, auth_token):
+    """Test creating digital human with an image type outside the allowlist."""
+    response = client.post(
+        "/api/v1/digital-human/create",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        data={"name": "Test Human"},
+        files={"image": ("test.svg", BytesIO(b"<svg/>"), "image/svg+xml")}
+    )
+
+    assert response.status_code == 400
+    assert "Unsupported image type" in response.json()["detail"]
+
+
+def test_create_digital_human_spoofed_content_type(client, auth_token, tmp_path, monkeypatch):
+    """Test that the declared content type is not trusted over the file's magic number."""
+    monkeypatch.chdir(tmp_path)
+
+    response = client.post(
+        "/api/v1/digital-human/create",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        data={"name": "Test Human"},
+        files={"image": ("test.jpg", BytesIO(b"fake image data"), "image/jpeg")}
+    )
+
+    assert response.status_code == 400
+    assert "Unsupported image type" in response.json()["detail"]
+    assert not (tmp_path / "uploads").exists()
+
+
+def test_create_digital_human_stores_detected_format(client, auth_token, tmp_path, monkeypatch):
+    """Test that the stored extension follows the detected image format."""
+    monkeypatch.chdir(tmp_path)
+
+    response = client.post(
+        "/api/v1/digital-human/create",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        data={"name": "Test Human"},
+        files={"image": ("test.jpg", BytesIO(make_image_bytes(format="PNG")), "image/jpeg")}
+    )
+
+    assert response.status_code == 200
+    assert Path(response.json()["image_path"]).suffix == ".png"
+
+
+def test_create_digital_human_oversized_image(client, auth_token, tmp_path, monkeypatch):
+    """Test rejecting images whose header declares dimensions above the limit."""
+    monkeypatch.chdir(tmp_path)
+    image_data = make_image_bytes(size=(8193, 1), format="PNG")
+
+    response = client.post(
+        "/api/v1/digital-human/create",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        data={"name": "Test Human"},
+        files={"image": ("test.png", BytesIO(image_data), "image/png")}
+    )
+
+    assert response.status_code == 400
+    assert "Invalid image dimensions" in response.json()["detail"]
+    assert not (tmp_path / "uploads").exists()
+
+
+def make_png_header(width, height):
+    """Build a PNG with only an IHDR chunk declaring the given dimensions."""
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", ihdr) + chunk(b"IEND", b"")
+
+
+def test_create_digital_human_decompression_bomb(client, auth_token, tmp_path, monkeypatch):
+    """Test rejecting headers large enough for Pillow to flag a decompression bomb."""
+    monkeypatch.chdir(tmp_path)
+
+    response = client.post(
+        "/api/v1/digital-human/create",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        data={"name": "Test Human"},
+        files={"image": ("test.png", BytesIO(make_png_header(20000, 20000)), "image/png")}
+    )
+
+    assert response.status_code == 400
+    assert "Invalid image dimensions" in response.json()["detail"]
+    assert not (tmp_path / "uploads").exists()
+
+
+def test_image_suffix():
+    """Test detecting image formats from magic numbers."""
+    from src.api.digital_human import _image_suffix
+
+    assert _image_suffix(b"\xff\xd8\xff\xe0") == ".jpg"
+    assert _image_suffix(b"\x89PNG\r\n\x1a\n") == ".png"
+    assert _image_suffix(b"GIF89a") == ".gif"
+    assert _image_suffix(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == ".webp"
+    assert _image_suffix(b"<svg/>") is None
+
 
 def test_create_digital_human_invalid_file(client, auth_token):
     """Test creating digital human with invalid file type."""
@@ -211,22 +324,21 @@ def test_generate_video_from_text(client, auth_token, test_digital_human):
     assert data["mode"] == "enhanced_talking_head"
 
 
-def test_generate_video_from_audio(client, auth_token, test_digital_human):
+def test_generate_video_from_audio(client, auth_token, test_digital_human, tmp_path, monkeypatch):
     """Test generating video from audio."""
+    monkeypatch.chdir(tmp_path)
     audio_file = BytesIO(b"fake audio data")
     audio_file.name = "test.wav"
 
-    with patch("builtins.open", create=True):
-        with patch("pathlib.Path.mkdir"):
-            response = client.post(
-                "/api/v1/digital-human/generate",
-                headers={"Authorization": f"Bearer {auth_token}"},
-                data={
-                    "digital_human_id": test_digital_human.id,
-                    "mode": "lipsync"
-                },
-                files={"audio": ("test.wav", audio_file, "audio/wav")}
-            )
+    response = client.post(
+        "/api/v1/digital-human/generate",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        data={
+            "digital_human_id": test_digital_human.id,
+            "mode": "lipsync"
+        },
+        files={"audio": ("test.wav", audio_file, "audio/wav")}
+    )
 
     assert response.status_code == 200
     data = response.json()
@@ -283,6 +395,7 @@ def test_generate_video_invalid_mode(client, auth_token, test_digital_human):
 
     assert response.status_code == 400
     assert "Invalid mode" in response.json()["detail"]
+    assert "enhanced_talking_head" in response.json()["detail"]
 
 
 def test_generate_video_not_found(client, auth_token):
@@ -301,6 +414,28 @@ def test_generate_video_not_found(client, auth_token):
     assert "not found" in response.json()["detail"]
 
 
+@pytest.mark.parametrize("digital_human_id, mode, status_code", [
+    (99999, "lipsync", 404),
+    (None, "invalid_mode", 400),
+])
+def test_generate_video_rejected_audio_not_saved(
+    client, auth_token, test_digital_human, tmp_path, monkeypatch,
+    digital_human_id, mode, status_code
+):
+    """Test audio is not written to disk for requests that fail validation."""
+    monkeypatch.chdir(tmp_path)
+
+    response = client.post(
+        "/api/v1/digital-human/generate",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        data={"digital_human_id": digital_human_id or test_digital_human.id, "mode": mode},
+        files={"audio": ("test.wav", BytesIO(b"fake audio"), "audio/wav")}
+    )
+
+    assert response.status_code == status_code
+    assert not (tmp_path / "uploads" / "audio").exists()
+
+
 def test_list_digital_humans(client, auth_token, test_digital_human):
     """Test listing digital humans."""
     response = client.get(
@@ -336,6 +471,47 @@ def test_list_digital_humans_empty(client, auth_token, test_engine):
     assert len(data["digital_humans"]) == 0
 
 
+def test_list_digital_humans_paginated(client, auth_token, test_engine, test_user):
+    """Test paging through digital humans newest first."""
+    TestingSessionLocal = sessionmaker(bind=test_engine)
+    session = TestingSessionLocal()
+    session.query(DigitalHuman).delete()
+    humans = [
+        DigitalHuman(user_id=test_user.id, name=f"Human {i}", is_active=True)
+        for i in range(3)
+    ]
+    session.add_all(humans)
+    session.commit()
+    ids = [dh.id for dh in humans]
+
+    try:
+        response = client.get(
+            "/api/v1/digital-human/list",
+            params={"limit": 2, "offset": 1},
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert [dh["id"] for dh in data["digital_humans"]] == [ids[1], ids[0]]
+    finally:
+        session.query(DigitalHuman).delete()
+        session.commit()
+        session.close()
+
+
+def test_list_digital_humans_invalid_limit(client, auth_token):
+    """Test rejecting an out-of-range page size."""
+    response = client.get(
+        "/api/v1/digital-human/list",
+        params={"limit": 0},
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    assert response.status_code == 422
+
+
 def test_get_digital_human(client, auth_token, test_digital_human):
     """Test getting digital human details."""
     response = client.get(
@@ -463,25 +639,300 @@ def test_generate_video_exception_handling(test_db, test_user, test_digital_huma
     assert "Test error" in response.json()["detail"]
 
 
-def test_get_db_session():
+async def test_get_db_session():
     """Test get_db_session dependency function."""
-    from src.api.digital_human import get_db_session
+    from src.api.digital_human import get_db_session, set_db_manager
+    from src.models.base import DatabaseManager
 
-    # This will test the actual function, not the override
-    gen = get_db_session()
-    session = next(gen)
-    assert session is not None
-    # Clean up
+    set_db_manager(DatabaseManager("sqlite:///:memory:"))
     try:
-        next(gen)
-    except StopIteration:
-        pass
+        # This will test the actual function, not the override
+        gen = get_db_session()
+        session = await gen.__anext__()
+        assert session is not None
+        # Clean up
+        with pytest.raises(StopAsyncIteration):
+            await gen.__anext__()
+    finally:
+        set_db_manager(None)
+
+
+async def test_get_db_session_not_configured():
+    """Test get_db_session when database manager is not configured."""
+    from src.api.digital_human import get_db_session, set_db_manager
+
+    set_db_manager(None)
+
+    with pytest.raises(RuntimeError, match="Database manager not configured"):
+        await get_db_session().__anext__()
 
 
 def test_get_video_generator_dependency():
     """Test get_video_generator dependency function."""
     from src.api.digital_human import get_video_generator
 
+    get_video_generator.cache_clear()
     generator = get_video_generator()
     assert generator is not None
     assert isinstance(generator, VideoGenerator)
+    assert get_video_generator() is generator
+
+
+@pytest.mark.asyncio
+async def test_save_upload_streams_to_disk(tmp_path):
+    """Test save_upload copies the whole upload to a content-addressed path."""
+    import hashlib
+    from fastapi import UploadFile
+    from src.api.digital_human import save_upload, UPLOAD_CHUNK_SIZE
+
+    payload = b"x" * (UPLOAD_CHUNK_SIZE * 2 + 17)
+    upload = UploadFile(file=BytesIO(payload), filename="big.jpg")
+
+    destination = await save_upload(upload, tmp_path, ".jpg")
+
+    assert destination == tmp_path / f"{hashlib.blake2b(payload, digest_size=16).hexdigest()}.jpg"
+    assert destination.read_bytes() == payload
+    assert list(tmp_path.iterdir()) == [destination]
+
+
+@pytest.mark.asyncio
+async def test_save_upload_deduplicates(tmp_path):
+    """Test uploading identical content twice stores one file."""
+    from fastapi import UploadFile
+    from src.api.digital_human import save_upload
+
+    first = await save_upload(UploadFile(file=BytesIO(b"same"), filename="a.png"), tmp_path, ".png")
+    second = await save_upload(UploadFile(file=BytesIO(b"same"), filename="b.png"), tmp_path, ".png")
+
+    assert first == second
+    assert list(tmp_path.iterdir()) == [first]
+
+
+def test_upload_suffix():
+    """Test upload extensions come from the allowlist or a safe filename suffix."""
+    from fastapi import UploadFile
+    from starlette.datastructures import Headers
+    from src.api.digital_human import _upload_suffix, AUDIO_SUFFIXES
+
+    def make_upload(filename, content_type):
+        return UploadFile(
+            file=BytesIO(b""), filename=filename,
+            headers=Headers({"content-type": content_type})
+        )
+
+    assert _upload_suffix(make_upload("voice", "audio/mpeg"), AUDIO_SUFFIXES) == ".mp3"
+    assert _upload_suffix(make_upload("voice.M4A", "application/octet-stream"), AUDIO_SUFFIXES) == ".m4a"
+    assert _upload_suffix(make_upload("voice.w/../x", "application/octet-stream"), AUDIO_SUFFIXES) == ""
+
+
+def test_delete_digital_human_keeps_shared_image(client, auth_token, test_engine, test_user, tmp_path):
+    """Test deleting one digital human keeps an image another one still uses."""
+    image_path = tmp_path / "shared.jpg"
+    image_path.write_bytes(b"fake image")
+
+    session = sessionmaker(bind=test_engine)()
+    first = DigitalHuman(user_id=test_user.id, name="First", image_path=str(image_path), is_active=True)
+    second = DigitalHuman(user_id=test_user.id, name="Second", image_path=str(image_path), is_active=True)
+    session.add_all([first, second])
+    session.commit()
+    first_id, second_id = first.id, second.id
+    session.close()
+
+    response = client.delete(
+        f"/api/v1/digital-human/{first_id}",
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    assert response.status_code == 200
+    assert image_path.exists()
+
+    session = sessionmaker(bind=test_engine)()
+    session.delete(session.get(DigitalHuman, second_id))
+    session.commit()
+    session.close()
+
+
+@pytest.fixture
+def job_db_manager(test_engine):
+    """Point background generation jobs at the test database."""
+    from src.api.digital_human import set_db_manager
+
+    db_manager = DatabaseManager("sqlite:///:memory:")
+    db_manager.engine = test_engine
+    db_manager.SessionLocal = sessionmaker(bind=test_engine)
+    set_db_manager(db_manager)
+    yield db_manager
+    set_db_manager(None)
+
+
+def test_generate_job_lifecycle(client, auth_token, test_digital_human, job_db_manager, tmp_path):
+    """Test submitting a generation job, polling it and downloading the result."""
+    video_file = tmp_path / "video.mp4"
+    video_file.write_bytes(b"fake video")
+    mock_gen = Mock()
+    mock_gen.generate_from_text = Mock(return_value=str(video_file))
+    client.app.dependency_overrides[get_video_generator] = lambda: mock_gen
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    response = client.post(
+        "/api/v1/digital-human/generate/jobs",
+        headers=headers,
+        data={
+            "digital_human_id": test_digital_human.id,
+            "text": "Hello world",
+            "mode": "lipsync"
+        }
+    )
+
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    status_response = client.get(f"/api/v1/digital-human/generate/jobs/{job_id}", headers=headers)
+    assert status_response.status_code == 200
+    assert status_response.json()["status"] == "completed"
+    assert status_response.json()["video_path"] == str(video_file)
+
+    result_response = client.get(f"/api/v1/digital-human/generate/jobs/{job_id}/result", headers=headers)
+    assert result_response.status_code == 200
+    assert result_response.content == b"fake video"
+
+    session = job_db_manager.get_session()
+    assert session.get(DigitalHuman, test_digital_human.id).video_path == str(video_file)
+    session.close()
+
+
+def test_generate_job_failure(client, auth_token, test_digital_human, job_db_manager):
+    """Test a failing generation job is reported as failed."""
+    mock_gen = Mock()
+    mock_gen.generate_from_text = Mock(side_effect=Exception("Test error"))
+    client.app.dependency_overrides[get_video_generator] = lambda: mock_gen
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    response = client.post(
+        "/api/v1/digital-human/generate/jobs",
+        headers=headers,
+        data={"digital_human_id": test_digital_human.id, "text": "Hello world"}
+    )
+    job_id = response.json()["job_id"]
+
+    status_response = client.get(f"/api/v1/digital-human/generate/jobs/{job_id}", headers=headers)
+    assert status_response.json()["status"] == "failed"
+    assert "Test error" in status_response.json()["error"]
+
+    result_response = client.get(f"/api/v1/digital-human/generate/jobs/{job_id}/result", headers=headers)
+    assert result_response.status_code == 409
+
+
+def test_register_job_evicts_finished_jobs():
+    """Test a full registry drops its oldest finished job to make room."""
+    from src.api import digital_human
+
+    with patch.object(digital_human, "MAX_TRACKED_JOBS", 2), \
+            patch.dict(digital_human._generation_jobs, clear=True):
+        digital_human._register_job({"job_id": "done", "status": "completed"})
+        digital_human._register_job({"job_id": "busy", "status": "running"})
+        digital_human._register_job({"job_id": "new", "status": "pending"})
+
+        assert list(digital_human._generation_jobs) == ["busy", "new"]
+
+
+def test_register_job_rejects_when_all_active():
+    """Test the job cap holds when no tracked job can be evicted."""
+    from fastapi import HTTPException
+    from src.api import digital_human
+
+    with patch.object(digital_human, "MAX_TRACKED_JOBS", 2), \
+            patch.dict(digital_human._generation_jobs, clear=True):
+        digital_human._register_job({"job_id": "a", "status": "pending"})
+        digital_human._register_job({"job_id": "b", "status": "running"})
+
+        with pytest.raises(HTTPException) as exc_info:
+            digital_human._register_job({"job_id": "c", "status": "pending"})
+
+        assert exc_info.value.status_code == 503
+        assert list(digital_human._generation_jobs) == ["a", "b"]
+
+
+def test_generate_job_rejected_when_registry_full(
+    client, auth_token, test_digital_human, job_db_manager, tmp_path, monkeypatch
+):
+    """Test a refused job leaves the identical audio of an active job in place."""
+    from src.api import digital_human
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(digital_human, "MAX_TRACKED_JOBS", 1)
+    monkeypatch.setattr(digital_human, "_generation_jobs", {})
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    def submit():
+        return client.post(
+            "/api/v1/digital-human/generate/jobs",
+            headers=headers,
+            data={"digital_human_id": test_digital_human.id, "mode": "lipsync"},
+            files={"audio": ("speech.wav", BytesIO(b"fake audio"), "audio/wav")}
+        )
+
+    job_id = submit().json()["job_id"]
+    # Still generating as far as the registry is concerned
+    digital_human._generation_jobs[job_id]["status"] = "running"
+    audio_files = list((tmp_path / "uploads" / "audio").iterdir())
+
+    response = submit()
+
+    assert response.status_code == 503
+    assert list(digital_human._generation_jobs) == [job_id]
+    assert len(audio_files) == 1
+    assert list((tmp_path / "uploads" / "audio").iterdir()) == audio_files
+
+
+def test_generate_jobs_write_separate_outputs(
+    client, auth_token, test_digital_human, job_db_manager, tmp_path, monkeypatch
+):
+    """Test jobs for the same digital human and mode do not share an output file."""
+    def generate_from_text(text, output_path, **kwargs):
+        Path(output_path).write_text(text)
+        return output_path
+
+    monkeypatch.chdir(tmp_path)
+
+    mock_gen = Mock()
+    mock_gen.generate_from_text = Mock(side_effect=generate_from_text)
+    client.app.dependency_overrides[get_video_generator] = lambda: mock_gen
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    job_ids = []
+    for text in ("first", "second"):
+        response = client.post(
+            "/api/v1/digital-human/generate/jobs",
+            headers=headers,
+            data={"digital_human_id": test_digital_human.id, "text": text, "mode": "lipsync"}
+        )
+        job_ids.append(response.json()["job_id"])
+
+    calls = mock_gen.generate_from_text.call_args_list
+    output_paths = {call.kwargs["output_path"] for call in calls}
+    assert len(output_paths) == 2
+    for job_id, text in zip(job_ids, ("first", "second")):
+        result = client.get(f"/api/v1/digital-human/generate/jobs/{job_id}/result", headers=headers)
+        assert result.content == text.encode()
+
+
+def test_generate_job_invalid_request(client, auth_token, test_digital_human):
+    """Test job submission validates input before queueing."""
+    response = client.post(
+        "/api/v1/digital-human/generate/jobs",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        data={"digital_human_id": test_digital_human.id}
+    )
+
+    assert response.status_code == 400
+
+
+def test_get_generate_job_not_found(client, auth_token):
+    """Test polling an unknown job."""
+    response = client.get(
+        "/api/v1/digital-human/generate/jobs/unknown",
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    assert response.status_code == 404
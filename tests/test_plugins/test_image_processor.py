@@ -407,3 +407,31 @@ class TestImageProcessor:
         assert result == str(output_path)
         assert Path(output_path).exists()
 
+    def test_save_jpeg_with_simplejpeg(self, plugin, test_image, tmp_path):
+        """Test JPEG output goes through simplejpeg when it is installed"""
+        from unittest.mock import MagicMock, patch
+
+        fake_simplejpeg = MagicMock()
+        fake_simplejpeg.encode_jpeg.return_value = b"jpeg-bytes"
+        output_path = tmp_path / "resized.jpg"
+
+        with patch("src.plugins.image_processor.simplejpeg", fake_simplejpeg):
+            plugin.resize(test_image, str(output_path), (50, 50))
+
+        assert output_path.read_bytes() == b"jpeg-bytes"
+        pixels = fake_simplejpeg.encode_jpeg.call_args.args[0]
+        assert pixels.shape == (50, 50, 3)
+        assert fake_simplejpeg.encode_jpeg.call_args.kwargs["colorspace"] == "RGB"
+
+    def test_save_jpeg_falls_back_to_pillow(self, plugin, test_image, tmp_path):
+        """Test JPEG output uses Pillow when simplejpeg is unavailable"""
+        from unittest.mock import patch
+
+        output_path = tmp_path / "resized.jpg"
+
+        with patch("src.plugins.image_processor.simplejpeg", None):
+            plugin.resize(test_image, str(output_path), (50, 50))
+
+        with Image.open(output_path) as img:
+            assert img.format == "JPEG"
+            assert img.size == (50, 50)
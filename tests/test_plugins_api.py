@@ -43,6 +43,7 @@ def mock_plugin_manager(mock_plugin):
     """Create mock plugin manager."""
     manager = Mock(spec=PluginManager)
     manager.list_plugins = Mock(return_value=["test_plugin"])
+    manager.iter_plugins = Mock(return_value=[mock_plugin])
     manager.get_plugin = Mock(return_value=mock_plugin)
     manager.load_plugin = Mock(return_value=mock_plugin)
     manager.reload_plugin = Mock(return_value=True)
@@ -85,7 +86,7 @@ def test_list_plugins(client, auth_token):
 
 def test_list_plugins_empty(client, auth_token, mock_plugin_manager):
     """Test listing plugins when none are loaded."""
-    mock_plugin_manager.list_plugins.return_value = []
+    mock_plugin_manager.iter_plugins.return_value = []
 
     response = client.get(
         "/api/v1/plugins/list",
@@ -197,10 +198,14 @@ def test_reload_plugin_failed(client, auth_token, mock_plugin_manager):
     assert "Failed to reload" in response.json()["detail"]
 
 
-def test_get_plugin_manager_dependency():
-    """Test get_plugin_manager dependency function."""
+@pytest.mark.asyncio
+async def test_get_plugin_manager_dependency():
+    """Test get_plugin_manager returns the app's shared instance."""
     from src.api.plugins import get_plugin_manager
 
-    manager = get_plugin_manager()
-    assert manager is not None
+    app = create_app()
+    request = Mock(app=app)
+
+    manager = await get_plugin_manager(request)
     assert isinstance(manager, PluginManager)
+    assert await get_plugin_manager(request) is manager
@@ -6,6 +6,7 @@ from datetime import datetime
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
 
 from src.api.main import create_app
 from src.models.task import Task, TaskStatus, TaskType
@@ -63,9 +64,13 @@ def mock_db_session(sample_task):
     filter_mock.filter.return_value = filter_mock
     filter_mock.order_by.return_value = order_by_mock
     filter_mock.first.return_value = sample_task
-    order_by_mock.all.return_value = [sample_task]
+    filter_mock.with_entities.return_value.scalar.return_value = 1
+    filter_mock.with_entities.return_value.order_by.return_value = order_by_mock
+    order_by_mock.limit.return_value.offset.return_value.all.return_value = [sample_task]
 
     session.query.return_value = query_mock
+    session.execute.return_value.scalar_one_or_none.return_value = sample_task
+    session.execute.return_value.one.return_value = sample_task
     session.add = Mock()
     session.commit = Mock()
     session.refresh = Mock()
@@ -96,13 +101,6 @@ def client(mock_user, mock_db_session):
 
 def test_create_task(client, auth_token, mock_db_session, sample_task):
     """Test creating a new task."""
-    def mock_refresh(task):
-        task.id = 1
-        task.created_at = datetime.now()
-        task.updated_at = datetime.now()
-
-    mock_db_session.refresh.side_effect = mock_refresh
-
     response = client.post(
         "/api/v1/scheduler/create",
         json={
@@ -166,6 +164,41 @@ def test_list_tasks(client, auth_token):
     assert "total" in data
     assert data["total"] == 1
     assert len(data["tasks"]) == 1
+    assert data["tasks"][0]["name"] == "Test Task"
+    assert data["tasks"][0]["params"] == {"key": "value"}
+
+
+def test_scheduler_uses_orjson_when_available():
+    """Test the scheduler router renders responses with orjson when it is installed."""
+    pytest.importorskip("orjson")
+    from fastapi.responses import ORJSONResponse
+    from src.api import scheduler
+
+    assert scheduler.router.default_response_class is ORJSONResponse
+
+
+def test_list_tasks_paginated(client, auth_token, mock_db_session):
+    """Test listing tasks with limit and offset."""
+    response = client.get(
+        "/api/v1/scheduler/list?limit=10&offset=20",
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    assert response.status_code == 200
+    filter_mock = mock_db_session.query.return_value.filter.return_value
+    order_by_mock = filter_mock.with_entities.return_value.order_by.return_value
+    order_by_mock.limit.assert_called_once_with(10)
+    order_by_mock.limit.return_value.offset.assert_called_once_with(20)
+
+
+def test_list_tasks_invalid_limit(client, auth_token):
+    """Test listing tasks with an out-of-range limit."""
+    response = client.get(
+        "/api/v1/scheduler/list?limit=0",
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    assert response.status_code == 422
 
 
 def test_list_tasks_with_status_filter(client, auth_token):
@@ -261,11 +294,7 @@ def test_update_task(client, auth_token, mock_db_session, sample_task):
 
 def test_update_task_not_found(client, auth_token, mock_db_session):
     """Test updating a non-existent task."""
-    query_mock = Mock()
-    filter_mock = Mock()
-    query_mock.filter.return_value = filter_mock
-    filter_mock.first.return_value = None
-    mock_db_session.query.return_value = query_mock
+    mock_db_session.execute.return_value.scalar_one_or_none.return_value = None
 
     response = client.put(
         "/api/v1/scheduler/999",
@@ -278,6 +307,126 @@ def test_update_task_not_found(client, auth_token, mock_db_session):
     assert response.status_code == 404
 
 
+@pytest.fixture
+def sqlite_engine(mock_user):
+    """Create an in-memory database holding one task for the mock user."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from src.models.base import Base
+    from src.models.user import User
+
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(User(id=mock_user.id, username="testuser", email="t@example.com", password_hash="x"))
+    session.add(Task(id=1, user_id=mock_user.id, name="Old", task_type=TaskType.CUSTOM.value))
+    session.commit()
+    session.close()
+    return engine
+
+
+@pytest.fixture
+def sqlite_client(mock_user, sqlite_engine):
+    """Create test client backed by the in-memory database."""
+    from sqlalchemy.orm import sessionmaker
+    from src.api import scheduler
+    from src.models import base
+
+    TestingSessionLocal = sessionmaker(bind=sqlite_engine)
+    app = create_app()
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[scheduler.get_current_user] = lambda: mock_user
+    app.dependency_overrides[base.get_db] = override_get_db
+    return TestClient(app)
+
+
+def test_create_task_in_database(sqlite_client, sqlite_engine):
+    """Test creating a task against a real database with one INSERT ... RETURNING."""
+    from sqlalchemy import event
+
+    statements = []
+    event.listen(sqlite_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    response = sqlite_client.post(
+        "/api/v1/scheduler/create",
+        json={"name": "Created", "task_type": "custom", "params": {"key": "value"}}
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["id"] == 2
+    assert data["status"] == "pending"
+    assert data["params"] == {"key": "value"}
+    assert data["created_at"] is not None
+    assert len(statements) == 1
+    assert statements[0].startswith("INSERT INTO tasks")
+
+
+def test_list_and_get_task_from_database(sqlite_client):
+    """Test reading tasks through column projections against a real database."""
+    response = sqlite_client.get("/api/v1/scheduler/list")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["tasks"][0]["name"] == "Old"
+    assert data["tasks"][0]["status"] == "pending"
+
+    response = sqlite_client.get("/api/v1/scheduler/1")
+
+    assert response.status_code == 200
+    assert response.json()["task_type"] == "custom"
+
+
+def test_update_task_single_statement(sqlite_client, sqlite_engine):
+    """Test updating a task against a real database with one UPDATE ... RETURNING."""
+    from sqlalchemy import event
+
+    statements = []
+    event.listen(sqlite_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    response = sqlite_client.put(
+        "/api/v1/scheduler/1",
+        json={"name": "New", "status": "running"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "New"
+    assert response.json()["status"] == "running"
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE tasks")
+
+
+def test_delete_task_single_statement(sqlite_client, sqlite_engine):
+    """Test deleting a task against a real database with one DELETE."""
+    from sqlalchemy import event
+
+    statements = []
+    event.listen(sqlite_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    response = sqlite_client.delete("/api/v1/scheduler/1")
+
+    assert response.status_code == 204
+    assert len(statements) == 1
+    assert statements[0].startswith("DELETE FROM tasks")
+
+    response = sqlite_client.delete("/api/v1/scheduler/1")
+
+    assert response.status_code == 404
+
+
 def test_update_task_invalid_status(client, auth_token):
     """Test updating a task with invalid status."""
     response = client.put(
@@ -304,11 +453,7 @@ def test_delete_task(client, auth_token):
 
 def test_delete_task_not_found(client, auth_token, mock_db_session):
     """Test deleting a non-existent task."""
-    query_mock = Mock()
-    filter_mock = Mock()
-    query_mock.filter.return_value = filter_mock
-    filter_mock.first.return_value = None
-    mock_db_session.query.return_value = query_mock
+    mock_db_session.execute.return_value.rowcount = 0
 
     response = client.delete(
         "/api/v1/scheduler/999",
@@ -320,7 +465,7 @@ def test_delete_task_not_found(client, auth_token, mock_db_session):
 
 def test_create_task_exception(client, auth_token, mock_db_session):
     """Test creating a task with exception."""
-    mock_db_session.commit.side_effect = Exception("Database error")
+    mock_db_session.commit.side_effect = SQLAlchemyError("Database error")
 
     response = client.post(
         "/api/v1/scheduler/create",
@@ -335,9 +480,25 @@ def test_create_task_exception(client, auth_token, mock_db_session):
     assert "Failed to create task" in response.json()["detail"]
 
 
+def test_create_task_invalid_type_skips_db(client, auth_token, mock_db_session):
+    """Test task type validation runs before touching the database."""
+    response = client.post(
+        "/api/v1/scheduler/create",
+        json={
+            "name": "Test Task",
+            "task_type": "not_a_type",
+        },
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    assert response.status_code == 400
+    mock_db_session.execute.assert_not_called()
+    mock_db_session.rollback.assert_not_called()
+
+
 def test_list_tasks_exception(client, auth_token, mock_db_session):
     """Test listing tasks with exception."""
-    mock_db_session.query.side_effect = Exception("Database error")
+    mock_db_session.query.side_effect = SQLAlchemyError("Database error")
 
     response = client.get(
         "/api/v1/scheduler/list",
@@ -350,7 +511,7 @@ def test_list_tasks_exception(client, auth_token, mock_db_session):
 
 def test_update_task_exception(client, auth_token, mock_db_session, sample_task):
     """Test updating a task with exception."""
-    mock_db_session.commit.side_effect = Exception("Database error")
+    mock_db_session.commit.side_effect = SQLAlchemyError("Database error")
 
     response = client.put(
         "/api/v1/scheduler/1",
@@ -143,6 +143,12 @@ class TestSchedulerMonitorAPI:
         assert response.status_code == 400
         assert "Invalid filter value" in response.json()["detail"]
 
+        response = client.get("/api/v1/scheduler/monitor/history?status=invalid_status")
+
+        assert response.status_code == 400
+        assert "Invalid filter value" in response.json()["detail"]
+        mock_monitor.get_task_history.assert_not_called()
+
         app.dependency_overrides.clear()
 
     def test_get_recent_failures(self, app, client, mock_current_user, mock_monitor):
@@ -241,3 +247,82 @@ class TestSchedulerMonitorAPI:
         assert "Failed to get task statistics" in response.json()["detail"]
 
         app.dependency_overrides.clear()
+
+    def test_run_monitor_batch(self, app, client, mock_current_user, mock_monitor):
+        """Test POST /api/v1/scheduler/monitor/batch endpoint."""
+        from src.api import scheduler_monitor
+
+        app.dependency_overrides[scheduler_monitor.get_current_user] = lambda: mock_current_user
+        app.dependency_overrides[scheduler_monitor.get_task_monitor] = lambda: mock_monitor
+
+        mock_monitor.get_queue_status.return_value = {
+            "pending": 2,
+            "running": 1,
+            "pending_by_type": {"custom": 2},
+        }
+        mock_monitor.get_task_history.return_value = []
+        mock_monitor.get_performance_metrics.return_value = {
+            "total_tasks": 3,
+            "avg_duration_seconds": 1.5,
+            "success_rate": 100.0,
+            "tasks_per_day": 0.4,
+        }
+
+        response = client.post(
+            "/api/v1/scheduler/monitor/batch",
+            json={
+                "calls": [
+                    {"name": "queue"},
+                    {"name": "history", "params": {"status": "failed", "limit": 5}},
+                    {"name": "performance", "params": {"days": 30}},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert results[0]["pending"] == 2
+        assert results[1] == {"tasks": [], "total": 0, "limit": 5, "offset": 0}
+        assert results[2]["total_tasks"] == 3
+        mock_monitor.get_task_history.assert_called_once_with(
+            user_id=1, task_type=None, status=TaskStatus.FAILED, limit=5, offset=0
+        )
+        mock_monitor.get_performance_metrics.assert_called_once_with(user_id=1, days=30)
+
+        app.dependency_overrides.clear()
+
+    def test_run_monitor_batch_invalid_params(self, app, client, mock_current_user, mock_monitor):
+        """Test monitor batch rejects parameters an endpoint does not accept."""
+        from src.api import scheduler_monitor
+
+        app.dependency_overrides[scheduler_monitor.get_current_user] = lambda: mock_current_user
+        app.dependency_overrides[scheduler_monitor.get_task_monitor] = lambda: mock_monitor
+
+        response = client.post(
+            "/api/v1/scheduler/monitor/batch",
+            json={"calls": [{"name": "stats"}, {"name": "failures", "params": {"hours": 500}}]},
+        )
+
+        assert response.status_code == 400
+        assert "Invalid params for failures" in response.json()["detail"]
+        mock_monitor.get_task_stats.assert_not_called()
+
+        app.dependency_overrides.clear()
+
+    def test_run_monitor_batch_error(self, app, client, mock_current_user, mock_monitor):
+        """Test monitor batch error handling."""
+        from src.api import scheduler_monitor
+
+        app.dependency_overrides[scheduler_monitor.get_current_user] = lambda: mock_current_user
+        app.dependency_overrides[scheduler_monitor.get_task_monitor] = lambda: mock_monitor
+
+        mock_monitor.get_task_stats.side_effect = Exception("Database error")
+
+        response = client.post(
+            "/api/v1/scheduler/monitor/batch", json={"calls": [{"name": "stats"}]}
+        )
+
+        assert response.status_code == 500
+        assert "Failed to run monitor batch" in response.json()["detail"]
+
+        app.dependency_overrides.clear()
@@ -301,6 +301,36 @@ class TestTaskMonitor:
         assert "pending_by_type" in status
         session.close.assert_called_once()
 
+    def test_get_task_stats_cached(self, task_monitor):
+        """Test task stats are reused within the cache TTL."""
+        with patch.object(task_monitor, "_query_task_stats", return_value={"total": 1}) as query:
+            assert task_monitor.get_task_stats(user_id=1) == {"total": 1}
+            assert task_monitor.get_task_stats(user_id=1) == {"total": 1}
+            task_monitor.get_task_stats(user_id=2)
+
+        assert query.call_count == 2
+
+    def test_get_queue_status_cache_expires(self, task_monitor):
+        """Test queue status is queried again once the cache TTL has passed."""
+        with patch.object(task_monitor, "_query_queue_status", return_value={"pending": 0}) as query, \
+                patch("src.scheduler.monitor.time.monotonic", side_effect=[100.0, 101.0, 103.0]):
+            task_monitor.get_queue_status()
+            task_monitor.get_queue_status()
+            task_monitor.get_queue_status()
+
+        assert query.call_count == 2
+
+    def test_cache_disabled(self, mock_db_manager):
+        """Test a zero TTL disables caching."""
+        db_manager, _ = mock_db_manager
+        monitor = TaskMonitor(db_manager, cache_ttl=0)
+
+        with patch.object(monitor, "_query_queue_status", return_value={"pending": 0}) as query:
+            monitor.get_queue_status()
+            monitor.get_queue_status()
+
+        assert query.call_count == 2
+
     def test_calculate_duration(self, task_monitor):
         """Test calculating task duration."""
         now = datetime.utcnow()
@@ -331,5 +361,12 @@ class TestTaskMonitor:
     @patch("src.scheduler.monitor.DatabaseManager")
     def test_get_task_monitor(self, mock_db_class):
         """Test get_task_monitor function."""
-        monitor = get_task_monitor()
-        assert isinstance(monitor, TaskMonitor)
+        get_task_monitor.cache_clear()
+        try:
+            monitor = get_task_monitor()
+            assert isinstance(monitor, TaskMonitor)
+            # Cached, so the engine is only built once
+            assert get_task_monitor() is monitor
+            mock_db_class.assert_called_once()
+        finally:
+            get_task_monitor.cache_clear()
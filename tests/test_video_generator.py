@@ -226,6 +226,22 @@ class TestVideoGeneratorFromAudio:
         assert os.path.exists(result_path)
         assert result_path.endswith(".mp4")
 
+    def test_generate_from_audio_mode_override(self, sample_image, sample_audio, model_checkpoint, temp_dir):
+        """Test per-call mode overrides the instance mode without mutating it."""
+        generator = VideoGenerator(
+            mode=GenerationMode.ENHANCED_LIPSYNC,
+            wav2lip_config={"model_path": model_checkpoint},
+            gfpgan_config={"model_path": model_checkpoint},
+        )
+
+        output_path = os.path.join(temp_dir, "output.mp4")
+        result_path = generator.generate_from_audio(
+            sample_image, sample_audio, output_path, mode=GenerationMode.LIPSYNC
+        )
+
+        assert os.path.exists(result_path)
+        assert generator.mode == GenerationMode.ENHANCED_LIPSYNC
+
     def test_generate_from_audio_unsupported_mode(self, sample_image, sample_audio):
         """Test audio generation with unsupported mode (should never happen)."""
         generator = VideoGenerator()
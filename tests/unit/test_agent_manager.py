@@ -23,7 +23,23 @@ def test_agent_init() -> None:
     assert agent.name == "test-agent"
     assert agent.system_prompt == "You are a test agent"
     assert agent.capabilities == ["test", "demo"]
-    assert agent._memory == []
+    assert agent.memory == []
+
+
+def test_agent_memory_columns() -> None:
+    """Test Agent memory round-trips through its columnar storage"""
+    agent = Agent(name="test-agent", system_prompt="You are a test agent")
+
+    agent.remember("user", "hello", timestamp=1.0)
+    agent.remember("assistant", "hi", timestamp=2.0)
+    agent.remember("user", "bye", timestamp=3.0)
+
+    assert agent.memory == [
+        {"role": "user", "content": "hello", "timestamp": 1.0},
+        {"role": "assistant", "content": "hi", "timestamp": 2.0},
+        {"role": "user", "content": "bye", "timestamp": 3.0},
+    ]
+    assert agent.messages_by_role("user") == ["hello", "bye"]
 
 
 def test_agent_init_without_capabilities() -> None:
@@ -316,3 +332,62 @@ def test_agent_manager_list_agents() -> None:
     assert "agent2" in agents
     assert "agent3" in agents
 
+
+def test_agent_manager_create_agents_bulk() -> None:
+    """Test creating several agents at once"""
+    am = AgentManager()
+
+    agents = am.create_agents_bulk([
+        {"name": "agent1", "system_prompt": "Prompt 1"},
+        {"name": "agent2", "system_prompt": "Prompt 2", "capabilities": ["chat"]},
+    ])
+
+    assert [a.name for a in agents] == ["agent1", "agent2"]
+    assert am.get_agent("agent2").capabilities == ["chat"]
+
+
+def test_agent_manager_create_agents_bulk_is_atomic() -> None:
+    """Test bulk creation creates nothing when a name conflicts"""
+    am = AgentManager()
+    am.create_agent("agent1", "Prompt 1")
+
+    with pytest.raises(ValueError, match="already exist"):
+        am.create_agents_bulk([
+            {"name": "agent2", "system_prompt": "Prompt 2"},
+            {"name": "agent1", "system_prompt": "Prompt 1"},
+        ])
+
+    with pytest.raises(ValueError, match="Duplicate"):
+        am.create_agents_bulk([
+            {"name": "agent3", "system_prompt": "Prompt"},
+            {"name": "agent3", "system_prompt": "Prompt"},
+        ])
+
+    assert am.list_agents() == ["agent1"]
+
+
+def test_agent_manager_delete_agents_bulk() -> None:
+    """Test deleting several agents at once"""
+    am = AgentManager()
+    am.create_agent("agent1", "Prompt 1")
+    am.create_agent("agent2", "Prompt 2")
+
+    deleted = am.delete_agents_bulk(["agent1", "missing"])
+
+    assert deleted == ["agent1"]
+    assert am.list_agents() == ["agent2"]
+
+
+def test_agent_manager_list_agents_full() -> None:
+    """Test listing agents with details"""
+    am = AgentManager()
+
+    assert am.list_agents_full() == []
+
+    agent1 = am.create_agent("agent1", "Prompt 1")
+    agent2 = am.create_agent("agent2", "Prompt 2", ["chat"])
+
+    agents = am.list_agents_full()
+
+    assert agents == [agent1, agent2]
+
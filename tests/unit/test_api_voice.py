@@ -76,6 +76,16 @@ class TestVoiceSynthesizeEndpoint:
             speaker_wav=None
         )
 
+    def test_synthesize_estimates_duration_per_word(self, client, mock_synthesizer):
+        """Test the duration estimate counts words separated by any whitespace."""
+        response = client.post(
+            "/api/v1/voice/synthesize",
+            json={"text": "  Hello   world\nagain\t"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["duration"] == 1.5
+
     def test_synthesize_with_speaker_wav(self, client, mock_synthesizer):
         """Test synthesis with speaker audio."""
         response = client.post(
@@ -120,6 +130,18 @@ class TestVoiceSynthesizeEndpoint:
 
         assert response.status_code == 422  # Validation error
 
+    def test_synthesize_unknown_field(self, client):
+        """Test synthesis rejects unknown request fields."""
+        response = client.post(
+            "/api/v1/voice/synthesize",
+            json={
+                "text": "Hello world",
+                "speed": 2
+            }
+        )
+
+        assert response.status_code == 422  # Validation error
+
     def test_synthesize_empty_text(self, client):
         """Test synthesis with empty text."""
         response = client.post(
@@ -165,6 +187,41 @@ class TestVoiceSynthesizeEndpoint:
         assert response.status_code == 500
         assert "Synthesis failed" in response.json()["detail"]
 
+    def test_synthesizer_reused_across_requests(self, client):
+        """Test the synthesizer is constructed once for repeated requests."""
+        from src.api.dependencies import get_voice_synthesizer
+        get_voice_synthesizer.cache_clear()
+
+        with patch("src.api.dependencies.VoiceSynthesizer") as mock_class:
+            mock_class.return_value.synthesize.return_value = "/tmp/test_audio.wav"
+            for _ in range(3):
+                response = client.post(
+                    "/api/v1/voice/synthesize",
+                    json={"text": "Hello world", "backend": "coqui", "device": "cpu"}
+                )
+                assert response.status_code == 200
+
+        mock_class.assert_called_once()
+        assert get_voice_synthesizer.cache_info().maxsize == 8
+        get_voice_synthesizer.cache_clear()
+
+    def test_synthesize_response_is_preserialized(self, client, mock_synthesizer):
+        """Test synthesis responses are serialized directly and still documented."""
+        response = client.post(
+            "/api/v1/voice/synthesize",
+            json={"text": "Hello world"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["duration"] == 1.0
+
+        schema = client.get("/openapi.json").json()
+        response_schema = schema["paths"]["/api/v1/voice/synthesize"]["post"]["responses"]["200"]
+        assert response_schema["content"]["application/json"]["schema"]["$ref"].endswith(
+            "VoiceSynthesizeResponse"
+        )
+
 
 class TestVoiceProfileEndpoints:
     """Tests for voice profile endpoints."""
@@ -199,6 +256,9 @@ class TestVoiceProfileEndpoints:
         assert data["metadata"] == {"language": "en"}
 
         mock_cloner.create_profile.assert_called_once()
+        assert mock_cloner.create_profile.call_args.kwargs["sample_paths"] == (
+            "/path/to/sample1.wav", "/path/to/sample2.wav"
+        )
         mock_cloner.save_profile.assert_called_once_with(profile)
 
     def test_create_profile_value_error(self, client, mock_cloner):
@@ -308,6 +368,15 @@ class TestVoiceProfileEndpoints:
         assert "deleted successfully" in response.json()["message"]
         mock_cloner.delete_profile.assert_called_once_with("test_profile")
 
+    def test_delete_profile_escapes_name(self, client, mock_cloner):
+        """Test the deletion message stays valid JSON for names with quotes."""
+        mock_cloner.delete_profile.return_value = True
+
+        response = client.delete("/api/v1/voice/profiles/my%22voice%5C")
+
+        assert response.status_code == 200
+        assert response.json() == {"message": "Profile 'my\"voice\\' deleted successfully"}
+
     def test_delete_profile_not_found(self, client, mock_cloner):
         """Test deleting non-existent profile."""
         mock_cloner.delete_profile.return_value = False
@@ -347,3 +416,40 @@ class TestRootEndpoints:
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
+
+    def test_cors_allows_configured_origin(self, monkeypatch):
+        """Test CORS preflight for an origin listed in CORS_ORIGINS."""
+        from src.api.main import create_app
+
+        monkeypatch.setenv("CORS_ORIGINS", "https://app.example.com, https://admin.example.com")
+        cors_client = TestClient(create_app())
+
+        response = cors_client.options(
+            "/health",
+            headers={
+                "Origin": "https://admin.example.com",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "https://admin.example.com"
+        assert response.headers["access-control-max-age"] == "600"
+
+    def test_cors_rejects_unlisted_origin(self, monkeypatch):
+        """Test CORS preflight for an origin not listed in CORS_ORIGINS."""
+        from src.api.main import create_app
+
+        monkeypatch.setenv("CORS_ORIGINS", "https://app.example.com")
+        cors_client = TestClient(create_app())
+
+        response = cors_client.options(
+            "/health",
+            headers={
+                "Origin": "https://evil.example.com",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+
+        assert response.status_code == 400
+        assert "access-control-allow-origin" not in response.headers
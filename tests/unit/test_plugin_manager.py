@@ -89,6 +89,17 @@ def test_plugin_manager_list_plugins() -> None:
     assert pm.list_plugins() == ["mock-plugin"]
 
 
+def test_plugin_manager_iter_plugins() -> None:
+    """Test iterating over loaded plugin instances"""
+    pm = PluginManager()
+    assert list(pm.iter_plugins()) == []
+
+    plugin = MockPlugin()
+    pm.plugins["mock-plugin"] = plugin
+
+    assert list(pm.iter_plugins()) == [plugin]
+
+
 def test_plugin_manager_get_plugin() -> None:
     """Test getting a plugin"""
     pm = PluginManager()
@@ -213,6 +224,21 @@ def test_reload_plugin_success() -> None:
     assert reloaded._state == {"counter": 1}  # State should be restored
 
 
+def test_reload_plugin_executes_module_once() -> None:
+    """Test reload re-executes the plugin module exactly once"""
+    import importlib
+
+    pm = PluginManager()
+    pm.load_plugin("test_plugin")
+
+    with patch("importlib.reload", wraps=importlib.reload) as reload, \
+            patch("importlib.import_module", wraps=importlib.import_module) as import_module:
+        assert pm.reload_plugin("test_plugin") is True
+
+    assert reload.call_count == 1
+    import_module.assert_not_called()
+
+
 def test_reload_plugin_not_found() -> None:
     """Test reload when plugin not found - should load instead"""
     pm = PluginManager()
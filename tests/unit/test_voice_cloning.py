@@ -110,6 +110,21 @@ def test_validate_audio_samples_file_not_found(voice_cloner):
         )
 
 
+def test_validate_audio_samples_lists_each_directory_once(voice_cloner, temp_audio_files):
+    """Test sample existence is checked with one directory listing per directory"""
+    with patch("os.scandir", wraps=os.scandir) as mock_scandir:
+        voice_cloner.validate_audio_samples(temp_audio_files)
+
+    assert mock_scandir.call_count == len({os.path.dirname(p) for p in temp_audio_files})
+
+
+def test_validate_audio_samples_missing_in_existing_dir(voice_cloner, temp_audio_files):
+    """Test validation failure when one sample is missing from a listed directory"""
+    missing = os.path.join(os.path.dirname(temp_audio_files[0]), "missing_sample.wav")
+    with pytest.raises(ValueError, match="Sample file not found"):
+        voice_cloner.validate_audio_samples(temp_audio_files + [missing])
+
+
 def test_validate_audio_samples_unsupported_format(voice_cloner, temp_audio_files):
     """Test validation failure with unsupported format"""
     # Create a file with unsupported extension